@@ -0,0 +1,160 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from task import Task
+from task_manager import TaskManager
+from typing import Callable, Dict, List, Optional
+
+
+class AsyncTaskManager:
+    """Асинхронный интерфейс к TaskManager для работы внутри цикла событий
+    asyncio. Изменения применяются к задачам в памяти в потоке исполнителя
+    цикла событий по умолчанию: проверка данных и ожидание блокировки
+    записи не останавливают цикл. Сохранение (сериализация и запись на
+    диск) выполняется в отдельном потоке записи.
+    Изменения, сделанные, пока идет запись, накапливаются и сохраняются
+    следующей одной записью, так что при частых изменениях хранилище
+    перезаписывается не чаще, чем успевает.
+
+    Хранилище получает снятую под блокировкой копию задач, поэтому изменения
+    во время записи не мешают ей. Задача, измененная во время записи,
+    попадает в следующую.
+
+    Пример::
+
+        async with await AsyncTaskManager.open(filename='tasks.json') as tm:
+            await tm.add_task(...)
+
+    """
+    def __init__(self, manager: TaskManager, executor: Executor = None):
+        """Инициализирует асинхронный интерфейс.
+        :param manager: Менеджер задач. Он переводится в отложенный режим
+            сохранения.
+        :param executor: Исполнитель для записи. По умолчанию — один поток,
+            чтобы записи не выполнялись одновременно.
+
+        """
+        self.manager = manager
+        self.manager.deferred = True
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='task-writer')
+        self._writer: Optional[asyncio.Task] = None
+        self._failed = False
+
+    @classmethod
+    async def open(cls, executor: Executor = None,
+                   **options) -> 'AsyncTaskManager':
+        """Создает менеджер задач, загружая данные в отдельном потоке.
+        :param executor: Исполнитель для записи.
+        :param options: Параметры TaskManager.
+        :return: Объект AsyncTaskManager.
+
+        """
+        loop = asyncio.get_running_loop()
+        manager = await loop.run_in_executor(
+            executor, lambda: TaskManager(**options))
+        return cls(manager, executor)
+
+    async def __aenter__(self) -> 'AsyncTaskManager':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _schedule_write(self):
+        """Запускает фоновую запись, если она еще не выполняется."""
+        if self.manager.dirty and (self._writer is None or
+                                   self._writer.done()):
+            self._writer = asyncio.get_running_loop().create_task(
+                self._write_loop())
+
+    async def _write_loop(self):
+        """Сохраняет накопленные изменения, пока они появляются. При ошибке
+        записи изменения остаются в очереди (см. TaskManager.flush), и запись
+        прекращается до следующего изменения или вызова flush.
+
+        """
+        loop = asyncio.get_running_loop()
+        while self.manager.dirty:
+            saved = await loop.run_in_executor(self._executor,
+                                               self.manager.flush)
+            if not saved:
+                self._failed = True
+                return
+        self._failed = False
+
+    async def flush(self) -> bool:
+        """Дожидается сохранения всех сделанных изменений.
+        :return: True, если все изменения сохранены, иначе False.
+
+        """
+        self._schedule_write()
+        if self._writer is not None:
+            await self._writer
+        return not self._failed and not self.manager.dirty
+
+    async def close(self) -> bool:
+        """Сохраняет изменения и освобождает ресурсы.
+        :return: True, если все изменения сохранены, иначе False.
+
+        """
+        saved = await self.flush()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.manager.close)
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+        return saved
+
+    async def _mutate(self, method: Callable, *args, **kwargs):
+        """Выполняет изменение задач в потоке исполнителя по умолчанию и
+        планирует запись. Поток записи для этого не используется, чтобы
+        изменение не ждало окончания записи.
+        :param method: Метод TaskManager, изменяющий задачи.
+        :return: Результат метода.
+
+        """
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, partial(method, *args, **kwargs))
+        self._schedule_write()
+        return result
+
+    async def add_task(self, title: str, description: str, category: str,
+                       due_date: str, priority: str) -> bool:
+        """Добавляет задачу (см. TaskManager.add_task) и планирует запись.
+        :return: True, если задача добавлена, иначе False.
+
+        """
+        return await self._mutate(self.manager.add_task, title, description,
+                                  category, due_date, priority)
+
+    async def update_task(self, task_id: int, **fields) -> bool:
+        """Обновляет задачу (см. TaskManager.update_task) и планирует
+        запись.
+        :return: True, если задача обновлена, иначе False.
+
+        """
+        return await self._mutate(self.manager.update_task, task_id,
+                                  **fields)
+
+    async def delete_task(self, task_id: int = None,
+                          category: str = None) -> bool:
+        """Удаляет задачи (см. TaskManager.delete_task) и планирует запись.
+        :return: True, если задачи удалены, иначе False.
+
+        """
+        return await self._mutate(self.manager.delete_task, task_id,
+                                  category)
+
+    async def search_tasks(self, **filters) -> List[Task]:
+        """Ищет задачи в памяти (см. TaskManager.search_tasks). Поиск по
+        индексам не обращается к диску и выполняется в цикле событий.
+        :return: Список найденных задач.
+
+        """
+        return self.manager.search_tasks(**filters)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Возвращает метрики менеджера задач (см. TaskManager.stats)."""
+        return self.manager.stats()
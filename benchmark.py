@@ -0,0 +1,332 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from task import Task
+from task_manager import TaskManager
+from typing import Callable, Dict, List
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli.py')
+CATEGORIES = ('Работа', 'Личное', 'Учеба', 'Здоровье', 'Дом', 'Покупки',
+              'Финансы', 'Путешествия', 'Семья', 'Спорт')
+PRIORITIES = ('Низкий', 'Средний', 'Высокий')
+STATUSES = ('Не выполнена', 'Выполнена')
+WORDS = ('отчет', 'встреча', 'письмо', 'проект', 'звонок', 'документы',
+         'презентация', 'задание', 'покупка', 'оплата', 'ремонт', 'тренировка',
+         'врач', 'билеты', 'подготовка', 'проверка', 'договор', 'бюджет',
+         'планирование', 'экзамен', 'лекция', 'статья', 'уборка', 'подарок',
+         'клиент', 'сервер', 'релиз', 'обучение', 'анализ', 'черновик')
+SEARCHES = {
+    'search_id': lambda rng, count: {'task_id': rng.randint(1, count)},
+    'search_keyword': lambda rng, count: {'keyword': rng.choice(WORDS)},
+    'search_category': lambda rng, count: {'category':
+                                           rng.choice(CATEGORIES)},
+    'search_status': lambda rng, count: {'status': 'Выполнена',
+                                         'category': rng.choice(CATEGORIES)},
+    'search_due_range': lambda rng, count: {'due_after': '01.03.2025',
+                                            'due_before': '07.03.2025'},
+}
+
+
+def generate_tasks(count: int, seed: int = 0) -> List[Task]:
+    """Создает набор задач со случайным, но воспроизводимым содержимым.
+    :param count: Количество задач.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список задач с ID от 1 до count.
+
+    """
+    rng = random.Random(seed)
+    tasks = []
+    for task_id in range(1, count + 1):
+        title = ' '.join(rng.sample(WORDS, 2)).capitalize()
+        description = ' '.join(rng.choices(WORDS, k=8)).capitalize() + '.'
+        due_date = (f'{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.'
+                    f'{rng.randint(2024, 2026)}')
+        tasks.append(Task(task_id, title, description,
+                          rng.choice(CATEGORIES), due_date,
+                          rng.choice(PRIORITIES),
+                          STATUSES[rng.random() < 0.3]))
+    return tasks
+
+
+def measure(function: Callable[[], None], operations: int,
+            memory: bool = False) -> Dict[str, float]:
+    """Замеряет время выполнения и пиковое потребление памяти. Сообщения,
+    которые выводит TaskManager, отбрасываются. Память измеряется отдельным
+    повторным запуском под tracemalloc, чтобы трассировка не искажала время,
+    поэтому функция должна допускать повторный вызов.
+    :param function: Замеряемая функция.
+    :param operations: Количество операций, выполняемых функцией.
+    :param memory: Если True, измеряется пик памяти.
+    :return: Словарь с временем, пропускной способностью и пиком памяти.
+
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        peak = None
+        if memory:
+            tracemalloc.start()
+            try:
+                function()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return {'operations': operations,
+            'seconds': round(seconds, 6),
+            'ops_per_second': round(operations / max(seconds, 1e-9), 1),
+            'peak_mb': None if peak is None else round(peak / 2 ** 20, 2)}
+
+
+def mutation_count(count: int) -> int:
+    """Выбирает количество изменяющих операций так, чтобы на больших наборах
+    полная перезапись файла после каждой из них не растягивала замер.
+    :param count: Размер набора задач.
+    :return: Количество операций.
+
+    """
+    return max(3, min(100, 10 ** 5 // count))
+
+
+def run_size(count: int, directory: str, memory: bool = True,
+             seed: int = 0, **manager_options) -> Dict[str, Dict]:
+    """Замеряет операции TaskManager на наборе из count задач.
+    :param count: Размер набора задач.
+    :param directory: Каталог для временных файлов.
+    :param memory: Если True, для загрузки и сохранения измеряется пиковое
+        потребление памяти.
+    :param seed: Начальное значение генератора случайных чисел.
+    :param manager_options: Дополнительные параметры TaskManager.
+    :return: Словарь результатов по названиям операций.
+
+    """
+    rng = random.Random(seed)
+    filename = os.path.join(directory, f'tasks-{count}.json')
+    for leftover in (filename, filename + '.journal'):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = TaskManager(filename=filename, **manager_options)
+    manager.tasks = generate_tasks(count, seed)
+    manager.next_id = count + 1
+    results = {'save_data': measure(manager.save_data, count, memory)}
+
+    def load():
+        nonlocal manager
+        manager = TaskManager(filename=filename, **manager_options)
+
+    results['load_data'] = measure(load, count, memory)
+
+    mutations = mutation_count(count)
+    targets = rng.sample(range(1, count + 1), mutations)
+
+    def add():
+        for number in range(mutations):
+            manager.add_task(f'Новая задача {number}', 'Описание задачи',
+                             rng.choice(CATEGORIES), '15.06.2025',
+                             rng.choice(PRIORITIES))
+
+    def update():
+        for task_id in targets:
+            manager.update_task(task_id, status='Выполнена',
+                                priority=rng.choice(PRIORITIES))
+
+    def delete():
+        for task_id in targets:
+            manager.delete_task(task_id=task_id)
+
+    results['add_task'] = measure(add, mutations)
+    results['update_task'] = measure(update, mutations)
+    for name, make_query in SEARCHES.items():
+        queries = [make_query(rng, count) for _ in range(100)]
+        results[name] = measure(
+            lambda: [manager.search_tasks(**query) for query in queries],
+            len(queries))
+    results['delete_task'] = measure(delete, mutations)
+    manager.storage.close()
+    return results
+
+
+def cold_start(sizes: List[int], repeat: int = 3, seed: int = 0
+               ) -> Dict[str, Dict]:
+    """Замеряет время запуска команд cli.py, каждая в новом процессе, от
+    запуска интерпретатора до выхода. Для сравнения замеряются пустой запуск
+    интерпретатора и полная загрузка TaskManager, как при запуске main.py.
+    :param sizes: Размеры наборов задач.
+    :param repeat: Количество запусков каждой команды; берется лучшее время.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Время в секундах по размерам наборов и названиям команд.
+
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in sizes:
+            filename = os.path.join(directory, f'cold-{count}.json')
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = TaskManager(filename=filename)
+                manager.tasks = generate_tasks(count, seed)
+                manager.next_id = count + 1
+                manager.save_data()
+            cli = [sys.executable, CLI, '--tasks-file', filename]
+            commands = {
+                'interpreter': [sys.executable, '-c', 'pass'],
+                'full_load': [sys.executable, '-c',
+                              'from task_manager import TaskManager; '
+                              f'TaskManager(filename={filename!r})'],
+                'done': cli + ['done', str(count // 2)],
+                'search_category': cli + ['search', '--category',
+                                          CATEGORIES[0], '--limit', '10'],
+                'list': cli + ['list', '--limit', '10'],
+            }
+            results[str(count)] = {}
+            for name, command in commands.items():
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    subprocess.run(command, stdout=subprocess.DEVNULL,
+                                   cwd=os.path.dirname(CLI), check=True)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                results[str(count)][name] = round(best, 4)
+    return results
+
+
+def format_cold_start(results: Dict[str, Dict]) -> str:
+    """Форматирует результаты cold_start в виде таблицы.
+    :param results: Результаты замеров.
+    :return: Текст таблицы.
+
+    """
+    lines = [f"{'задач':>8} {'команда':<18} {'секунд':>10}"]
+    for size, commands in results.items():
+        for name, seconds in commands.items():
+            lines.append(f"{size:>8} {name:<18} {seconds:>10.4f}")
+    return '\n'.join(lines)
+
+
+def run(sizes: List[int], memory: bool = True, seed: int = 0,
+        **manager_options) -> Dict:
+    """Запускает замеры для всех размеров наборов задач.
+    :param sizes: Размеры наборов.
+    :param memory: Если True, измеряется пиковое потребление памяти.
+    :param seed: Начальное значение генератора случайных чисел.
+    :param manager_options: Дополнительные параметры TaskManager.
+    :return: Результаты вместе со сведениями об окружении.
+
+    """
+    results = {'python': platform.python_version(),
+               'platform': platform.platform(),
+               'options': manager_options,
+               'sizes': {}}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in sizes:
+            print(f"Набор из {count} задач...", file=sys.stderr)
+            results['sizes'][str(count)] = run_size(
+                count, directory, memory, seed, **manager_options)
+    return results
+
+
+def compare(results: Dict, baseline: Dict,
+            threshold: float = 0.2) -> List[str]:
+    """Сравнивает результаты с базовыми и находит регрессии.
+    :param results: Текущие результаты.
+    :param baseline: Сохраненные базовые результаты.
+    :param threshold: Допустимое относительное снижение пропускной
+        способности.
+    :return: Список описаний регрессий.
+
+    """
+    regressions = []
+    for size, operations in results['sizes'].items():
+        base_operations = baseline.get('sizes', {}).get(size, {})
+        for name, result in operations.items():
+            base = base_operations.get(name)
+            if base is None:
+                continue
+            current, previous = result['ops_per_second'], base[
+                'ops_per_second']
+            if current < previous * (1 - threshold):
+                change = (current - previous) / previous * 100
+                regressions.append(
+                    f"{size} задач, {name}: {previous} -> {current} оп/с "
+                    f"({change:+.0f}%)")
+    return regressions
+
+
+def format_results(results: Dict) -> str:
+    """Форматирует результаты в виде таблицы.
+    :param results: Результаты замеров.
+    :return: Текст таблицы.
+
+    """
+    lines = [f"{'задач':>8} {'операция':<18} {'оп/с':>12} {'секунд':>10} "
+             f"{'пик, МБ':>9}"]
+    for size, operations in results['sizes'].items():
+        for name, result in operations.items():
+            peak = result['peak_mb']
+            lines.append(f"{size:>8} {name:<18} "
+                         f"{result['ops_per_second']:>12} "
+                         f"{result['seconds']:>10.4f} "
+                         f"{'-' if peak is None else peak:>9}")
+    return '\n'.join(lines)
+
+
+def main():
+    """Запускает замеры производительности из командной строки."""
+    parser = argparse.ArgumentParser(
+        description="Замеры производительности операций TaskManager.")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=list(DEFAULT_SIZES),
+                        help="Размеры наборов задач, например 1000 1000000.")
+    parser.add_argument('--output', help="Файл для сохранения результатов.")
+    parser.add_argument('--baseline', help="Файл с базовыми результатами.")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Допустимое снижение пропускной способности.")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Не измерять пиковое потребление памяти.")
+    parser.add_argument('--journal', action='store_true',
+                        help="Сохранять изменения в журнал.")
+    parser.add_argument('--fsync', action='store_true',
+                        help="Вызывать os.fsync после записи в журнал и "
+                             "снимка.")
+    parser.add_argument('--text-index', action='store_true',
+                        help="Использовать индекс слов для поиска.")
+    parser.add_argument('--stream-load', action='store_true',
+                        help="Загружать файл потоково.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cold-start', action='store_true',
+                        help="Замерить время запуска команд cli.py.")
+    args = parser.parse_args()
+
+    if args.cold_start:
+        print(format_cold_start(cold_start(args.sizes, seed=args.seed)))
+        return
+    options = {name: True for name in ('journal', 'fsync', 'text_index',
+                                       'stream_load')
+               if getattr(args, name)}
+    results = run(args.sizes, not args.no_memory, args.seed, **options)
+    print(format_results(results))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=4)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"Регрессия: {regression}")
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+import argparse
+import mmap
+import os
+import struct
+from storage import JsonStorage, Storage
+from task import Task
+from task_list import TaskList
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+MAGIC = b'TASKBIN1'
+# Заголовок: сигнатура, количество задач, следующий ID.
+HEADER = struct.Struct('<8sIq')
+# Таблица смещений, отсортированная по ID: ID задачи, смещение записи.
+ENTRY = struct.Struct('<qQ')
+# Запись: длина, ID, затем поля задачи в виде строк с префиксом длины.
+LENGTH = struct.Struct('<I')
+RECORD_ID = struct.Struct('<q')
+FIELDS = ('title', 'description', 'category', 'due_date', 'priority',
+          'status')
+
+
+def encode_task(task: Task) -> bytes:
+    """Кодирует задачу в запись двоичного файла.
+    :param task: Задача.
+    :return: Запись с префиксом длины.
+
+    """
+    parts = [RECORD_ID.pack(task.id)]
+    for field in FIELDS:
+        data = getattr(task, field).encode('utf-8')
+        parts.append(LENGTH.pack(len(data)))
+        parts.append(data)
+    payload = b''.join(parts)
+    return LENGTH.pack(len(payload)) + payload
+
+
+def decode_task(buffer, offset: int) -> Tuple[Task, int]:
+    """Декодирует запись двоичного файла.
+    :param buffer: Содержимое файла (mmap или bytes).
+    :param offset: Смещение начала записи.
+    :return: Кортеж из задачи и смещения следующей записи.
+
+    """
+    length, = LENGTH.unpack_from(buffer, offset)
+    position = offset + LENGTH.size
+    end = position + length
+    task_id, = RECORD_ID.unpack_from(buffer, position)
+    position += RECORD_ID.size
+    values = []
+    for _ in FIELDS:
+        size, = LENGTH.unpack_from(buffer, position)
+        position += LENGTH.size
+        values.append(str(buffer[position:position + size], 'utf-8'))
+        position += size
+    return Task(task_id, *values), end
+
+
+def write_binary(filename: str, tasks: Iterable[Task], next_id: int):
+    """Записывает задачи в двоичный файл. Файл сначала пишется во временный
+    файл, который затем атомарно заменяет исходный.
+    :param filename: Путь к двоичному файлу.
+    :param tasks: Задачи для записи.
+    :param next_id: Следующий ID задачи.
+
+    """
+    tasks = list(tasks)
+    entries = []
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'wb') as file:
+        offset = HEADER.size + ENTRY.size * len(tasks)
+        file.seek(offset)
+        for task in tasks:
+            record = encode_task(task)
+            entries.append((task.id, offset))
+            file.write(record)
+            offset += len(record)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, len(tasks), next_id))
+        entries.sort()
+        file.write(b''.join(ENTRY.pack(*entry) for entry in entries))
+    os.replace(temp_filename, filename)
+
+
+class BinaryTaskFile:
+    """Двоичный файл задач, открытый через mmap. Задача по ID находится
+    двоичным поиском по таблице смещений и декодируется без разбора
+    остальных записей.
+
+    """
+    def __init__(self, filename: str):
+        """Открывает файл.
+        :param filename: Путь к двоичному файлу.
+        :raises ValueError: Если файл не является двоичным файлом задач.
+
+        """
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"Файл '{filename}' слишком короткий.")
+        magic, self.count, self.next_id = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Файл '{filename}' не является двоичным "
+                             f"файлом задач.")
+
+    def close(self):
+        """Закрывает файл."""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Возвращает задачу по ID.
+        :param task_id: ID задачи.
+        :return: Объект Task или None, если задача не найдена.
+
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            entry_id, offset = ENTRY.unpack_from(
+                self._map, HEADER.size + middle * ENTRY.size)
+            if entry_id < task_id:
+                low = middle + 1
+            elif entry_id > task_id:
+                high = middle
+            else:
+                return decode_task(self._map, offset)[0]
+        return None
+
+    def __iter__(self) -> Iterator[Task]:
+        offset = HEADER.size + ENTRY.size * self.count
+        for _ in range(self.count):
+            task, offset = decode_task(self._map, offset)
+            yield task
+
+
+class BinaryStorage(Storage):
+    """Хранилище задач в двоичном файле с таблицей смещений. Предназначено
+    для сценариев, где данные в основном читаются: поиск по ID выполняется
+    через mmap без загрузки остальных задач, а любое изменение перезаписывает
+    файл целиком. TaskManager с lazy_indexes ищет задачу по ID через search,
+    не загружая файл, пока задачи не понадобятся целиком.
+
+    """
+    PROGRESS_EVERY = 10000
+    supports_search = True
+
+    def __init__(self, filename: str = 'tasks.bin'):
+        """Инициализирует хранилище.
+        :param filename: Путь к двоичному файлу.
+
+        """
+        self.filename = filename
+        self._reader = None
+
+    def _open(self) -> Optional[BinaryTaskFile]:
+        """Открывает файл для чтения, если он еще не открыт.
+        :return: Открытый файл или None, если открыть его не удалось.
+
+        """
+        if self._reader is None:
+            try:
+                self._reader = BinaryTaskFile(self.filename)
+            except FileNotFoundError:
+                print(f"Файл '{self.filename}' не найден. "
+                      f"Будет создан новый файл.")
+            except (ValueError, OSError, struct.error):
+                print(f"Ошибка чтения двоичного файла '{self.filename}'. "
+                      f"Файл может быть поврежден.")
+        return self._reader
+
+    def close(self):
+        """Закрывает открытый файл."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def load(self, progress: Callable[[int, int], None] = None
+             ) -> Optional[Tuple[TaskList, int]]:
+        """Загружает все задачи из двоичного файла.
+        :param progress: Функция, которая вызывается каждые PROGRESS_EVERY
+            задач и в конце с количеством загруженных задач и их общим
+            числом.
+        :return: Кортеж из списка задач и следующего ID или None.
+
+        """
+        reader = self._open()
+        if reader is None:
+            return None
+        tasks = TaskList()
+        try:
+            for task in reader:
+                tasks.append(task)
+                if (progress is not None and
+                        len(tasks) % self.PROGRESS_EVERY == 0):
+                    progress(len(tasks), len(reader))
+        except (struct.error, UnicodeDecodeError):
+            print(f"Ошибка чтения двоичного файла '{self.filename}'. "
+                  f"Файл может быть поврежден.")
+            return None
+        if progress is not None:
+            progress(len(tasks), len(reader))
+        print("Данные успешно загружены.")
+        return tasks, reader.next_id
+
+    def save(self, tasks: Iterable[Task], next_id: int) -> bool:
+        """Перезаписывает двоичный файл.
+        :param tasks: Задачи для сохранения.
+        :param next_id: Следующий ID задачи.
+        :return: True, если данные успешно сохранены, иначе False.
+
+        """
+        self.close()
+        try:
+            write_binary(self.filename, tasks, next_id)
+        except (IOError, OSError):
+            print(f"Не удалось сохранить обновленный список задач в файл "
+                  f"'{self.filename}'.")
+            return False
+        print(f"Обновленный список задач успешно сохранен в файл "
+              f"'{self.filename}'.")
+        return True
+
+    def search(self, task_id: int = None, keyword: str = None,
+               category: str = None, status: str = None,
+               priority: str = None, due_before: str = None,
+               due_after: str = None, overdue: bool = False
+               ) -> Optional[Iterator[Task]]:
+        """Находит задачу по ID через таблицу смещений. Другие фильтры
+        двоичный файл не поддерживает.
+        :return: Итератор по найденным задачам или None, если заданы другие
+            фильтры.
+
+        """
+        if (not task_id or keyword or category or status or priority or
+                due_before or due_after or overdue):
+            return None
+        reader = self._open()
+        task = reader.get(task_id) if reader is not None else None
+        return iter([task] if task is not None else [])
+
+
+def json_to_binary(json_filename: str, binary_filename: str) -> bool:
+    """Преобразует JSON-файл задач в двоичный формат.
+    :param json_filename: Путь к исходному JSON-файлу.
+    :param binary_filename: Путь к создаваемому двоичному файлу.
+    :return: True, если файл успешно преобразован, иначе False.
+
+    """
+    data = JsonStorage(json_filename, stream_load=True).load()
+    if data is None:
+        return False
+    return BinaryStorage(binary_filename).save(*data)
+
+
+def binary_to_json(binary_filename: str, json_filename: str) -> bool:
+    """Преобразует двоичный файл задач в JSON-формат.
+    :param binary_filename: Путь к исходному двоичному файлу.
+    :param json_filename: Путь к создаваемому JSON-файлу.
+    :return: True, если файл успешно преобразован, иначе False.
+
+    """
+    storage = BinaryStorage(binary_filename)
+    data = storage.load()
+    storage.close()
+    if data is None:
+        return False
+    return JsonStorage(json_filename).save(*data)
+
+
+def main():
+    """Преобразует файл задач между JSON и двоичным форматом."""
+    parser = argparse.ArgumentParser(
+        description="Преобразование файла задач между JSON и двоичным "
+                    "форматом.")
+    parser.add_argument('direction', choices=['to-binary', 'to-json'])
+    parser.add_argument('source')
+    parser.add_argument('target')
+    args = parser.parse_args()
+    if args.direction == 'to-binary':
+        converted = json_to_binary(args.source, args.target)
+    else:
+        converted = binary_to_json(args.source, args.target)
+    raise SystemExit(0 if converted else 1)
+
+
+if __name__ == "__main__":
+    main()
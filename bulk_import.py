@@ -0,0 +1,151 @@
+import argparse
+import csv
+import json
+import os
+from itertools import islice
+from task import Task
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from validation import TASK_VALIDATOR
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+NOT_AN_OBJECT = "Строка не является JSON-объектом."
+BATCH_SIZE = 10000
+
+
+class ImportReport:
+    """Итог импорта: количество добавленных задач и ошибки по строкам
+    входного файла.
+
+    """
+    def __init__(self):
+        self.imported = 0
+        self.errors: List[Tuple[int, str]] = []
+
+    @property
+    def rejected(self) -> int:
+        """Количество отклоненных записей."""
+        return len(self.errors)
+
+    def __repr__(self):
+        return (f"ImportReport(imported={self.imported}, "
+                f"rejected={self.rejected})")
+
+
+def detect_format(filename: str) -> Optional[str]:
+    """Определяет формат входного файла по расширению.
+    :param filename: Путь к файлу.
+    :return: 'csv', 'jsonl' или None, если формат неизвестен.
+
+    """
+    return FORMATS.get(os.path.splitext(filename)[1].lower())
+
+
+def read_csv(file) -> Iterator[Tuple[int, Dict]]:
+    """Читает записи из CSV-файла с заголовком.
+    :param file: Открытый файл.
+    :return: Итератор по парам из номера строки и записи.
+
+    """
+    reader = csv.DictReader(file)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def read_jsonl(file) -> Iterator[Tuple[int, Optional[Dict]]]:
+    """Читает записи из файла JSON Lines. Пустые строки пропускаются, а
+    строки, которые не удалось разобрать, возвращаются как None.
+    :param file: Открытый файл.
+    :return: Итератор по парам из номера строки и записи.
+
+    """
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = None
+        yield line_number, record
+
+
+def build_tasks(records: Iterable[Tuple[int, Optional[Dict]]], next_id: int,
+                report: ImportReport,
+                batch_size: int = BATCH_SIZE) -> Iterator[Task]:
+    """Проверяет записи пакетами по batch_size и создает задачи из
+    корректных. ID назначаются подряд, начиная с next_id; первая ошибка
+    каждой записи попадает в отчет.
+    :param records: Пары из номера строки и записи.
+    :param next_id: ID первой создаваемой задачи.
+    :param report: Отчет об импорте.
+    :param batch_size: Количество записей в пакете.
+    :return: Итератор по созданным задачам.
+
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        rejected = {}
+        for number, (_, record) in enumerate(batch):
+            if not isinstance(record, dict):
+                rejected[number] = NOT_AN_OBJECT
+            elif not record.get('status'):
+                record['status'] = None
+        valid = (record if number not in rejected else {}
+                 for number, (_, record) in enumerate(batch))
+        for number, errors in TASK_VALIDATOR.validate_many(valid):
+            rejected.setdefault(number, errors[0].message)
+        for number, (line_number, record) in enumerate(batch):
+            if number in rejected:
+                report.errors.append((line_number, rejected[number]))
+                continue
+            yield Task(next_id, record['title'], record['description'],
+                       record['category'], record['due_date'],
+                       record['priority'], record['status'] or 'Не выполнена')
+            next_id += 1
+            report.imported += 1
+
+
+def read_tasks(filename: str, next_id: int, report: ImportReport,
+               file_format: str = None,
+               batch_size: int = BATCH_SIZE) -> List[Task]:
+    """Читает и проверяет все записи входного файла.
+    :param filename: Путь к файлу CSV или JSON Lines.
+    :param next_id: ID первой создаваемой задачи.
+    :param report: Отчет об импорте.
+    :param file_format: 'csv' или 'jsonl'. None — по расширению файла.
+    :param batch_size: Количество записей в пакете проверки.
+    :return: Список корректных задач.
+    :raises ValueError: Если формат файла неизвестен.
+
+    """
+    file_format = file_format or detect_format(filename)
+    if file_format not in ('csv', 'jsonl'):
+        raise ValueError(f"Неизвестный формат файла '{filename}'.")
+    reader = read_csv if file_format == 'csv' else read_jsonl
+    with open(filename, 'r', encoding='utf-8', newline='') as file:
+        return list(build_tasks(reader(file), next_id, report, batch_size))
+
+
+def main():
+    """Импортирует задачи из файла CSV или JSON Lines."""
+    from task_manager import TaskManager
+
+    parser = argparse.ArgumentParser(
+        description="Импорт задач из файла CSV или JSON Lines.")
+    parser.add_argument('source')
+    parser.add_argument('--tasks-file', default='tasks.json')
+    parser.add_argument('--format', choices=['csv', 'jsonl'])
+    args = parser.parse_args()
+    manager = TaskManager(filename=args.tasks_file)
+    report = manager.import_tasks(args.source, args.format)
+    if report is None:
+        raise SystemExit(1)
+    for line_number, error in report.errors:
+        print(f"Строка {line_number}: {error}")
+    raise SystemExit(0)
+
+
+if __name__ == "__main__":
+    main()
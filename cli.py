@@ -0,0 +1,142 @@
+import argparse
+import contextlib
+import io
+import sys
+from typing import List, TextIO
+
+# Модули менеджера задач импортируются только после разбора аргументов,
+# чтобы --help и ошибки в аргументах не ждали загрузки.
+
+FIELDS = ('title', 'description', 'category', 'due_date', 'priority',
+          'status')
+FILTERS = ('task_id', 'keyword', 'category', 'status', 'priority',
+           'due_before', 'due_after', 'overdue')
+
+
+def add(manager, args, out: TextIO) -> bool:
+    """Добавляет задачу и выводит ее ID."""
+    if not manager.add_task(args.title, args.description, args.category,
+                            args.due_date, args.priority):
+        return False
+    print(manager.next_id - 1, file=out)
+    return True
+
+
+def update(manager, args, out: TextIO) -> bool:
+    """Обновляет поля задачи."""
+    fields = {field: getattr(args, field) for field in FIELDS}
+    return manager.update_task(args.task_id, **fields)
+
+
+def done(manager, args, out: TextIO) -> bool:
+    """Отмечает задачу выполненной."""
+    return manager.update_task(args.task_id, status="Выполнена")
+
+
+def delete(manager, args, out: TextIO) -> bool:
+    """Удаляет задачу по ID или все задачи категории."""
+    return manager.delete_task(args.task_id, args.category)
+
+
+def search(manager, args, out: TextIO) -> bool:
+    """Выводит задачи, подходящие под фильтры."""
+    filters = {name: getattr(args, name) for name in FILTERS}
+    if args.format == 'jsonl':
+        from export import write_tasks
+        return write_tasks(manager.iter_tasks(**filters), out, 'jsonl') > 0
+    return manager.display_tasks(manager.iter_tasks(**filters), args.limit,
+                                 args.offset, file=out)
+
+
+def list_tasks(manager, args, out: TextIO) -> bool:
+    """Выводит все задачи или задачи по категориям."""
+    if args.grouped:
+        return manager.display_grouped_tasks(args.limit, file=out)
+    return manager.display_tasks(manager.tasks, args.limit, args.offset,
+                                 file=out)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Создает разбор аргументов с подкомандами.
+    :return: Объект ArgumentParser.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='task', description="Менеджер задач: одна операция за запуск.")
+    parser.add_argument('--tasks-file', default='tasks.json')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Выводить сообщения менеджера задач.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('add', help="Добавить задачу.")
+    for field in FIELDS[:-1]:
+        command.add_argument(field)
+    command.set_defaults(run=add)
+
+    command = commands.add_parser('update', help="Изменить задачу.")
+    command.add_argument('task_id', type=int)
+    for field in FIELDS:
+        command.add_argument('--' + field.replace('_', '-'))
+    command.set_defaults(run=update)
+
+    command = commands.add_parser('done', help="Отметить выполненной.")
+    command.add_argument('task_id', type=int)
+    command.set_defaults(run=done)
+
+    command = commands.add_parser('delete', help="Удалить задачи.")
+    target = command.add_mutually_exclusive_group(required=True)
+    target.add_argument('task_id', type=int, nargs='?')
+    target.add_argument('--category')
+    command.set_defaults(run=delete)
+
+    command = commands.add_parser('search', help="Найти задачи.")
+    command.add_argument('keyword', nargs='?')
+    command.add_argument('--id', type=int, dest='task_id')
+    command.add_argument('--category')
+    command.add_argument('--status')
+    command.add_argument('--priority')
+    command.add_argument('--due-before')
+    command.add_argument('--due-after')
+    command.add_argument('--overdue', action='store_true')
+    command.add_argument('--format', choices=('text', 'jsonl'),
+                         default='text')
+    command.add_argument('--limit', type=int)
+    command.add_argument('--offset', type=int, default=0)
+    command.set_defaults(run=search)
+
+    command = commands.add_parser('list', help="Показать задачи.")
+    command.add_argument('--grouped', action='store_true',
+                         help="Сгруппировать по категориям.")
+    command.add_argument('--limit', type=int)
+    command.add_argument('--offset', type=int, default=0)
+    command.set_defaults(run=list_tasks)
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """Выполняет одну команду и возвращает код завершения. Сообщения
+    менеджера задач выводятся в stderr только при неудаче (или всегда с
+    --verbose). Файл открывается в режиме совместного доступа, как в
+    main.py, поэтому изменения дописываются в журнал без перезаписи файла,
+    а индексы строятся, только если они нужны команде.
+    :param argv: Аргументы командной строки без имени программы.
+    :return: 0, если команда выполнена, иначе 1.
+
+    """
+    args = build_parser().parse_args(argv)
+    from task_manager import TaskManager
+
+    out = sys.stdout
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(out if args.verbose else messages):
+        manager = TaskManager(filename=args.tasks_file, shared=True,
+                              lazy_indexes=True)
+        succeeded = args.run(manager, args, out)
+        succeeded = manager.close() and succeeded
+    if not succeeded:
+        sys.stderr.write(messages.getvalue())
+    return 0 if succeeded else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
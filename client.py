@@ -0,0 +1,201 @@
+import json
+import socket
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+Address = Union[str, Tuple[str, int]]
+Call = Tuple[str, Dict]
+
+
+class RpcError(Exception):
+    """Ошибка, которую вернул сервер JSON-RPC."""
+    def __init__(self, code: int, message: str):
+        """Инициализирует ошибку.
+        :param code: Код ошибки JSON-RPC.
+        :param message: Описание ошибки.
+
+        """
+        super().__init__(f"{message} ({code})")
+        self.code = code
+        self.message = message
+
+
+class TaskClient:
+    """Клиент сервера задач (см. server.py). Одно соединение используется
+    для всех вызовов; объект не предназначен для одновременного
+    использования из нескольких потоков.
+
+    Пример::
+
+        with TaskClient(('127.0.0.1', 8765)) as client:
+            task_id = client.add_task(...)
+            results = client.batch([('search_tasks', {'category': 'Работа'}),
+                                    ('next_tasks', {'count': 5})])
+
+    """
+    def __init__(self, address: Address, timeout: float = None):
+        """Подключается к серверу.
+        :param address: Путь к Unix-сокету или кортеж (хост, порт).
+        :param timeout: Время ожидания ответа в секундах или None.
+
+        """
+        if isinstance(address, str):
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(address)
+        else:
+            self.socket = socket.create_connection(address, timeout)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self.socket.makefile('rb')
+        self._next_id = 1
+
+    def __enter__(self) -> 'TaskClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Закрывает соединение."""
+        self._reader.close()
+        self.socket.close()
+
+    def _request(self, method: str, params: Dict) -> Dict:
+        """Создает объект запроса с новым ID.
+        :param method: Имя метода.
+        :param params: Параметры метода.
+        :return: Объект запроса.
+
+        """
+        request = {'jsonrpc': '2.0', 'method': method, 'params': params,
+                   'id': self._next_id}
+        self._next_id += 1
+        return request
+
+    def _send(self, messages: Iterable[Any]):
+        """Отправляет сообщения одной записью, по одному на строку.
+        :param messages: Объекты запросов или пакетов.
+
+        """
+        self.socket.sendall(b''.join(
+            json.dumps(message, ensure_ascii=False,
+                       separators=(',', ':')).encode('utf-8') + b'\n'
+            for message in messages))
+
+    def _receive(self) -> Any:
+        """Читает один ответ.
+        :return: Разобранный объект ответа.
+
+        """
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Сервер закрыл соединение")
+        return json.loads(line)
+
+    @staticmethod
+    def _result(response: Dict) -> Any:
+        """Возвращает результат ответа или объект RpcError.
+        :param response: Объект ответа.
+        :return: Результат или RpcError.
+
+        """
+        if 'error' in response:
+            return RpcError(response['error']['code'],
+                            response['error']['message'])
+        return response['result']
+
+    def call(self, method: str, **params) -> Any:
+        """Вызывает метод сервера и ждет ответа.
+        :param method: Имя метода.
+        :param params: Параметры метода.
+        :return: Результат вызова.
+        :raises RpcError: Если сервер вернул ошибку.
+
+        """
+        self._send([self._request(method, params)])
+        result = self._result(self._receive())
+        if isinstance(result, RpcError):
+            raise result
+        return result
+
+    def notify(self, method: str, **params):
+        """Вызывает метод сервера без ожидания ответа.
+        :param method: Имя метода.
+        :param params: Параметры метода.
+
+        """
+        self._send([{'jsonrpc': '2.0', 'method': method, 'params': params}])
+
+    def batch(self, calls: Iterable[Call]) -> List[Any]:
+        """Отправляет вызовы одним пакетом JSON-RPC и ждет общего ответа.
+        :param calls: Пары (имя метода, словарь параметров).
+        :return: Результаты в порядке вызовов; на месте неудачных вызовов —
+            объекты RpcError.
+
+        """
+        requests = [self._request(method, params) for method, params in calls]
+        if not requests:
+            return []
+        self._send([requests])
+        responses = self._receive()
+        if isinstance(responses, dict):
+            raise self._result(responses)
+        by_id = {response['id']: response for response in responses}
+        return [self._result(by_id[request['id']]) for request in requests]
+
+    def pipeline(self, calls: Iterable[Call], depth: int = 100
+                 ) -> List[Any]:
+        """Отправляет вызовы отдельными запросами, не дожидаясь ответов на
+        предыдущие: до depth запросов подряд, затем читает ответы на них.
+        :param calls: Пары (имя метода, словарь параметров).
+        :param depth: Наибольшее количество запросов без ответа.
+        :return: Результаты в порядке вызовов; на месте неудачных вызовов —
+            объекты RpcError.
+
+        """
+        calls = iter(calls)
+        results = []
+        while True:
+            requests = [self._request(method, params)
+                        for method, params in islice(calls, depth)]
+            if not requests:
+                return results
+            self._send(requests)
+            results.extend(self._result(self._receive())
+                           for _ in requests)
+
+    def add_task(self, title: str, description: str, category: str,
+                 due_date: str, priority: str) -> Union[int, bool]:
+        """Добавляет задачу.
+        :return: ID новой задачи или False, если задача не добавлена.
+
+        """
+        return self.call('add_task', title=title, description=description,
+                         category=category, due_date=due_date,
+                         priority=priority)
+
+    def update_task(self, task_id: int, **fields) -> bool:
+        """Обновляет задачу (см. TaskManager.update_task)."""
+        return self.call('update_task', task_id=task_id, **fields)
+
+    def delete_task(self, task_id: int = None, category: str = None) -> bool:
+        """Удаляет задачи (см. TaskManager.delete_task)."""
+        return self.call('delete_task', task_id=task_id, category=category)
+
+    def search_tasks(self, **filters) -> List[Dict]:
+        """Ищет задачи (см. TaskManager.search_tasks).
+        :return: Список найденных задач в виде словарей.
+
+        """
+        return self.call('search_tasks', **filters)
+
+    def next_tasks(self, count: int = 10) -> List[Dict]:
+        """Возвращает самые срочные задачи.
+        :return: Список задач в виде словарей.
+
+        """
+        return self.call('next_tasks', count=count)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Возвращает метрики менеджера задач на сервере."""
+        return self.call('stats')
@@ -0,0 +1,92 @@
+import argparse
+import contextlib
+import csv
+import json
+import sys
+from task import Task
+from typing import Iterable, TextIO
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+COLUMNS = ('id', 'title', 'description', 'category', 'due_date', 'priority',
+           'status')
+
+
+def write_csv(tasks: Iterable[Task], file: TextIO) -> int:
+    """Записывает задачи в CSV с заголовком. Столбцы совпадают с форматом
+    импорта, поэтому выгрузку можно загрузить обратно.
+    :param tasks: Задачи для записи.
+    :param file: Открытый файл.
+    :return: Количество записанных задач.
+
+    """
+    writer = csv.writer(file)
+    writer.writerow(COLUMNS)
+    count = 0
+    for task in tasks:
+        writer.writerow((task.id, task.title, task.description,
+                         task.category, task.due_date, task.priority,
+                         task.status))
+        count += 1
+    return count
+
+
+def write_jsonl(tasks: Iterable[Task], file: TextIO) -> int:
+    """Записывает задачи в формате JSON Lines, по объекту на строку.
+    :param tasks: Задачи для записи.
+    :param file: Открытый файл.
+    :return: Количество записанных задач.
+
+    """
+    count = 0
+    for task in tasks:
+        file.write(json.dumps(task.to_dict(), ensure_ascii=False) + '\n')
+        count += 1
+    return count
+
+
+def write_tasks(tasks: Iterable[Task], file: TextIO, file_format: str) -> int:
+    """Записывает задачи в указанном формате.
+    :param tasks: Задачи для записи.
+    :param file: Открытый файл.
+    :param file_format: 'csv' или 'jsonl'.
+    :return: Количество записанных задач.
+
+    """
+    if file_format == 'csv':
+        return write_csv(tasks, file)
+    return write_jsonl(tasks, file)
+
+
+def main():
+    """Выгружает задачи, подходящие под фильтры, в CSV или JSON Lines."""
+    from task_manager import TaskManager
+
+    parser = argparse.ArgumentParser(
+        description="Выгрузка задач в файл CSV или JSON Lines.")
+    parser.add_argument('--tasks-file', default='tasks.json')
+    parser.add_argument('--output', help="Выходной файл; по умолчанию "
+                                         "вывод в консоль.")
+    parser.add_argument('--format', choices=EXPORT_FORMATS)
+    parser.add_argument('--id', type=int, dest='task_id')
+    parser.add_argument('--keyword')
+    parser.add_argument('--category')
+    parser.add_argument('--status')
+    parser.add_argument('--priority')
+    parser.add_argument('--due-before')
+    parser.add_argument('--due-after')
+    parser.add_argument('--overdue', action='store_true')
+    args = parser.parse_args()
+    filters = {name: value for name, value in vars(args).items()
+               if name not in ('tasks_file', 'output', 'format')}
+    if args.output is None:
+        # Сообщения о загрузке не должны попасть в выгрузку.
+        with contextlib.redirect_stdout(sys.stderr):
+            manager = TaskManager(filename=args.tasks_file)
+    else:
+        manager = TaskManager(filename=args.tasks_file)
+    count = manager.export_tasks(args.output, args.format, **filters)
+    raise SystemExit(0 if count is not None else 1)
+
+
+if __name__ == "__main__":
+    main()
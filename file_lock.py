@@ -0,0 +1,90 @@
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+def lock_file(file, shared: bool):
+    """Блокирует открытый файл, ожидая освобождения блокировки.
+    :param file: Открытый файл блокировки.
+    :param shared: Если True, блокировка разделяемая (для чтения). В Windows
+        все блокировки исключительные.
+
+    """
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        return
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            time.sleep(0.01)
+
+
+def unlock_file(file):
+    """Снимает блокировку с открытого файла.
+    :param file: Открытый файл блокировки.
+
+    """
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """Рекомендательная блокировка между процессами через отдельный файл.
+    Повторный захват в том же процессе не блокирует, а только увеличивает
+    счетчик, поэтому операции под блокировкой могут вызывать друг друга.
+    Потоки одного процесса захватывают блокировку по очереди.
+
+    """
+    def __init__(self, filename: str):
+        """Инициализирует блокировку.
+        :param filename: Путь к файлу блокировки. Файл создается при первом
+            захвате и не удаляется.
+
+        """
+        self.filename = filename
+        self._file = None
+        self._depth = 0
+        self._thread_lock = threading.RLock()
+
+    @contextmanager
+    def acquire(self, shared: bool = False):
+        """Захватывает блокировку на время блока with.
+        :param shared: Если True, блокировка разделяемая: ее одновременно
+            могут держать несколько читающих процессов. Вложенный захват
+            сохраняет режим внешнего.
+
+        """
+        with self._thread_lock:
+            if self._depth == 0:
+                self._file = open(self.filename, 'a+b')
+                try:
+                    lock_file(self._file, shared)
+                except BaseException:
+                    self._file.close()
+                    raise
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    unlock_file(self._file)
+                    self._file.close()
+                    self._file = None
+
+    @property
+    def held(self) -> bool:
+        """Удерживается ли блокировка текущим процессом."""
+        return self._depth > 0
+
@@ -0,0 +1,491 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from heapq import heapify, heappop, heappush
+from task import Task
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+TOKEN_RE = re.compile(r'\w+')
+PRIORITY_RANK = {'Высокий': 0, 'Средний': 1, 'Низкий': 2}
+NO_DUE_DATE = float('inf')
+
+
+def normalize(value):
+    """Приводит значение к виду для сравнения без учета регистра.
+    :param value: Значение поля задачи.
+    :return: Строка в нижнем регистре или исходное значение, если это не
+        строка.
+
+    """
+    return value.casefold() if isinstance(value, str) else value
+
+
+def fold(text: str) -> str:
+    """Приводит текст к виду для полнотекстового поиска: выполняет
+    Unicode-свертку регистра и заменяет 'ё' на 'е'.
+    :param text: Исходный текст.
+    :return: Нормализованный текст.
+
+    """
+    return text.casefold().replace('ё', 'е')
+
+
+def keyword_words(keyword: str) -> List[str]:
+    """Разбивает поисковый запрос на слова.
+    :param keyword: Поисковый запрос.
+    :return: Список нормализованных слов запроса.
+
+    """
+    return fold(keyword).split()
+
+
+def matches_keyword(task: Task, words: List[str]) -> bool:
+    """Проверяет, что каждое слово запроса встречается в названии или
+    описании задачи.
+    :param task: Проверяемая задача.
+    :param words: Нормализованные слова запроса.
+    :return: True, если задача подходит под запрос, иначе False.
+
+    """
+    title = fold(task.title)
+    description = fold(task.description)
+    return all(word in title or word in description for word in words)
+
+
+class FieldIndex:
+    """Вторичный индекс задач по значению поля без учета регистра. Хранит для
+    каждого значения словарь задач по ID, поэтому выборка по значению стоит
+    пропорционально размеру результата, а не количеству задач.
+
+    """
+    def __init__(self, field: str):
+        """Инициализирует индекс.
+        :param field: Название индексируемого атрибута задачи.
+
+        """
+        self.field = field
+        self._buckets: Dict[str, Dict[int, Task]] = {}
+        self._keys: Dict[int, str] = {}
+
+    def add(self, task: Task):
+        """Добавляет задачу в индекс.
+        :param task: Индексируемая задача.
+
+        """
+        key = normalize(getattr(task, self.field))
+        self._keys[task.id] = key
+        self._buckets.setdefault(key, {})[task.id] = task
+
+    def discard(self, task: Task):
+        """Удаляет задачу из индекса. Используется значение, под которым
+        задача была проиндексирована, поэтому метод работает и после
+        изменения атрибута.
+        :param task: Удаляемая задача.
+
+        """
+        key = self._keys.pop(task.id, None)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        bucket.pop(task.id, None)
+        if not bucket:
+            del self._buckets[key]
+
+    def clear(self):
+        """Очищает индекс."""
+        self._buckets.clear()
+        self._keys.clear()
+
+    def keys(self) -> List[str]:
+        """Возвращает проиндексированные значения.
+        :return: Список значений в нижнем регистре.
+
+        """
+        return list(self._buckets)
+
+    def equals(self, value: str) -> Dict[int, Task]:
+        """Выбирает задачи, у которых значение поля совпадает с заданным без
+        учета регистра.
+        :param value: Искомое значение.
+        :return: Словарь задач по ID. Не изменяйте его.
+
+        """
+        return self._buckets.get(normalize(value), {})
+
+    def contains(self, value: str) -> Dict[int, Task]:
+        """Выбирает задачи, у которых значение поля содержит заданную
+        подстроку без учета регистра. Перебираются только различные значения
+        поля, а не все задачи.
+        :param value: Искомая подстрока.
+        :return: Словарь задач по ID. Не изменяйте его.
+
+        """
+        value = normalize(value)
+        buckets = [bucket for key, bucket in self._buckets.items()
+                   if isinstance(key, str) and value in key]
+        if len(buckets) == 1:
+            return buckets[0]
+        result = {}
+        for bucket in buckets:
+            result.update(bucket)
+        return result
+
+
+class TextIndex:
+    """Инвертированный индекс слов из названия и описания задач. Для каждого
+    слова хранится словарь задач по ID, в которых оно встречается. Поиск
+    перебирает словарь различных слов, а не задачи, и возвращает кандидатов,
+    которые затем проверяются поиском подстроки.
+
+    """
+    def __init__(self):
+        """Инициализирует пустой индекс."""
+        self._postings: Dict[str, Dict[int, Task]] = {}
+        self._tokens: Dict[int, Set[str]] = {}
+
+    @staticmethod
+    def tokenize(text: str) -> Set[str]:
+        """Разбивает текст на нормализованные слова.
+        :param text: Исходный текст.
+        :return: Множество слов.
+
+        """
+        return set(TOKEN_RE.findall(fold(text)))
+
+    def add(self, task: Task):
+        """Добавляет задачу в индекс.
+        :param task: Индексируемая задача.
+
+        """
+        tokens = self.tokenize(f'{task.title} {task.description}')
+        self._tokens[task.id] = tokens
+        for token in tokens:
+            self._postings.setdefault(token, {})[task.id] = task
+
+    def discard(self, task: Task):
+        """Удаляет задачу из индекса по словам, с которыми она была
+        проиндексирована.
+        :param task: Удаляемая задача.
+
+        """
+        for token in self._tokens.pop(task.id, ()):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(task.id, None)
+            if not posting:
+                del self._postings[token]
+
+    def clear(self):
+        """Очищает индекс."""
+        self._postings.clear()
+        self._tokens.clear()
+
+    def candidates(self, keyword: str) -> Optional[Dict[int, Task]]:
+        """Выбирает задачи, в которых могут встречаться все слова запроса.
+        Слово запроса может быть частью слова в тексте задачи.
+        :param keyword: Поисковый запрос.
+        :return: Словарь задач-кандидатов по ID или None, если в запросе нет
+            слов и сузить выборку нельзя.
+
+        """
+        result = None
+        for part in sorted(self.tokenize(keyword), key=len, reverse=True):
+            found = {}
+            for token, posting in self._postings.items():
+                if part in token:
+                    found.update(posting)
+            if result is None:
+                result = found
+            else:
+                result = {task_id: task for task_id, task in result.items()
+                          if task_id in found}
+            if not result:
+                return {}
+        return result
+
+
+class SortedBlocks:
+    """Отсортированный список, разбитый на блоки не длиннее 2 * LOAD
+    элементов, с наибольшим элементом каждого блока в отдельном списке.
+    Вставка и удаление находят блок двоичным поиском и сдвигают только его
+    элементы, поэтому их стоимость почти не зависит от размера списка, в
+    отличие от insort и del в одном большом списке.
+
+    """
+    LOAD = 500
+
+    def __init__(self, items: Iterable = ()):
+        """Создает список из элементов.
+        :param items: Начальные элементы в любом порядке.
+
+        """
+        items = sorted(items)
+        self._blocks: List[list] = [items[start:start + self.LOAD]
+                                    for start in range(0, len(items),
+                                                       self.LOAD)]
+        self._maxes: List[Any] = [block[-1] for block in self._blocks]
+        self._len = len(items)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        for block in self._blocks:
+            yield from block
+
+    def add(self, item):
+        """Вставляет элемент, сохраняя порядок.
+        :param item: Элемент.
+
+        """
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([item])
+            self._maxes.append(item)
+            return
+        position = bisect_left(self._maxes, item)
+        if position == len(self._maxes):
+            position -= 1
+            self._blocks[position].append(item)
+            self._maxes[position] = item
+        else:
+            insort(self._blocks[position], item)
+        block = self._blocks[position]
+        if len(block) > 2 * self.LOAD:
+            half = block[self.LOAD:]
+            del block[self.LOAD:]
+            self._blocks.insert(position + 1, half)
+            self._maxes[position] = block[-1]
+            self._maxes.insert(position + 1, half[-1])
+
+    def remove(self, item):
+        """Удаляет элемент.
+        :param item: Элемент, который есть в списке.
+        :raises ValueError: Если элемента нет в списке.
+
+        """
+        position = bisect_left(self._maxes, item)
+        if position < len(self._blocks):
+            block = self._blocks[position]
+            index = bisect_left(block, item)
+            if index < len(block) and block[index] == item:
+                del block[index]
+                self._len -= 1
+                if block:
+                    self._maxes[position] = block[-1]
+                else:
+                    del self._blocks[position]
+                    del self._maxes[position]
+                return
+        raise ValueError(f"{item!r} нет в списке")
+
+    def irange(self, low=None, high=None) -> Iterator:
+        """Перебирает элементы от low до high включительно по порядку.
+        :param low: Нижняя граница или None.
+        :param high: Верхняя граница или None.
+        :return: Итератор по элементам.
+
+        """
+        start = 0 if low is None else bisect_left(self._maxes, low)
+        for position in range(start, len(self._blocks)):
+            block = self._blocks[position]
+            first = (bisect_left(block, low)
+                     if low is not None and position == start else 0)
+            if high is not None and high < self._maxes[position]:
+                yield from block[first:bisect_right(block, high)]
+                return
+            yield from block[first:] if first else block
+
+
+class DueDateIndex:
+    """Индекс задач по сроку выполнения. Хранит пары (порядковый номер дня,
+    ID) в отсортированных блоках (SortedBlocks), поэтому выборка по
+    диапазону дат выполняется двоичным поиском, а изменение задачи не
+    сдвигает весь список. Задачи с некорректной датой в индекс не попадают.
+
+    С open_only индекс, как и UrgencyIndex, не хранит выполненные задачи:
+    поиск просроченных задач тогда не перебирает завершенные.
+
+    """
+    def __init__(self, open_only: bool = False):
+        """Инициализирует пустой индекс.
+        :param open_only: Если True, выполненные задачи не индексируются.
+
+        """
+        self.open_only = open_only
+        self._entries = SortedBlocks()
+        self._tasks: Dict[int, Task] = {}
+        self._keys: Dict[int, int] = {}
+
+    def add(self, task: Task):
+        """Добавляет задачу в индекс.
+        :param task: Индексируемая задача.
+
+        """
+        if not self._indexable(task):
+            return
+        self._keys[task.id] = task.due_ordinal
+        self._tasks[task.id] = task
+        self._entries.add((task.due_ordinal, task.id))
+
+    def add_many(self, tasks: Iterable[Task]):
+        """Добавляет несколько задач и один раз сортирует записи.
+        :param tasks: Индексируемые задачи.
+
+        """
+        entries = list(self._entries)
+        for task in tasks:
+            if self._indexable(task):
+                self._keys[task.id] = task.due_ordinal
+                self._tasks[task.id] = task
+                entries.append((task.due_ordinal, task.id))
+        self._entries = SortedBlocks(entries)
+
+    def _indexable(self, task: Task) -> bool:
+        """Проверяет, попадает ли задача в индекс.
+        :param task: Задача.
+        :return: True, если у задачи корректный срок и она подходит под
+            open_only.
+
+        """
+        if task.due_ordinal is None:
+            return False
+        return not (self.open_only and task.status == 'Выполнена')
+
+    def discard(self, task: Task):
+        """Удаляет задачу из индекса по сроку, с которым она была
+        проиндексирована.
+        :param task: Удаляемая задача.
+
+        """
+        ordinal = self._keys.pop(task.id, None)
+        if ordinal is None:
+            return
+        del self._tasks[task.id]
+        self._entries.remove((ordinal, task.id))
+
+    def clear(self):
+        """Очищает индекс."""
+        self._entries = SortedBlocks()
+        self._tasks.clear()
+        self._keys.clear()
+
+    def between(self, low: int = None, high: int = None) -> Dict[int, Task]:
+        """Выбирает задачи со сроком в заданном диапазоне включительно.
+        :param low: Нижняя граница (порядковый номер дня) или None.
+        :param high: Верхняя граница (порядковый номер дня) или None.
+        :return: Словарь задач по ID, упорядоченный по сроку.
+
+        """
+        entries = self._entries.irange(
+            None if low is None else (low,),
+            None if high is None else (high, float('inf')))
+        return {task_id: self._tasks[task_id] for _, task_id in entries}
+
+
+class UrgencyIndex:
+    """Упорядоченный индекс невыполненных задач по срочности: сначала
+    приоритет ('Высокий' > 'Средний' > 'Низкий'), затем срок выполнения,
+    затем ID. Задачи без корректного срока идут после задач со сроком.
+
+    Ключи хранятся в двоичной куче: добавление стоит O(log n), а удаленный
+    ключ остается в куче как устаревший, пока устаревших ключей не станет
+    больше, чем действующих, и куча не будет перестроена. Ключ действует,
+    пока _keys ссылается именно на этот объект. Первые K задач выбираются
+    обходом кучи от вершины без ее изменения, поэтому выборку можно
+    выполнять из нескольких потоков под блокировкой чтения.
+
+    """
+    # Пока устаревших ключей меньше, куча не перестраивается даже для
+    # небольшого индекса.
+    MIN_STALE = 64
+
+    def __init__(self):
+        """Инициализирует пустой индекс."""
+        self._heap: List[tuple] = []
+        self._stale = 0
+        self._tasks: Dict[int, Task] = {}
+        self._keys: Dict[int, tuple] = {}
+
+    @staticmethod
+    def key(task: Task) -> tuple:
+        """Вычисляет ключ срочности задачи.
+        :param task: Задача.
+        :return: Кортеж для сравнения (меньше — срочнее).
+
+        """
+        due_ordinal = task.due_ordinal
+        return (PRIORITY_RANK.get(task.priority, len(PRIORITY_RANK)),
+                NO_DUE_DATE if due_ordinal is None else due_ordinal,
+                task.id)
+
+    def add(self, task: Task):
+        """Добавляет задачу в индекс, если она не выполнена.
+        :param task: Индексируемая задача.
+
+        """
+        if task.status == 'Выполнена':
+            return
+        key = self.key(task)
+        self._keys[task.id] = key
+        self._tasks[task.id] = task
+        heappush(self._heap, key)
+
+    def add_many(self, tasks: Iterable[Task]):
+        """Добавляет несколько задач и один раз перестраивает кучу.
+        :param tasks: Индексируемые задачи.
+
+        """
+        for task in tasks:
+            if task.status != 'Выполнена':
+                key = self.key(task)
+                self._keys[task.id] = key
+                self._tasks[task.id] = task
+                self._heap.append(key)
+        heapify(self._heap)
+
+    def discard(self, task: Task):
+        """Удаляет задачу из индекса по ключу, с которым она была
+        проиндексирована.
+        :param task: Удаляемая задача.
+
+        """
+        if self._keys.pop(task.id, None) is None:
+            return
+        del self._tasks[task.id]
+        self._stale += 1
+        if self._stale > max(len(self._keys), self.MIN_STALE):
+            self._heap = list(self._keys.values())
+            heapify(self._heap)
+            self._stale = 0
+
+    def clear(self):
+        """Очищает индекс."""
+        self._heap.clear()
+        self._stale = 0
+        self._tasks.clear()
+        self._keys.clear()
+
+    def top(self, count: int) -> List[Task]:
+        """Возвращает самые срочные невыполненные задачи.
+        :param count: Количество задач.
+        :return: Список задач по убыванию срочности.
+        :raises ValueError: Если количество отрицательное.
+
+        """
+        if count < 0:
+            raise ValueError(f"Количество задач не может быть "
+                             f"отрицательным: {count}")
+        # Потомки элемента кучи не меньше его, поэтому очередной по
+        # срочности ключ всегда среди потомков уже просмотренных.
+        heap = self._heap
+        result = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(result) < count:
+            key, position = heappop(frontier)
+            if self._keys.get(key[-1]) is key:
+                result.append(self._tasks[key[-1]])
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heappush(frontier, (heap[child], child))
+        return result
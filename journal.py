@@ -0,0 +1,117 @@
+import json
+import os
+from metrics import NULL_METRICS
+from typing import Dict, Iterator, List
+
+
+class Journal:
+    """Журнал изменений (write-ahead log) для менеджера задач. Каждое
+    изменение записывается в конец файла одной строкой JSON, поэтому
+    стоимость записи не зависит от количества задач.
+
+    """
+    metrics = NULL_METRICS
+
+    def __init__(self, filename: str, fsync: bool = False):
+        """Инициализирует журнал.
+        :param filename: Путь к файлу журнала.
+        :param fsync: Вызывать ли os.fsync после каждой записи.
+
+        """
+        self.filename = filename
+        self.fsync = fsync
+        self.records = 0
+        # Размер прочитанной или записанной этим объектом части файла в
+        # байтах: с этого места начинаются записи других процессов.
+        self.offset = 0
+
+    def append(self, record: Dict) -> bool:
+        """Дописывает запись в конец журнала.
+        :param record: Словарь с описанием изменения.
+        :return: True, если запись успешно добавлена, иначе False.
+
+        """
+        return self.append_many([record])
+
+    def append_many(self, records: List[Dict]) -> bool:
+        """Дописывает несколько записей в конец журнала одной операцией
+        записи.
+        :param records: Список словарей с описанием изменений.
+        :return: True, если записи успешно добавлены, иначе False.
+
+        """
+        with self.metrics.phase('serialize'):
+            lines = ''.join(json.dumps(record, ensure_ascii=False,
+                                       separators=(',', ':')) + '\n'
+                            for record in records)
+        try:
+            with open(self.filename, 'a', encoding='utf-8') as file:
+                with self.metrics.phase('write'):
+                    file.write(lines)
+                    file.flush()
+                    self.offset = os.fstat(file.fileno()).st_size
+                if self.fsync:
+                    with self.metrics.phase('fsync'):
+                        os.fsync(file.fileno())
+        except (IOError, OSError):
+            print(f"Не удалось записать изменение в журнал "
+                  f"'{self.filename}'.")
+            return False
+        self.records += len(records)
+        return True
+
+    def replay(self) -> Iterator[Dict]:
+        """Последовательно читает записи журнала. Оборванная последняя строка
+        (например, после сбоя во время записи) пропускается.
+        :return: Итератор по записям журнала.
+
+        """
+        self.records = 0
+        self.offset = 0
+        return self._read()
+
+    def read_new(self) -> List[Dict]:
+        """Читает записи, добавленные в журнал после последнего чтения или
+        записи этим объектом, например другим процессом.
+        :return: Список новых записей.
+
+        """
+        return list(self._read())
+
+    def _read(self) -> Iterator[Dict]:
+        """Читает записи журнала начиная с offset и сдвигает offset за
+        каждую прочитанную запись.
+        :return: Итератор по записям.
+
+        """
+        try:
+            with open(self.filename, 'rb') as file:
+                file.seek(self.offset)
+                for line in file:
+                    if line.strip():
+                        try:
+                            record = json.loads(line)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            print(f"Предупреждение: Поврежденная запись в "
+                                  f"журнале '{self.filename}' пропущена.")
+                            break
+                        self.records += 1
+                        yield record
+                    self.offset += len(line)
+        except FileNotFoundError:
+            return
+
+    def truncate(self) -> bool:
+        """Очищает журнал после того, как его записи вошли в снимок.
+        :return: True, если журнал успешно очищен, иначе False.
+
+        """
+        try:
+            with open(self.filename, 'w', encoding='utf-8'):
+                pass
+        except (IOError, OSError):
+            print(f"Не удалось очистить журнал '{self.filename}'.")
+            return False
+        self.records = 0
+        self.offset = 0
+        return True
@@ -0,0 +1,121 @@
+import json
+from typing import Any, Dict, Iterator, TextIO
+
+WHITESPACE = ' \t\n\r'
+
+
+class JsonArrayStream:
+    """Потоковый разбор JSON-документа вида {"tasks": [...], ...}. Элементы
+    массива с заданным ключом возвращаются по одному по мере чтения файла,
+    поэтому весь документ не загружается в память. Остальные ключи верхнего
+    уровня сохраняются в атрибуте fields.
+
+    """
+    def __init__(self, file: TextIO, array_key: str = 'tasks',
+                 chunk_size: int = 1 << 16):
+        """Инициализирует разбор.
+        :param file: Файл, открытый в текстовом режиме.
+        :param array_key: Ключ массива, элементы которого нужно получать
+            по одному.
+        :param chunk_size: Размер блока чтения в символах.
+
+        """
+        self.file = file
+        self.array_key = array_key
+        self.chunk_size = chunk_size
+        self.fields: Dict[str, Any] = {}
+        self.position = 0
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Дочитывает очередной блок файла в буфер.
+        :return: True, если удалось прочитать данные, иначе False.
+
+        """
+        if self._eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self.position += len(chunk)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Пропускает пробелы и возвращает следующий символ.
+        :return: Следующий символ или пустая строка в конце файла.
+
+        """
+        while True:
+            while (self._pos < len(self._buffer) and
+                   self._buffer[self._pos] in WHITESPACE):
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, chars: str) -> str:
+        """Читает следующий символ и проверяет, что он допустим.
+        :param chars: Допустимые символы.
+        :return: Прочитанный символ.
+
+        """
+        char = self._peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}",
+                                       self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Разбирает очередное JSON-значение, при необходимости дочитывая
+        файл. Значение принимается, только если за ним есть еще символы
+        или достигнут конец файла, чтобы не обрезать числа на границе блока.
+        :return: Разобранное значение.
+
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            if not self._fill():
+                self._eof = True
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == self.array_key and self._peek() == '[':
+                yield from self._array()
+            else:
+                self.fields[key] = self._value()
+            if self._expect(',}') == '}':
+                return
+
+    def _array(self) -> Iterator[Any]:
+        """Возвращает элементы массива по одному.
+        :return: Итератор по элементам массива.
+
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
@@ -0,0 +1,119 @@
+import argparse
+import random
+import threading
+import time
+from client import TaskClient
+from server import DEFAULT_HOST, DEFAULT_PORT, Address
+from typing import Dict, List
+
+CATEGORIES = ('Работа', 'Личное', 'Учеба', 'Здоровье', 'Дом')
+PRIORITIES = ('Низкий', 'Средний', 'Высокий')
+
+
+def make_calls(count: int, write_ratio: float, seed: int) -> List:
+    """Создает смесь вызовов: добавление и обновление задач с долей
+    write_ratio, остальные — поиск по категории и ближайшие задачи.
+    :param count: Количество вызовов.
+    :param write_ratio: Доля изменяющих вызовов от 0 до 1.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список пар (имя метода, параметры).
+
+    """
+    generator = random.Random(seed)
+    calls = []
+    for i in range(count):
+        if generator.random() < write_ratio:
+            if i % 2:
+                calls.append(('update_task', {
+                    'task_id': generator.randint(1, 1000),
+                    'status': generator.choice(('Выполнена',
+                                                'Не выполнена'))}))
+            else:
+                calls.append(('add_task', {
+                    'title': f"Задача {seed}-{i}",
+                    'description': "Нагрузочный тест",
+                    'category': generator.choice(CATEGORIES),
+                    'due_date': f"{generator.randint(1, 28):02d}.12.2024",
+                    'priority': generator.choice(PRIORITIES)}))
+        elif i % 2:
+            calls.append(('search_tasks',
+                          {'category': generator.choice(CATEGORIES),
+                           'keyword': str(generator.randint(0, 9))}))
+        else:
+            calls.append(('next_tasks', {'count': 5}))
+    return calls
+
+
+def run_load(address: Address, connections: int = 4, requests: int = 1000,
+             depth: int = 1, batch: int = 1, write_ratio: float = 0.1,
+             seed: int = 0) -> Dict[str, float]:
+    """Отправляет запросы серверу из нескольких соединений одновременно.
+    :param address: Адрес сервера.
+    :param connections: Количество соединений, у каждого свой поток.
+    :param requests: Количество вызовов в каждом соединении.
+    :param depth: Количество запросов, отправляемых без ожидания ответа.
+    :param batch: Количество вызовов в одном пакете JSON-RPC.
+    :param write_ratio: Доля изменяющих вызовов.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Словарь с количеством вызовов, ошибок, временем в секундах и
+        количеством вызовов в секунду.
+
+    """
+    errors = []
+    clients = [TaskClient(address) for _ in range(connections)]
+    plans = [make_calls(requests, write_ratio, seed + number)
+             for number in range(connections)]
+
+    def worker(client: TaskClient, calls: List):
+        if batch > 1:
+            results = []
+            for start in range(0, len(calls), batch):
+                results.extend(client.batch(calls[start:start + batch]))
+        else:
+            results = client.pipeline(calls, depth)
+        errors.extend(result for result in results
+                      if isinstance(result, Exception))
+
+    threads = [threading.Thread(target=worker, args=(client, calls))
+               for client, calls in zip(clients, plans)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    for client in clients:
+        client.close()
+    total = connections * requests
+    return {'requests': total, 'errors': len(errors), 'seconds': seconds,
+            'rps': total / seconds if seconds else 0.0}
+
+
+def main():
+    """Запускает нагрузочный тест сервера из командной строки."""
+    parser = argparse.ArgumentParser(
+        description="Нагрузочный тест сервера задач.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--socket', help="Путь к Unix-сокету вместо TCP.")
+    parser.add_argument('--connections', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=1000,
+                        help="Количество вызовов в каждом соединении.")
+    parser.add_argument('--depth', type=int, default=1,
+                        help="Запросов без ожидания ответа (конвейер).")
+    parser.add_argument('--batch', type=int, default=1,
+                        help="Вызовов в одном пакете JSON-RPC.")
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = run_load(args.socket or (args.host, args.port),
+                      args.connections, args.requests, args.depth,
+                      args.batch, args.write_ratio, args.seed)
+    print(f"Вызовов: {result['requests']}, ошибок: {result['errors']}, "
+          f"время: {result['seconds']:.3f} с, "
+          f"вызовов в секунду: {result['rps']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
+import sys
 from task_manager import TaskManager
 
+# Изменения сохраняются в фоне не чаще одного раза в указанное число секунд.
+AUTOSAVE_INTERVAL = 2.0
+
 
 def main():
     """Основной цикл программы для взаимодействия с пользователем"""
-    manager = TaskManager()
+    # pydoc загружается долго и нужен только в интерактивном режиме.
+    import pydoc
+
+    manager = TaskManager(autosave=AUTOSAVE_INTERVAL, shared=True)
 
     while True:
         print("\nМенеджер задач:")
@@ -22,17 +29,27 @@ def main():
                 print("\tПросмотр задач:")
                 print("\t\t1. Просмотр всех задач")
                 print("\t\t2. Просмотр задач по категориям")
-                print("\t\t3. Назад")
+                print("\t\t3. Ближайшие задачи")
+                print("\t\t4. Назад")
                 choice = input("Выберите опцию: ")
                 if choice == '1':
                     """Просмотр всех задач"""
                     print("\nВсе задачи:")
-                    manager.display_tasks(manager.tasks)
+                    # Поток автосохранения может изменять список задач,
+                    # поэтому под блокировкой чтения снимается копия, а
+                    # пейджер, ожидающий пользователя, ее не держит.
+                    with manager.lock.read():
+                        tasks = list(manager.tasks)
+                    manager.display_tasks(tasks, pager=pydoc.pager)
                 elif choice == '2':
                     """Просмотр задач по категориям"""
                     print("\nЗадачи по категориям:")
-                    manager.display_grouped_tasks()
+                    manager.display_grouped_tasks(pager=pydoc.pager)
                 elif choice == '3':
+                    """Просмотр самых срочных невыполненных задач"""
+                    print("\nБлижайшие задачи:")
+                    manager.display_tasks(manager.next_tasks())
+                elif choice == '4':
                     """Выход из просмотра задач"""
                     print("\nНазад...")
                     break
@@ -132,15 +149,23 @@ def main():
             keyword = input("Поиск по ключевому слову: ")
             category = input("Поиск по категории: ")
             status = input("Поиск по статусу (Выполнена/Не выполнена): ")
-            tasks = manager.search_tasks(None, keyword, category, status)
+            priority = input("Поиск по приоритету (Низкий, Средний, "
+                             "Высокий): ")
+            tasks = manager.search_tasks(None, keyword, category, status,
+                                         priority)
             manager.display_tasks(tasks)
         elif choice == '6':
             """Выход из программы"""
             print("Выход...")
+            manager.close()
             break
         else:
             print("Неверный выбор. Пожалуйста, попробуйте снова.")
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Подкоманды (например, "main.py done 42") выполняются без меню.
+        from cli import main as run_command
+        raise SystemExit(run_command())
     main()
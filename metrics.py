@@ -0,0 +1,256 @@
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, List
+
+# Границы корзин гистограммы в секундах: от 1 мкс до ~2 мин с шагом x2.
+BUCKETS = [2 ** power / 1e6 for power in range(28)]
+PERCENTILES = (50, 90, 99)
+
+
+class Histogram:
+    """Гистограмма задержек с логарифмическими корзинами. Хранит только
+    счетчики корзин, поэтому занимает постоянную память, а процентили
+    оцениваются по верхней границе корзины.
+
+    """
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        """Добавляет замер.
+        :param seconds: Длительность в секундах.
+
+        """
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """Оценивает процентиль задержки.
+        :param percent: Процентиль от 0 до 100.
+        :return: Верхняя граница корзины, в которую попадает процентиль.
+
+        """
+        rank = self.count * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return BUCKETS[bucket] if bucket < len(BUCKETS) else self.max
+        return 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Возвращает сводку по гистограмме.
+        :return: Количество, сумма, среднее, минимум, максимум и процентили
+            в секундах.
+
+        """
+        result = {'count': self.count, 'total': self.total,
+                  'mean': self.total / self.count if self.count else 0.0,
+                  'min': self.min if self.count else 0.0, 'max': self.max}
+        for percent in PERCENTILES:
+            result[f'p{percent}'] = self.percentile(percent)
+        return result
+
+
+class Metrics:
+    """Сборщик метрик TaskManager: гистограммы задержек операций и их фаз
+    (например, validate, index, serialize, write, fsync) и счетчики. Фаза
+    записывается под именем '<операция>.<фаза>' текущей операции потока.
+
+    """
+    enabled = True
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._dump_thread = None
+        self._dump_stop = threading.Event()
+
+    def record(self, name: str, seconds: float):
+        """Добавляет замер в гистограмму.
+        :param name: Имя гистограммы.
+        :param seconds: Длительность в секундах.
+
+        """
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(seconds)
+
+    def increment(self, name: str, value: int = 1):
+        """Увеличивает счетчик.
+        :param name: Имя счетчика.
+        :param value: Величина увеличения.
+
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def _stack(self) -> List[str]:
+        """Возвращает стек выполняемых операций текущего потока."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def operation(self, name: str):
+        """Замеряет операцию и увеличивает счетчик ее вызовов. Вложенные
+        операции (например, search_tasks внутри update_task) замеряются
+        отдельно, а фазы относятся к самой внутренней.
+        :param name: Имя операции.
+
+        """
+        stack = self._stack()
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+            stack.pop()
+            self.increment(f'{name}.calls')
+
+    @contextmanager
+    def phase(self, name: str):
+        """Замеряет фазу текущей операции.
+        :param name: Имя фазы.
+
+        """
+        stack = self._stack()
+        full_name = f'{stack[-1]}.{name}' if stack else name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(full_name, time.perf_counter() - start)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Возвращает снимок метрик.
+        :return: Словарь со сводками гистограмм и значениями счетчиков.
+
+        """
+        with self._lock:
+            return {'latency': {name: histogram.summary() for name, histogram
+                                in sorted(self.histograms.items())},
+                    'counters': dict(sorted(self.counters.items()))}
+
+    def reset(self):
+        """Удаляет все накопленные метрики."""
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def dump(self, filename: str) -> bool:
+        """Атомарно записывает снимок метрик в JSON-файл.
+        :param filename: Путь к файлу.
+        :return: True, если файл успешно записан, иначе False.
+
+        """
+        data = self.stats()
+        data['time'] = time.time()
+        temp_filename = filename + '.tmp'
+        try:
+            with open(temp_filename, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False, indent=4)
+            os.replace(temp_filename, filename)
+        except (IOError, OSError):
+            return False
+        return True
+
+    def start_dump(self, filename: str, interval: float = 60.0):
+        """Запускает фоновый поток, который записывает метрики в файл каждые
+        interval секунд.
+        :param filename: Путь к файлу.
+        :param interval: Период записи в секундах.
+
+        """
+        self.stop_dump()
+        self._dump_stop.clear()
+
+        def run():
+            while not self._dump_stop.wait(interval):
+                self.dump(filename)
+            self.dump(filename)
+
+        self._dump_thread = threading.Thread(target=run, daemon=True,
+                                             name='metrics-dump')
+        self._dump_thread.start()
+
+    def stop_dump(self):
+        """Останавливает фоновую запись, записав метрики в последний раз."""
+        if self._dump_thread is not None:
+            self._dump_stop.set()
+            self._dump_thread.join()
+            self._dump_thread = None
+
+
+class NullMetrics:
+    """Отключенные метрики: все методы ничего не делают, а замеры
+    возвращают один и тот же пустой контекст.
+
+    """
+    enabled = False
+    _context = nullcontext()
+
+    def record(self, name: str, seconds: float):
+        pass
+
+    def increment(self, name: str, value: int = 1):
+        pass
+
+    def operation(self, name: str):
+        return self._context
+
+    def phase(self, name: str):
+        return self._context
+
+    def stats(self) -> Dict[str, Dict]:
+        return {'latency': {}, 'counters': {}}
+
+    def reset(self):
+        pass
+
+    def stop_dump(self):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+def instrumented(name: str) -> Callable:
+    """Декоратор метода TaskManager, который замеряет вызов как операцию
+    name и считает неудачные вызовы (вернувшие False или None). При
+    отключенных метриках метод вызывается напрямую.
+    :param name: Имя операции.
+    :return: Декоратор.
+
+    """
+    def decorate(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if not metrics.enabled:
+                return method(self, *args, **kwargs)
+            with metrics.operation(name):
+                result = method(self, *args, **kwargs)
+            if result is False or result is None:
+                metrics.increment(f'{name}.failures')
+            return result
+        return wrapper
+    return decorate
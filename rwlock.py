@@ -0,0 +1,121 @@
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable
+
+
+class ReadWriteLock:
+    """Блокировка чтения и записи для потоков одного процесса. Блокировку
+    чтения одновременно могут держать несколько потоков, блокировку записи —
+    только один, причем в это время читать никто не может. Ожидающий
+    писатель пропускается вперед новых читателей, чтобы частое чтение не
+    откладывало запись бесконечно.
+
+    Обе блокировки повторно входимы: поток, который держит блокировку
+    записи, может снова захватить ее или захватить блокировку чтения, а
+    поток, который читает, может продолжить чтение. Захватить запись, держа
+    только чтение, нельзя: два таких потока ждали бы друг друга.
+
+    """
+    def __init__(self):
+        """Инициализирует блокировку."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self):
+        """Захватывает блокировку чтения, ожидая завершения записи."""
+        depth = getattr(self._local, 'depth', 0)
+        with self._condition:
+            if not depth and self._writer != threading.get_ident():
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+        self._local.depth = depth + 1
+
+    def release_read(self):
+        """Освобождает блокировку чтения."""
+        self._local.depth -= 1
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """Захватывает блокировку записи, ожидая завершения чтения и записи
+        в других потоках.
+
+        """
+        ident = threading.get_ident()
+        with self._condition:
+            if self._writer == ident:
+                self._write_depth += 1
+                return
+            if getattr(self._local, 'depth', 0):
+                raise RuntimeError('cannot upgrade a read lock to a write '
+                                   'lock')
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = ident
+            self._write_depth = 1
+
+    def release_write(self):
+        """Освобождает блокировку записи."""
+        with self._condition:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        """Удерживает блокировку чтения на время блока with."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """Удерживает блокировку записи на время блока with."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def read_locked(method: Callable) -> Callable:
+    """Декоратор метода, который выполняется под блокировкой чтения
+    self.lock.
+    :param method: Метод объекта с атрибутом lock типа ReadWriteLock.
+    :return: Обернутый метод.
+
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.read():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def write_locked(method: Callable) -> Callable:
+    """Декоратор метода, который выполняется под блокировкой записи
+    self.lock.
+    :param method: Метод объекта с атрибутом lock типа ReadWriteLock.
+    :return: Обернутый метод.
+
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.write():
+            return method(self, *args, **kwargs)
+    return wrapper
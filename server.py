@@ -0,0 +1,305 @@
+import argparse
+import contextlib
+import inspect
+import json
+import os
+import socket
+import socketserver
+import sys
+from task_manager import TaskManager
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+RECV_SIZE = 65536
+
+# Коды ошибок JSON-RPC 2.0.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+Address = Union[str, Tuple[str, int]]
+
+
+class InvalidParams(Exception):
+    """Параметры вызова имеют недопустимые значения (ошибка
+    INVALID_PARAMS).
+
+    """
+
+
+class TaskRpc:
+    """Обработчик запросов JSON-RPC 2.0 к менеджеру задач. Запрос — объект
+    {"jsonrpc": "2.0", "method": ..., "params": ..., "id": ...} или массив
+    таких объектов (пакет); ответы на пакет возвращаются одним массивом.
+    На запросы без id (уведомления) ответ не отправляется.
+
+    Методы: add_task, update_task, delete_task, search_tasks, next_tasks и
+    stats с теми же параметрами, что у TaskManager. Задачи передаются
+    словарями, как в файле задач.
+
+    """
+    METHODS = ('add_task', 'update_task', 'delete_task', 'search_tasks',
+               'next_tasks', 'stats')
+
+    def __init__(self, manager: TaskManager):
+        """Инициализирует обработчик.
+        :param manager: Менеджер задач, с которым работают все соединения.
+
+        """
+        self.manager = manager
+
+    def handle(self, line: bytes) -> Optional[bytes]:
+        """Обрабатывает одну строку с запросом или пакетом запросов.
+        :param line: Строка JSON без перевода строки.
+        :return: Строка ответа с переводом строки или None, если отвечать
+            не нужно.
+
+        """
+        if not line.strip():
+            return None
+        try:
+            message = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            response = error_response(None, PARSE_ERROR, "Parse error")
+        else:
+            if isinstance(message, list) and message:
+                response = [result for result in map(self.call, message)
+                            if result is not None] or None
+            elif isinstance(message, list):
+                response = error_response(None, INVALID_REQUEST,
+                                          "Invalid Request")
+            else:
+                response = self.call(message)
+        if response is None:
+            return None
+        return json.dumps(response, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8') + b'\n'
+
+    def call(self, request: Any) -> Optional[Dict]:
+        """Выполняет один запрос.
+        :param request: Разобранный объект запроса.
+        :return: Объект ответа или None для уведомления.
+
+        """
+        if (not isinstance(request, dict) or
+                request.get('jsonrpc') != '2.0' or
+                not isinstance(request.get('method'), str)):
+            return error_response(None, INVALID_REQUEST, "Invalid Request")
+        request_id = request.get('id')
+        name = request['method']
+        params = request.get('params', {})
+        if name not in self.METHODS:
+            response = error_response(request_id, METHOD_NOT_FOUND,
+                                      f"Method not found: {name}")
+        elif not isinstance(params, (dict, list)):
+            response = error_response(request_id, INVALID_PARAMS,
+                                      "Invalid params")
+        else:
+            method = getattr(self, name)
+            args, kwargs = ((params, {}) if isinstance(params, list)
+                            else ((), params))
+            try:
+                inspect.signature(method).bind(*args, **kwargs)
+            except TypeError as error:
+                response = error_response(request_id, INVALID_PARAMS,
+                                          str(error))
+            else:
+                try:
+                    response = {'jsonrpc': '2.0',
+                                'result': method(*args, **kwargs),
+                                'id': request_id}
+                except InvalidParams as error:
+                    response = error_response(request_id, INVALID_PARAMS,
+                                              str(error))
+                except Exception as error:
+                    response = error_response(request_id, INTERNAL_ERROR,
+                                              str(error))
+        return response if 'id' in request else None
+
+    def add_task(self, title: str, description: str, category: str,
+                 due_date: str, priority: str) -> Union[int, bool]:
+        """Добавляет задачу.
+        :return: ID новой задачи или False, если задача не добавлена.
+
+        """
+        with self.manager.lock.write():
+            if not self.manager.add_task(title, description, category,
+                                         due_date, priority):
+                return False
+            return self.manager.next_id - 1
+
+    def update_task(self, task_id: int, title: str = None,
+                    description: str = None, category: str = None,
+                    due_date: str = None, priority: str = None,
+                    status: str = None) -> bool:
+        """Обновляет задачу (см. TaskManager.update_task)."""
+        return self.manager.update_task(task_id, title, description,
+                                        category, due_date, priority, status)
+
+    def delete_task(self, task_id: int = None, category: str = None) -> bool:
+        """Удаляет задачи (см. TaskManager.delete_task)."""
+        return self.manager.delete_task(task_id, category)
+
+    def search_tasks(self, task_id: int = None, keyword: str = None,
+                     category: str = None, status: str = None,
+                     priority: str = None, due_before: str = None,
+                     due_after: str = None, overdue: bool = False
+                     ) -> List[Dict]:
+        """Ищет задачи (см. TaskManager.search_tasks).
+        :return: Список найденных задач в виде словарей.
+
+        """
+        with self.manager.lock.read():
+            return [task.to_dict() for task in self.manager.search_tasks(
+                task_id, keyword, category, status, priority, due_before,
+                due_after, overdue)]
+
+    def next_tasks(self, count: int = 10) -> List[Dict]:
+        """Возвращает самые срочные задачи (см. TaskManager.next_tasks).
+        :return: Список задач в виде словарей.
+        :raises InvalidParams: Если count не целое неотрицательное число.
+
+        """
+        if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+            raise InvalidParams("count должен быть целым неотрицательным "
+                                "числом")
+        with self.manager.lock.read():
+            return [task.to_dict()
+                    for task in self.manager.next_tasks(count)]
+
+    def stats(self) -> Dict[str, Dict]:
+        """Возвращает метрики менеджера задач (см. TaskManager.stats)."""
+        return self.manager.stats()
+
+
+def error_response(request_id: Any, code: int, message: str) -> Dict:
+    """Создает объект ответа с ошибкой JSON-RPC.
+    :param request_id: ID запроса или None.
+    :param code: Код ошибки.
+    :param message: Описание ошибки.
+    :return: Объект ответа.
+
+    """
+    return {'jsonrpc': '2.0', 'error': {'code': code, 'message': message},
+            'id': request_id}
+
+
+class RpcRequestHandler(socketserver.BaseRequestHandler):
+    """Обработчик соединения. Запросы разделяются переводом строки, и
+    клиент может отправлять следующие запросы, не дожидаясь ответов.
+    Ответы на все запросы, полученные одним чтением из сокета, отправляются
+    одной записью в том же порядке.
+
+    """
+    def handle(self):
+        """Читает запросы из сокета и отправляет ответы, пока клиент не
+        закроет соединение.
+
+        """
+        rpc = self.server.rpc
+        buffer = b''
+        while True:
+            try:
+                data = self.request.recv(RECV_SIZE)
+            except ConnectionError:
+                return
+            if not data:
+                return
+            *lines, buffer = (buffer + data).split(b'\n')
+            responses = [response for response in map(rpc.handle, lines)
+                         if response is not None]
+            if responses:
+                try:
+                    self.request.sendall(b''.join(responses))
+                except ConnectionError:
+                    return
+
+
+class TaskTCPServer(socketserver.ThreadingTCPServer):
+    """Сервер JSON-RPC на TCP-сокете. Каждое соединение обслуживается
+    отдельным потоком.
+
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def server_bind(self):
+        """Отключает задержку отправки коротких ответов (алгоритм Нейгла)."""
+        super().server_bind()
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class TaskUnixServer(socketserver.ThreadingUnixStreamServer):
+        """Сервер JSON-RPC на Unix-сокете."""
+        daemon_threads = True
+else:
+    TaskUnixServer = None
+
+
+def create_server(manager: TaskManager, address: Address
+                  ) -> socketserver.BaseServer:
+    """Создает сервер JSON-RPC для менеджера задач. Сервер запускается
+    вызовом serve_forever и останавливается вызовом shutdown.
+    :param manager: Менеджер задач.
+    :param address: Путь к Unix-сокету или кортеж (хост, порт). Порт 0 —
+        любой свободный (см. server_address).
+    :return: Объект сервера.
+
+    """
+    if isinstance(address, str):
+        if TaskUnixServer is None:
+            raise ValueError("Unix-сокеты не поддерживаются в этой системе")
+        if os.path.exists(address):
+            os.remove(address)
+        server = TaskUnixServer(address, RpcRequestHandler)
+    else:
+        server = TaskTCPServer(address, RpcRequestHandler)
+    server.rpc = TaskRpc(manager)
+    return server
+
+
+def main():
+    """Запускает сервер JSON-RPC из командной строки."""
+    parser = argparse.ArgumentParser(
+        description="Сервер JSON-RPC для менеджера задач.")
+    parser.add_argument('--tasks-file', default='tasks.json')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--socket', help="Путь к Unix-сокету вместо TCP.")
+    parser.add_argument('--journal', action='store_true',
+                        help="Сохранять изменения в журнал.")
+    parser.add_argument('--shared', action='store_true',
+                        help="Разрешить другим процессам работать с файлом.")
+    parser.add_argument('--autosave', type=float, default=1.0,
+                        help="Промежуток между сохранениями в секундах.")
+    parser.add_argument('--metrics', action='store_true',
+                        help="Собирать метрики операций (метод stats).")
+    parser.add_argument('--verbose', action='store_true',
+                        help="Выводить сообщения менеджера задач.")
+    args = parser.parse_args()
+    address = args.socket or (args.host, args.port)
+
+    # Сообщения менеджера о каждой операции замедляют сервер.
+    output = sys.stdout if args.verbose else open(os.devnull, 'w')
+    with contextlib.redirect_stdout(output):
+        manager = TaskManager(filename=args.tasks_file, journal=args.journal,
+                              shared=args.shared, metrics=args.metrics,
+                              autosave=args.autosave)
+        server = create_server(manager, address)
+        print(f"Сервер запущен: {address}.", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            manager.close()
+            print("Сервер остановлен.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
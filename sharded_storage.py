@@ -0,0 +1,285 @@
+import json
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from indexes import normalize
+from storage import Storage
+from task import Task
+from task_list import TaskList
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+ROW_FIELDS = ('id', 'title', 'description', 'category', 'due_date',
+              'priority', 'status')
+
+
+def load_shard(filename: str) -> List[Tuple]:
+    """Читает файл шарда. Выполняется в отдельном процессе, поэтому
+    возвращает кортежи, которые быстро передаются между процессами.
+    :param filename: Путь к файлу шарда.
+    :return: Список кортежей с полями задач.
+
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return []
+    return [tuple(task[field] for field in ROW_FIELDS)
+            for task in data.get('tasks', [])]
+
+
+def write_json(filename: str, data: Dict):
+    """Атомарно записывает JSON-файл через временный файл, который после
+    os.fsync заменяет исходный.
+    :param filename: Путь к файлу.
+    :param data: Данные для записи.
+
+    """
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_filename, filename)
+
+
+class ShardedStorage(Storage):
+    """Хранилище задач, разделенное на шарды по хешу категории. Задачи одной
+    категории всегда лежат в одном шарде, поэтому изменение перезаписывает
+    только затронутые шарды, а загрузка разбирает шарды параллельно в
+    нескольких процессах. Следующий ID и количество шардов хранятся в
+    небольшом файле manifest.json.
+
+    Измененные шарды записываются в новые файлы с номером поколения в
+    имени, а manifest.json, в котором перечислены поколения всех шардов,
+    заменяется последним. Поэтому сбой во время записи оставляет
+    предыдущее согласованное состояние: старый manifest.json ссылается на
+    старые файлы шардов, которые удаляются только после его замены.
+
+    """
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, directory: str = 'tasks', shards: int = 16,
+                 workers: int = None):
+        """Инициализирует хранилище.
+        :param directory: Каталог с файлами шардов.
+        :param shards: Количество шардов для нового хранилища. Для
+            существующего используется значение из manifest.json.
+        :param workers: Количество процессов для загрузки. None — по числу
+            процессоров, 1 — загрузка в текущем процессе.
+
+        """
+        self.filename = directory
+        self.directory = directory
+        self.shards = shards
+        self.workers = workers
+        # Последнее записанное поколение и поколение файла каждого шарда
+        # (0 — файл без номера поколения).
+        self.generation = 0
+        self._generations = [0] * shards
+        self._reset_layout()
+
+    def _reset_layout(self):
+        """Очищает сведения о том, в каком шарде лежит каждая задача."""
+        self._members: List[Dict[int, None]] = [{} for _ in
+                                                range(self.shards)]
+        self._location: Dict[int, int] = {}
+        # Шарды, изменения которых не удалось записать: они записываются
+        # вместе со следующими изменениями.
+        self._unwritten: Set[int] = set()
+
+    def _place(self, task: Task) -> int:
+        """Запоминает шард задачи.
+        :param task: Задача.
+        :return: Номер шарда.
+
+        """
+        shard = self.shard_of(task)
+        self._members[shard][task.id] = None
+        self._location[task.id] = shard
+        return shard
+
+    def _unplace(self, task_id: int) -> Optional[int]:
+        """Забывает шард задачи.
+        :param task_id: ID задачи.
+        :return: Номер шарда, в котором лежала задача, или None.
+
+        """
+        shard = self._location.pop(task_id, None)
+        if shard is not None:
+            self._members[shard].pop(task_id, None)
+        return shard
+
+    def shard_of(self, task: Task) -> int:
+        """Определяет шард задачи по категории без учета регистра.
+        :param task: Задача.
+        :return: Номер шарда.
+
+        """
+        key = normalize(task.category)
+        return zlib.crc32(str(key).encode('utf-8')) % self.shards
+
+    def shard_path(self, shard: int, generation: int = None) -> str:
+        """Возвращает путь к файлу шарда.
+        :param shard: Номер шарда.
+        :param generation: Поколение файла. None — текущее.
+        :return: Путь к файлу.
+
+        """
+        if generation is None:
+            generation = self._generations[shard]
+        if not generation:
+            return os.path.join(self.directory, f'shard-{shard:03d}.json')
+        return os.path.join(self.directory,
+                            f'shard-{shard:03d}-{generation}.json')
+
+    def load(self, progress: Callable[[int, int], None] = None
+             ) -> Optional[Tuple[TaskList, int]]:
+        """Загружает все шарды, при необходимости параллельно. Задачи
+        упорядочиваются по ID.
+        :param progress: Функция, которая вызывается после каждого шарда с
+            количеством загруженных задач и числом загруженных шардов.
+        :return: Кортеж из списка задач и следующего ID или None.
+
+        """
+        try:
+            with open(os.path.join(self.directory, self.MANIFEST), 'r',
+                      encoding='utf-8') as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            print(f"Каталог '{self.directory}' не найден. "
+                  f"Будет создан новый каталог.")
+            return None
+        except json.JSONDecodeError:
+            print(f"Ошибка декодирования JSON в файле '{self.MANIFEST}'. "
+                  f"Файл может быть поврежден.")
+            return None
+
+        self.shards = manifest.get('shards', self.shards)
+        self.generation = manifest.get('generation', 0)
+        self._generations = manifest.get('generations', [0] * self.shards)
+        self._reset_layout()
+        paths = [self.shard_path(shard) for shard in range(self.shards)]
+        workers = min(self.workers or os.cpu_count() or 1, len(paths))
+        try:
+            if workers <= 1:
+                results = map(load_shard, paths)
+                tasks = self._collect(results, progress)
+            else:
+                with ProcessPoolExecutor(workers) as pool:
+                    results = pool.map(load_shard, paths)
+                    tasks = self._collect(results, progress)
+        except (json.JSONDecodeError, KeyError):
+            print(f"Ошибка декодирования шарда в каталоге "
+                  f"'{self.directory}'. Файл может быть поврежден.")
+            self._reset_layout()
+            return None
+        print("Данные успешно загружены.")
+        return tasks, manifest.get('next_id', 1)
+
+    def _collect(self, results: Iterable[List[Tuple]],
+                 progress: Callable[[int, int], None]) -> TaskList:
+        """Создает задачи из прочитанных шардов.
+        :param results: Кортежи с полями задач по шардам.
+        :param progress: Функция для отчета о ходе загрузки или None.
+        :return: Список задач, упорядоченный по ID.
+
+        """
+        tasks = []
+        for shard, rows in enumerate(results):
+            for row in rows:
+                task = Task(*row)
+                tasks.append(task)
+                self._members[shard][task.id] = None
+                self._location[task.id] = shard
+            if progress is not None:
+                progress(len(tasks), shard + 1)
+        tasks.sort(key=lambda task: task.id)
+        return TaskList(tasks)
+
+    def _write_shards(self, shards: Set[int], tasks: TaskList,
+                      next_id: int):
+        """Записывает указанные шарды в файлы следующего поколения, затем
+        заменяет manifest.json и удаляет прежние файлы этих шардов.
+        :param shards: Номера шардов.
+        :param tasks: Текущий список задач.
+        :param next_id: Следующий ID задачи.
+
+        """
+        shards = self._unwritten = shards | self._unwritten
+        os.makedirs(self.directory, exist_ok=True)
+        generation = self.generation + 1
+        generations = list(self._generations)
+        for shard in sorted(shards):
+            shard_tasks = map(tasks.get, self._members[shard])
+            write_json(self.shard_path(shard, generation), {
+                'tasks': [task.to_dict() for task in shard_tasks
+                          if task is not None]})
+            generations[shard] = generation
+        write_json(os.path.join(self.directory, self.MANIFEST),
+                   {'next_id': next_id, 'shards': self.shards,
+                    'generation': generation, 'generations': generations})
+        old_paths = [self.shard_path(shard) for shard in shards]
+        self.generation = generation
+        self._generations = generations
+        self._unwritten = set()
+        for path in old_paths:
+            with suppress(OSError):
+                os.remove(path)
+
+    def save(self, tasks: Iterable[Task], next_id: int) -> bool:
+        """Перезаписывает все шарды.
+        :param tasks: Задачи для сохранения.
+        :param next_id: Следующий ID задачи.
+        :return: True, если данные успешно сохранены, иначе False.
+
+        """
+        if not isinstance(tasks, TaskList):
+            tasks = TaskList(tasks)
+        self._reset_layout()
+        for task in tasks:
+            self._place(task)
+        try:
+            self._write_shards(set(range(self.shards)), tasks, next_id)
+        except (IOError, OSError):
+            print(f"Не удалось сохранить обновленный список задач в каталог "
+                  f"'{self.directory}'.")
+            return False
+        print(f"Обновленный список задач успешно сохранен в каталог "
+              f"'{self.directory}'.")
+        return True
+
+    def write(self, records: List[Dict], tasks: TaskList,
+              next_id: int) -> bool:
+        """Перезаписывает только шарды, затронутые изменениями. При смене
+        категории задача переносится между шардами, и оба становятся
+        измененными.
+        :param records: Список записей об изменениях.
+        :param tasks: Текущий список задач после изменений.
+        :param next_id: Следующий ID задачи.
+        :return: True, если изменения успешно сохранены, иначе False.
+
+        """
+        dirty = set()
+        for record in records:
+            if record['op'] == 'delete':
+                task_ids = record['ids']
+            elif record['op'] == 'add':
+                task_ids = [record['task']['id']]
+            else:
+                task_ids = [record['id']]
+            for task_id in task_ids:
+                old_shard = self._unplace(task_id)
+                if old_shard is not None:
+                    dirty.add(old_shard)
+                task = tasks.get(task_id)
+                if task is not None:
+                    dirty.add(self._place(task))
+        try:
+            self._write_shards(dirty, tasks, next_id)
+        except (IOError, OSError):
+            print(f"Не удалось сохранить изменения в каталог "
+                  f"'{self.directory}'.")
+            return False
+        return True
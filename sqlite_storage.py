@@ -0,0 +1,216 @@
+import sqlite3
+from datetime import date
+from indexes import fold, keyword_words, normalize
+from storage import Storage
+from task import Task, parse_due_date
+from task_list import TaskList
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+COLUMNS = ('id', 'title', 'description', 'category', 'due_date', 'priority',
+           'status')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    due_date TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    category_key TEXT,
+    status_key TEXT,
+    priority_key TEXT,
+    due_ordinal INTEGER,
+    search_key TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_category ON tasks (category_key);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status_key);
+CREATE INDEX IF NOT EXISTS tasks_priority ON tasks (priority_key);
+CREATE INDEX IF NOT EXISTS tasks_due ON tasks (due_ordinal);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+UPSERT = ("INSERT OR REPLACE INTO tasks (id, title, description, category, "
+          "due_date, priority, status, category_key, status_key, "
+          "priority_key, due_ordinal, search_key) "
+          "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+
+def task_row(task: Task) -> Tuple:
+    """Преобразует задачу в строку таблицы tasks.
+    :param task: Задача.
+    :return: Кортеж значений столбцов.
+
+    """
+    return (task.id, task.title, task.description, task.category,
+            task.due_date, task.priority, task.status,
+            normalize(task.category), normalize(task.status),
+            normalize(task.priority), task.due_ordinal,
+            f'{fold(task.title)}\n{fold(task.description)}')
+
+
+class SqliteStorage(Storage):
+    """Хранилище задач в базе SQLite. Изменение одной задачи записывается как
+    изменение одной строки, а поиск выполняется запросом к индексированным
+    столбцам без загрузки остальных задач. Значения для поиска без учета
+    регистра хранятся в отдельных столбцах, так как lower() в SQLite
+    работает только с ASCII. TaskManager с lazy_indexes выполняет поиск
+    этим запросом, пока задачи не понадобятся целиком.
+
+    """
+    supports_search = True
+
+    def __init__(self, filename: str = 'tasks.db'):
+        """Открывает базу данных и при необходимости создает таблицы.
+        :param filename: Путь к файлу базы данных.
+
+        """
+        self.filename = filename
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        """Закрывает соединение с базой данных."""
+        self.connection.close()
+
+    def _next_id(self) -> Optional[int]:
+        """Читает следующий ID задачи из таблицы meta.
+        :return: Следующий ID или None, если он еще не сохранен.
+
+        """
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        return row[0] if row else None
+
+    def load(self, progress: Callable[[int, int], None] = None
+             ) -> Optional[Tuple[TaskList, int]]:
+        """Загружает все задачи из базы данных.
+        :param progress: Не используется.
+        :return: Кортеж из списка задач и следующего ID или None, если база
+            пуста или недоступна.
+
+        """
+        try:
+            next_id = self._next_id()
+            if next_id is None:
+                print(f"База данных '{self.filename}' пуста. "
+                      f"Будет создан новый список задач.")
+                return None
+            cursor = self.connection.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM tasks ORDER BY id")
+            tasks = TaskList(Task(*row) for row in cursor)
+        except sqlite3.Error:
+            print(f"Ошибка чтения базы данных '{self.filename}'.")
+            return None
+        print("Данные успешно загружены.")
+        return tasks, next_id
+
+    def save(self, tasks: Iterable[Task], next_id: int) -> bool:
+        """Полностью перезаписывает таблицу задач.
+        :param tasks: Задачи для сохранения.
+        :param next_id: Следующий ID задачи.
+        :return: True, если данные успешно сохранены, иначе False.
+
+        """
+        try:
+            with self.connection:
+                self.connection.execute("DELETE FROM tasks")
+                self.connection.executemany(UPSERT,
+                                            (task_row(task) for task in tasks))
+                self._save_next_id(next_id)
+        except sqlite3.Error:
+            print(f"Не удалось сохранить обновленный список задач в базу "
+                  f"данных '{self.filename}'.")
+            return False
+        print(f"Обновленный список задач успешно сохранен в базу данных "
+              f"'{self.filename}'.")
+        return True
+
+    def _save_next_id(self, next_id: int):
+        """Сохраняет следующий ID задачи в таблицу meta.
+        :param next_id: Следующий ID задачи.
+
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)",
+            (next_id,))
+
+    def write(self, records: List[Dict], tasks: TaskList,
+              next_id: int) -> bool:
+        """Применяет изменения построчно в одной транзакции: добавленные и
+        измененные задачи записываются целиком, удаленные удаляются по ID.
+        :param records: Список записей об изменениях.
+        :param tasks: Текущий список задач после изменений.
+        :param next_id: Следующий ID задачи.
+        :return: True, если изменения успешно сохранены, иначе False.
+
+        """
+        try:
+            with self.metrics.phase('write'), self.connection:
+                for record in records:
+                    if record['op'] == 'delete':
+                        self.connection.executemany(
+                            "DELETE FROM tasks WHERE id = ?",
+                            ((task_id,) for task_id in record['ids']))
+                        continue
+                    task_id = (record['task']['id'] if record['op'] == 'add'
+                               else record['id'])
+                    task = tasks.get(task_id)
+                    if task is not None:
+                        self.connection.execute(UPSERT, task_row(task))
+                self._save_next_id(next_id)
+        except sqlite3.Error:
+            print(f"Не удалось сохранить изменения в базу данных "
+                  f"'{self.filename}'.")
+            return False
+        return True
+
+    def search(self, task_id: int = None, keyword: str = None,
+               category: str = None, status: str = None,
+               priority: str = None, due_before: str = None,
+               due_after: str = None, overdue: bool = False) -> Iterator[Task]:
+        """Ищет задачи запросом к базе данных. Условия совпадают с
+        TaskManager.search_tasks: подстрока в категории, точное совпадение
+        статуса и приоритета, все слова запроса в названии или описании,
+        диапазон сроков включительно. Некорректная дата дает пустой
+        результат.
+        :return: Итератор по найденным задачам, упорядоченным по ID.
+
+        """
+        conditions, params = [], []
+        if task_id:
+            conditions.append("id = ?")
+            params.append(task_id)
+        if category:
+            conditions.append("instr(category_key, ?) > 0")
+            params.append(normalize(category))
+        if status:
+            conditions.append("status_key = ?")
+            params.append(normalize(status))
+        if priority:
+            conditions.append("priority_key = ?")
+            params.append(normalize(priority))
+        if keyword:
+            for word in keyword_words(keyword):
+                conditions.append("instr(search_key, ?) > 0")
+                params.append(word)
+        for value, condition in ((due_after, "due_ordinal >= ?"),
+                                 (due_before, "due_ordinal <= ?")):
+            if value:
+                conditions.append(condition)
+                params.append(parse_due_date(value))
+        if overdue:
+            conditions.append("due_ordinal < ? AND status_key != 'выполнена'")
+            params.append(date.today().toordinal())
+        query = f"SELECT {', '.join(COLUMNS)} FROM tasks"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id"
+        for row in self.connection.execute(query, params):
+            yield Task(*row)
@@ -0,0 +1,442 @@
+import json
+import os
+import re
+from contextlib import nullcontext, suppress
+from file_lock import FileLock
+from journal import Journal
+from json_stream import JsonArrayStream
+from metrics import NULL_METRICS
+from task import Task
+from task_list import TaskList
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def file_signature(file) -> Optional[Tuple[int, int]]:
+    """Возвращает размер и время изменения открытого файла.
+    :param file: Открытый файл.
+    :return: Кортеж (размер, время изменения в наносекундах) или None, если
+        у файла нет дескриптора.
+
+    """
+    try:
+        stat = os.fstat(file.fileno())
+    except (AttributeError, OSError, TypeError, ValueError):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def stat_signature(filename: str) -> Optional[Tuple[int, int]]:
+    """Возвращает размер и время изменения файла.
+    :param filename: Путь к файлу.
+    :return: Кортеж (размер, время изменения в наносекундах) или None, если
+        файла нет.
+
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class Storage:
+    """Базовый класс хранилища задач. TaskManager работает с данными только
+    через этот интерфейс.
+
+    Изменения передаются хранилищу в виде записей:
+    {'op': 'add', 'task': {...}}, {'op': 'update', 'id': ..., 'fields': {...}}
+    и {'op': 'delete', 'ids': [...]}; в каждой записи есть 'next_id'.
+
+    """
+    filename = None
+    metrics = NULL_METRICS
+    # True, если хранилище выполняет поиск само (см. search): тогда
+    # TaskManager с lazy_indexes не загружает задачи до первого изменения.
+    supports_search = False
+
+    def instrument(self, metrics):
+        """Подключает сборщик метрик, в который хранилище записывает фазы
+        сохранения.
+        :param metrics: Объект Metrics или NULL_METRICS.
+
+        """
+        self.metrics = metrics
+
+    def load(self, progress: Callable[[int, int], None] = None
+             ) -> Optional[Tuple[TaskList, int]]:
+        """Загружает задачи из хранилища.
+        :param progress: Функция для отчета о ходе загрузки или None.
+        :return: Кортеж из списка задач и следующего ID или None, если
+            загрузить данные не удалось.
+
+        """
+        raise NotImplementedError
+
+    def save(self, tasks: Iterable[Task], next_id: int) -> bool:
+        """Полностью перезаписывает хранилище.
+        :param tasks: Задачи для сохранения.
+        :param next_id: Следующий ID задачи.
+        :return: True, если данные успешно сохранены, иначе False.
+
+        """
+        raise NotImplementedError
+
+    def write(self, records: List[Dict], tasks: TaskList,
+              next_id: int) -> bool:
+        """Сохраняет изменения, описанные записями. По умолчанию хранилище
+        перезаписывается полностью.
+        :param records: Список записей об изменениях.
+        :param tasks: Текущий список задач после изменений.
+        :param next_id: Следующий ID задачи.
+        :return: True, если изменения успешно сохранены, иначе False.
+
+        """
+        return self.save(tasks, next_id)
+
+    def search(self, task_id: int = None, keyword: str = None,
+               category: str = None, status: str = None,
+               priority: str = None, due_before: str = None,
+               due_after: str = None, overdue: bool = False
+               ) -> Optional[Iterator[Task]]:
+        """Ищет задачи непосредственно в хранилище, не загружая остальные.
+        Параметры совпадают с TaskManager.search_tasks.
+        :return: Итератор по найденным задачам или None, если хранилище не
+            поддерживает поиск.
+
+        """
+        return None
+
+    def locked(self, shared: bool = False):
+        """Возвращает контекст блокировки хранилища для согласования доступа
+        нескольких процессов. По умолчанию хранилище не блокируется.
+        :param shared: Если True, блокировка разделяемая (для чтения).
+        :return: Контекстный менеджер.
+
+        """
+        return nullcontext()
+
+    def changes(self) -> Optional[List[Dict]]:
+        """Возвращает изменения, сохраненные другими процессами после
+        последней загрузки или записи этим объектом. Вызывается под
+        блокировкой (см. locked).
+        :return: Список записей об изменениях (пустой, если изменений нет)
+            или None, если хранилище перезаписано целиком и его нужно
+            загрузить заново.
+
+        """
+        return []
+
+    def poll(self) -> Optional[List[Dict]]:
+        """Проверяет, изменилось ли хранилище после последней загрузки или
+        записи этим объектом, в том числе без режима совместного доступа.
+        Результат такой же, как у changes. По умолчанию изменения не
+        отслеживаются.
+        :return: Список записей об изменениях, пустой список или None.
+
+        """
+        return []
+
+    def close(self):
+        """Освобождает ресурсы хранилища."""
+
+
+class JsonStorage(Storage):
+    """Хранилище задач в JSON-файле вида {"tasks": [...], "next_id": ...}.
+    Может дописывать изменения в журнал рядом с файлом вместо его полной
+    перезаписи и разбирать файл потоково.
+
+    В режиме совместного доступа (shared) с файлом могут одновременно
+    работать несколько процессов. Доступ согласуется рекомендательной
+    блокировкой файла filename + '.lock', изменения дописываются в журнал,
+    а снимок хранит номер версии {"version": ..., "tasks": [...], ...},
+    который увеличивается при каждой перезаписи. Перед записью процесс
+    дочитывает из журнала чужие изменения (см. changes), а по изменившейся
+    версии узнает, что снимок перезаписан и данные нужно загрузить заново.
+
+    Файл, рядом с которым уже есть журнал или файл блокировки, открывается
+    с журналом или в режиме совместного доступа независимо от параметров,
+    иначе записи журнала, еще не вошедшие в снимок, были бы потеряны.
+
+    """
+    PROGRESS_EVERY = 10000
+    VERSION_RE = re.compile(rb'\s*\{\s*"version":\s*(\d+)')
+
+    def __init__(self, filename: str = 'tasks.json', journal: bool = False,
+                 compact_threshold: int = 10000, stream_load: bool = False,
+                 shared: bool = False, fsync: bool = False):
+        """Инициализирует хранилище.
+        :param filename: Путь к JSON-файлу с задачами.
+        :param journal: Если True, изменения дописываются в журнал рядом со
+            снимком вместо полной перезаписи файла.
+        :param compact_threshold: Количество записей в журнале, после которого
+            снимок перезаписывается, а журнал очищается.
+        :param stream_load: Если True, файл разбирается потоково, по одной
+            задаче, без загрузки всего документа в память.
+        :param shared: Если True, включается режим совместного доступа
+            нескольких процессов. Он всегда использует журнал.
+        :param fsync: Если True, после каждой записи в журнал и перед
+            заменой снимка вызывается os.fsync, и подтвержденные изменения
+            переживают сбой системы. Без него снимок все равно заменяется
+            атомарно, поэтому сбой программы не повреждает данные.
+
+        """
+        self.filename = filename
+        shared = shared or os.path.exists(filename + '.lock')
+        journal = journal or os.path.exists(filename + '.journal')
+        self.shared = shared
+        self.fsync = fsync
+        self.journal = (Journal(filename + '.journal', fsync)
+                        if journal or shared else None)
+        self.compact_threshold = compact_threshold
+        self.stream_load = stream_load
+        self.lock = FileLock(filename + '.lock') if shared else None
+        # Версия снимка, загруженная или записанная этим объектом, и его
+        # размер и время изменения (см. poll).
+        self.version = 0
+        self.snapshot_stat = None
+
+    def instrument(self, metrics):
+        """Подключает сборщик метрик к хранилищу и журналу.
+        :param metrics: Объект Metrics или NULL_METRICS.
+
+        """
+        self.metrics = metrics
+        if self.journal is not None:
+            self.journal.metrics = metrics
+
+    def load(self, progress: Callable[[int, int], None] = None
+             ) -> Optional[Tuple[TaskList, int]]:
+        """Загружает снимок из JSON-файла и в режиме журнала применяет к нему
+        записи из журнала.
+        :param progress: Функция, которая при потоковой загрузке вызывается
+            каждые PROGRESS_EVERY задач и в конце с количеством загруженных
+            задач и числом прочитанных символов.
+        :return: Кортеж из списка задач и следующего ID или None, если
+            загрузить данные не удалось.
+
+        """
+        with self.locked(shared=True):
+            data = self._load_snapshot(progress)
+            if self.journal is not None:
+                replayed = self._replay_journal(*(data or (TaskList(), 1)))
+                if replayed is not None:
+                    data = replayed
+        return data
+
+    def locked(self, shared: bool = False):
+        """Возвращает контекст блокировки файла в режиме совместного доступа
+        (см. FileLock.acquire) или пустой контекст в обычном режиме.
+        :param shared: Если True, блокировка разделяемая (для чтения).
+        :return: Контекстный менеджер.
+
+        """
+        if self.lock is None:
+            return nullcontext()
+        return self.lock.acquire(shared)
+
+    def read_version(self) -> int:
+        """Читает версию снимка из начала файла, не разбирая его целиком.
+        :return: Номер версии или 0, если файла нет или версия не указана.
+
+        """
+        try:
+            with open(self.filename, 'rb') as file:
+                head = file.read(64)
+        except FileNotFoundError:
+            return 0
+        match = self.VERSION_RE.match(head)
+        return int(match.group(1)) if match else 0
+
+    def changes(self) -> Optional[List[Dict]]:
+        """Возвращает изменения, дописанные в журнал другими процессами.
+        Вызывается под блокировкой (см. locked).
+        :return: Список новых записей журнала или None, если снимок
+            перезаписан после последней загрузки или записи.
+
+        """
+        if not self.shared:
+            return []
+        return self.poll()
+
+    def poll(self) -> Optional[List[Dict]]:
+        """Проверяет по размеру и времени изменения файлов, а в режиме
+        совместного доступа и по версии снимка, изменились ли данные. Если
+        файлы не менялись, они не открываются.
+        :return: Записи, дописанные в журнал после последнего чтения или
+            записи, пустой список, если изменений нет, или None, если снимок
+            перезаписан и его нужно загрузить заново.
+
+        """
+        if stat_signature(self.filename) != self.snapshot_stat:
+            return None
+        if self.shared and self.read_version() != self.version:
+            return None
+        if self.journal is None:
+            return []
+        size = stat_signature(self.journal.filename)
+        size = size[0] if size is not None else 0
+        if size < self.journal.offset:
+            return None
+        if size == self.journal.offset:
+            return []
+        return self.journal.read_new()
+
+    def _load_snapshot(self, progress: Callable[[int, int], None] = None
+                       ) -> Optional[Tuple[TaskList, int]]:
+        """Загружает снимок задач из JSON-файла.
+        :param progress: Функция для отчета о ходе потоковой загрузки.
+        :return: Кортеж из списка задач и следующего ID или None.
+
+        """
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as file:
+                self.snapshot_stat = file_signature(file)
+                if self.stream_load:
+                    data = self._stream_snapshot(file, progress)
+                else:
+                    document = json.load(file)
+                    data = (TaskList(Task.from_dict(task)
+                                     for task in document.get('tasks', [])),
+                            document.get('next_id', 1))
+                    self.version = document.get('version', 0)
+            print("Данные успешно загружены.")
+            return data
+        except FileNotFoundError:
+            print(f"Файл '{self.filename}' не найден. "
+                  f"Будет создан новый файл.")
+            self.version = 0
+            self.snapshot_stat = None
+            return None
+        except json.JSONDecodeError:
+            print(f"Ошибка декодирования JSON в файле '{self.filename}'. "
+                  f"Файл может быть поврежден.")
+            return None
+
+    def _stream_snapshot(self, file, progress: Callable[[int, int], None]
+                         ) -> Tuple[TaskList, int]:
+        """Потоково разбирает снимок и создает задачи по одной, так что
+        пиковое потребление памяти близко к итоговому размеру списка задач.
+        :param file: Открытый файл снимка.
+        :param progress: Функция для отчета о ходе загрузки или None.
+        :return: Кортеж из списка задач и следующего ID.
+
+        """
+        stream = JsonArrayStream(file)
+        tasks = TaskList()
+        for record in stream:
+            tasks.append(Task.from_dict(record))
+            if progress is not None and len(tasks) % self.PROGRESS_EVERY == 0:
+                progress(len(tasks), stream.position)
+        if progress is not None:
+            progress(len(tasks), stream.position)
+        self.version = stream.fields.get('version', 0)
+        return tasks, stream.fields.get('next_id', 1)
+
+    def _replay_journal(self, tasks: TaskList, next_id: int
+                        ) -> Optional[Tuple[TaskList, int]]:
+        """Применяет к загруженному снимку записи из журнала. Записи
+        идемпотентны, поэтому повторное применение уже вошедших в снимок
+        изменений не искажает данные.
+        :param tasks: Задачи из снимка.
+        :param next_id: Следующий ID из снимка.
+        :return: Кортеж из списка задач и следующего ID или None, если
+            журнал пуст.
+
+        """
+        tasks = {task.id: task for task in tasks}
+        for record in self.journal.replay():
+            op = record['op']
+            if op == 'add':
+                task = Task.from_dict(record['task'])
+                tasks[task.id] = task
+            elif op == 'update':
+                task = tasks.get(record['id'])
+                if task is not None:
+                    for field, value in record['fields'].items():
+                        setattr(task, field, value)
+            elif op == 'delete':
+                for task_id in record['ids']:
+                    tasks.pop(task_id, None)
+            next_id = max(next_id, record.get('next_id', 1))
+        if not self.journal.records:
+            return None
+        print(f"Применено записей из журнала: {self.journal.records}.")
+        return TaskList(tasks.values()), next_id
+
+    def save(self, tasks: Iterable[Task], next_id: int) -> bool:
+        """Сохраняет данные о задачах в JSON-файл. В режиме журнала после
+        записи снимка журнал очищается. В режиме совместного доступа снимок
+        записывается под блокировкой со следующим номером версии.
+        :param tasks: Задачи для сохранения.
+        :param next_id: Следующий ID задачи.
+        :return: True, если данные успешно сохранены, иначе False.
+
+        """
+        with self.locked():
+            return self._save(tasks, next_id)
+
+    def _save(self, tasks: Iterable[Task], next_id: int) -> bool:
+        """Записывает снимок и очищает журнал (см. save). Снимок пишется во
+        временный файл рядом с исходным и атомарно заменяет его, поэтому сбой
+        во время записи не повреждает сохраненные данные. С параметром fsync
+        перед заменой вызывается os.fsync.
+        :param tasks: Задачи для сохранения.
+        :param next_id: Следующий ID задачи.
+        :return: True, если данные успешно сохранены, иначе False.
+
+        """
+        with self.metrics.phase('serialize'):
+            data = {
+                'tasks': [task.to_dict() for task in tasks],
+                'next_id': next_id
+            }
+            if self.shared:
+                # Версия записывается первой, чтобы ее можно было прочитать
+                # из начала файла (см. read_version).
+                data = {'version': self.version + 1, **data}
+        temp_filename = self.filename + '.tmp'
+        try:
+            with open(temp_filename, 'w', encoding='utf-8') as file:
+                # json.dump пишет в файл по частям, поэтому фаза write
+                # включает кодирование в JSON.
+                with self.metrics.phase('write'):
+                    json.dump(data, file, ensure_ascii=False, indent=4)
+                    file.flush()
+                if self.fsync:
+                    with self.metrics.phase('fsync'):
+                        os.fsync(file.fileno())
+                signature = file_signature(file)
+            os.replace(temp_filename, self.filename)
+            self.snapshot_stat = signature
+            print(f"Обновленный список задач успешно сохранен в файл "
+                  f"'{self.filename}'.")
+        except (IOError, OSError):
+            print(f"Не удалось сохранить обновленный список задач в файл "
+                  f"'{self.filename}'.")
+            with suppress(OSError):
+                os.remove(temp_filename)
+            return False
+        if self.shared:
+            self.version += 1
+        if self.journal is not None:
+            return self.journal.truncate()
+        return True
+
+    def write(self, records: List[Dict], tasks: TaskList,
+              next_id: int) -> bool:
+        """Дописывает изменения в журнал или, если журнал не используется либо
+        переполнен, перезаписывает весь файл.
+        :param records: Список записей об изменениях.
+        :param tasks: Текущий список задач после изменений.
+        :param next_id: Следующий ID задачи.
+        :return: True, если изменения успешно сохранены, иначе False.
+
+        """
+        if self.journal is None:
+            return self.save(tasks, next_id)
+        with self.locked():
+            if not self.journal.append_many(records):
+                return False
+            if self.journal.records >= self.compact_threshold:
+                return self._save(tasks, next_id)
+        return True
@@ -1,11 +1,71 @@
-from typing import Dict
+import sys
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+@lru_cache(maxsize=65536)
+def parse_due_date(due_date: str) -> Optional[int]:
+    """Преобразует срок выполнения формата dd.mm.yyyy в порядковый номер дня.
+    Результат кэшируется, поэтому задачи с одинаковым сроком разделяют один
+    объект.
+    :param due_date: Срок выполнения задачи.
+    :return: Порядковый номер дня (date.toordinal) или None, если дата
+        некорректна.
+
+    """
+    try:
+        day, month, year = due_date.split('.')
+        return date(int(year), int(month), int(day)).toordinal()
+    except (AttributeError, ValueError):
+        return None
+
+
+def intern(value):
+    """Возвращает единственный экземпляр строки, чтобы повторяющиеся значения
+    разных задач не хранились в памяти многократно.
+    :param value: Значение поля задачи.
+    :return: Интернированная строка или исходное значение, если это не
+        строка.
+
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+class Interned:
+    """Дескриптор атрибута задачи, который интернирует присваиваемые строки.
+    Используется для полей с небольшим набором повторяющихся значений.
+
+    """
+    def __set_name__(self, owner, name):
+        self.slot = '_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.slot)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, intern(value))
 
 
 class Task:
     """Класс для представления задачи. Содержит атрибуты задачи и методы для
     преобразования объекта в словарь и обратно.
 
+    Задачи хранятся компактно: у объектов нет __dict__, значения категории,
+    приоритета, статуса и срока интернируются и разделяются между задачами,
+    а срок выполнения дополнительно хранится в виде порядкового номера дня
+    (due_ordinal).
+
     """
+    __slots__ = ('id', 'title', 'description', '_category', '_due_date',
+                 'due_ordinal', '_priority', '_status')
+
+    category = Interned()
+    priority = Interned()
+    status = Interned()
+
     def __init__(self, id: int, title: str, description: str, category: str,
                  due_date: str, priority: str, status: str = 'Не выполнена'):
         """Инициализирует объект задачи с заданными параметрами.
@@ -26,6 +86,17 @@ class Task:
         self.priority = priority
         self.status = status
 
+    @property
+    def due_date(self) -> str:
+        """Срок выполнения задачи в формате dd.mm.yyyy."""
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value: str):
+        self._due_date = intern(value)
+        self.due_ordinal = (parse_due_date(value)
+                            if isinstance(value, str) else None)
+
     def to_dict(self) -> Dict:
         """Преобразует объект задачи в словарь для хранения в JSON.
         :return: Словарь с данными задачи.
@@ -41,12 +112,29 @@ class Task:
             'status': self.status
         }
 
+    def copy(self) -> 'Task':
+        """Возвращает независимую копию задачи.
+        :return: Новый объект Task с теми же значениями полей.
+
+        """
+        # Поля копируются напрямую, минуя интернирование и разбор срока.
+        task = Task.__new__(Task)
+        task.id = self.id
+        task.title = self.title
+        task.description = self.description
+        task._category = self._category
+        task._due_date = self._due_date
+        task.due_ordinal = self.due_ordinal
+        task._priority = self._priority
+        task._status = self._status
+        return task
+
     @staticmethod
     def from_dict(data: Dict) -> 'Task':
         """Создает объект задачи из словаря.
         :param data: Словарь с данными задачи.
         :return: Объект Task.
-        
+
         """
         return Task(
             id=data['id'],
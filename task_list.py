@@ -0,0 +1,221 @@
+import threading
+from collections.abc import MutableSequence
+from itertools import islice
+from task import Task
+from typing import Dict, Iterable, Iterator, Optional
+
+# Отложенные индексы заполняются под этой блокировкой, чтобы параллельные
+# читатели не заполняли один индекс одновременно.
+_LAZY_INDEX_LOCK = threading.Lock()
+
+
+class TaskList(MutableSequence):
+    """Список задач с индексом по ID. Задачи хранятся в словаре, который
+    сохраняет порядок добавления, поэтому поиск, добавление и удаление по ID
+    выполняются за O(1), а обход идет в том же порядке, что и у обычного
+    списка. Доступ по позиции выполняется за O(n) и нужен только для
+    совместимости со списком.
+
+    Дополнительные индексы (например, FieldIndex) подключаются через
+    add_index и обновляются при каждом изменении списка. После изменения
+    атрибутов задачи нужно вызвать reindex. Отложенные индексы заполняются
+    только при первом обращении через index.
+
+    """
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """Инициализирует список задач.
+        :param tasks: Начальные задачи.
+
+        """
+        self._tasks: Dict[int, Task] = {}
+        self.indexes = {}
+        self._lazy_indexes = {}
+        for task in tasks:
+            self._tasks[task.id] = task
+
+    def add_index(self, name: str, index, lazy: bool = False):
+        """Подключает индекс и заполняет его текущими задачами. Индексы с
+        методом add_many заполняются одним вызовом.
+        :param name: Имя индекса.
+        :param index: Объект с методами add, discard и clear.
+        :param lazy: Если True, индекс заполняется при первом обращении к
+            нему через index, а до этого изменения списка его не затрагивают.
+
+        """
+        if lazy:
+            self.indexes.pop(name, None)
+            self._lazy_indexes[name] = index
+            return
+        index.clear()
+        if hasattr(index, 'add_many'):
+            index.add_many(self._tasks.values())
+        else:
+            for task in self._tasks.values():
+                index.add(task)
+        self.indexes[name] = index
+        self._lazy_indexes.pop(name, None)
+
+    def index(self, name: str):
+        """Возвращает индекс по имени, заполняя отложенный индекс при первом
+        обращении.
+        :param name: Имя индекса.
+        :return: Объект индекса или None, если индекс не подключен.
+
+        """
+        if name in self._lazy_indexes:
+            with _LAZY_INDEX_LOCK:
+                index = self._lazy_indexes.get(name)
+                if index is not None:
+                    self.add_index(name, index)
+        return self.indexes.get(name)
+
+    def reindex(self, task: Task):
+        """Обновляет индексы после изменения атрибутов задачи.
+        :param task: Измененная задача.
+
+        """
+        for index in self.indexes.values():
+            index.discard(task)
+            index.add(task)
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Возвращает задачу по ID.
+        :param task_id: ID задачи.
+        :return: Объект Task или None, если задача не найдена.
+
+        """
+        return self._tasks.get(task_id)
+
+    def remove_id(self, task_id: int) -> Optional[Task]:
+        """Удаляет задачу по ID.
+        :param task_id: ID задачи.
+        :return: Удаленная задача или None, если задача не найдена.
+
+        """
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            for index in self.indexes.values():
+                index.discard(task)
+        return task
+
+    def append(self, task: Task):
+        """Добавляет задачу в конец списка. Задача с тем же ID заменяется на
+        своем месте.
+        :param task: Добавляемая задача.
+
+        """
+        old_task = self._tasks.get(task.id)
+        self._tasks[task.id] = task
+        for index in self.indexes.values():
+            if old_task is not None:
+                index.discard(old_task)
+            index.add(task)
+
+    def extend(self, tasks: Iterable[Task]):
+        """Добавляет задачи в конец списка. Индексы с методом add_many
+        обновляются одним вызовом, что быстрее поочередного добавления.
+        :param tasks: Добавляемые задачи.
+
+        """
+        tasks = list(tasks)
+        if any(task.id in self._tasks for task in tasks):
+            for task in tasks:
+                self.append(task)
+            return
+        for task in tasks:
+            self._tasks[task.id] = task
+        for index in self.indexes.values():
+            if hasattr(index, 'add_many'):
+                index.add_many(tasks)
+            else:
+                for task in tasks:
+                    index.add(task)
+
+    def copy(self) -> 'TaskList':
+        """Возвращает копию списка с копиями задач и без индексов. Копию
+        можно сохранять в другом потоке, пока задачи списка изменяются.
+        :return: Новый объект TaskList.
+
+        """
+        tasks = TaskList()
+        tasks._tasks = {task_id: task.copy()
+                        for task_id, task in self._tasks.items()}
+        return tasks
+
+    def clear(self):
+        """Удаляет все задачи."""
+        self._tasks.clear()
+        for index in self.indexes.values():
+            index.clear()
+
+    def _reset(self, tasks: Iterable[Task]):
+        """Заменяет содержимое списка с сохранением переданного порядка.
+        :param tasks: Новые задачи.
+
+        """
+        tasks = list(tasks)
+        self.clear()
+        for task in tasks:
+            self.append(task)
+
+    def _position(self, index: int) -> int:
+        """Нормализует позицию в списке.
+        :param index: Позиция, в том числе отрицательная.
+        :return: Неотрицательная позиция.
+
+        """
+        if index < 0:
+            index += len(self._tasks)
+        if not 0 <= index < len(self._tasks):
+            raise IndexError('TaskList index out of range')
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._tasks.values())[index]
+        index = self._position(index)
+        return next(islice(self._tasks.values(), index, None))
+
+    def __setitem__(self, index, value):
+        tasks = list(self._tasks.values())
+        tasks[index] = value
+        self._reset(tasks)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            tasks = list(self._tasks.values())
+            del tasks[index]
+            self._reset(tasks)
+        else:
+            self.remove_id(self[index].id)
+
+    def insert(self, index: int, task: Task):
+        """Вставляет задачу перед указанной позицией.
+        :param index: Позиция для вставки.
+        :param task: Вставляемая задача.
+
+        """
+        if index >= len(self._tasks):
+            self.append(task)
+            return
+        tasks = [item for item in self._tasks.values() if item.id != task.id]
+        tasks.insert(index, task)
+        self._reset(tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def __contains__(self, task) -> bool:
+        return (isinstance(task, Task) and
+                self._tasks.get(task.id) is task)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TaskList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'TaskList({list(self._tasks.values())!r})'
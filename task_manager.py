@@ -1,70 +1,618 @@
-import json
-import re
-from task import Task
-from typing import List
+import atexit
+import functools
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import date
+from itertools import chain, islice
+from indexes import (DueDateIndex, FieldIndex, TextIndex, UrgencyIndex,
+                     keyword_words, matches_keyword)
+from metrics import NULL_METRICS, Metrics, instrumented
+from rwlock import ReadWriteLock, read_locked, write_locked
+from storage import JsonStorage, Storage
+from task import Task, parse_due_date
+from task_list import TaskList
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional, Set,
+                    TextIO, Tuple)
+from validation import TASK_VALIDATOR
+
+
+class BatchError(Exception):
+    """Пакет изменений отменен: операция внутри пакета не выполнена или
+    изменения не удалось сохранить (см. TaskManager.batch).
+
+    """
+
+
+def batched(method: Callable) -> Callable:
+    """Декоратор изменяющего метода TaskManager: если метод вызван внутри
+    пакета и не выполнен (вернул False или None), вызывается BatchError,
+    и пакет отменяется целиком. Проверка выполняется под блокировкой
+    записи, поэтому декоратор указывается после write_locked.
+    :param method: Изменяющий метод TaskManager.
+    :return: Обернутый метод.
+
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if self._batch_depth and (result is False or result is None):
+            raise BatchError(f"Операция {method.__name__} не выполнена.")
+        return result
+    return wrapper
 
 
 class TaskManager:
     """Класс для управления списком задач. Поддерживает создание, обновление,
     удаление, сохранение, поиск и вывод задач.
 
+    Менеджер можно использовать из нескольких потоков. Поиск и группировка
+    выполняются под блокировкой чтения lock и могут идти параллельно, а
+    изменения выполняются под блокировкой записи по одному. Чтобы
+    перебирать manager.tasks напрямую, пока другие потоки меняют задачи,
+    нужно удерживать блокировку: ``with manager.lock.read(): ...``.
+
     """
-    def __init__(self, filename: str = 'tasks.json'):
+    INDEXED_FIELDS = ('category', 'status', 'priority')
+    DISPLAY_CHUNK = 1000
+
+    def __init__(self, filename: str = 'tasks.json', journal: bool = False,
+                 compact_threshold: int = 10000, text_index: bool = False,
+                 stream_load: bool = False, storage: Storage = None,
+                 metrics: bool = False, metrics_file: str = None,
+                 metrics_interval: float = 60.0, autosave: float = None,
+                 shared: bool = False, lazy_indexes: bool = False,
+                 fsync: bool = False):
         """Инициализация менеджера задач. Загружает задачи из файла или создает
         пустой список, если файл отсутствует.
+        :param filename: Путь к JSON-файлу с задачами.
+        :param journal: Если True, изменения дописываются в журнал рядом со
+            снимком вместо полной перезаписи файла.
+        :param compact_threshold: Количество записей в журнале, после которого
+            снимок перезаписывается, а журнал очищается.
+        :param text_index: Если True, для поиска по ключевым словам
+            поддерживается инвертированный индекс слов.
+        :param stream_load: Если True, файл разбирается потоково, по одной
+            задаче, без загрузки всего документа в память.
+        :param storage: Хранилище задач. По умолчанию используется
+            JsonStorage с параметрами filename, journal, compact_threshold,
+            stream_load, shared и fsync.
+        :param metrics: Если True, собираются метрики задержек операций и их
+            фаз (см. stats). Без этого замеры не выполняются.
+        :param metrics_file: Файл, в который метрики периодически
+            записываются в формате JSON, или None.
+        :param metrics_interval: Период записи метрик в секундах.
+        :param autosave: Если задан, изменения сохраняются фоновым потоком
+            не чаще одного раза в указанное количество секунд, а также при
+            вызове flush и close (см. start_autosave).
+        :param shared: Если True, с файлом могут одновременно работать
+            несколько процессов: перед каждой записью изменения других
+            процессов объединяются с текущими (см. JsonStorage).
+        :param lazy_indexes: Если True, индексы для поиска строятся не при
+            загрузке, а при первом запросе, который их использует. Это
+            ускоряет короткие запуски, которым индексы не нужны. Если
+            хранилище умеет искать задачи само (Storage.supports_search),
+            задачи загружаются только при первом обращении к ним, а поиск
+            до этого выполняется в хранилище.
+        :param fsync: Если True, после каждой записи в журнал и снимка
+            вызывается os.fsync (см. JsonStorage).
 
         """
-        self.filename = filename
+        if storage is None:
+            storage = JsonStorage(filename, journal=journal,
+                                  compact_threshold=compact_threshold,
+                                  stream_load=stream_load, shared=shared,
+                                  fsync=fsync)
+        self.storage = storage
+        self.filename = storage.filename
+        self.metrics = Metrics() if metrics else NULL_METRICS
+        storage.instrument(self.metrics)
+        if metrics and metrics_file:
+            self.metrics.start_dump(metrics_file, metrics_interval)
+        self.text_index = text_index
+        self.lazy_indexes = lazy_indexes
+        self._load_lock = threading.Lock()
         self.tasks = []
         self.next_id = 1
+        self._batch_depth = 0
+        self._pending = []
+        self._undo: List[Dict] = []
+        self._undo_next_id = 1
+        self.deferred = False
+        self._unsaved: List[Dict] = []
+        self._unsaved_lock = threading.Lock()
+        self._save_lock = threading.RLock()
+        self._changed = threading.Event()
+        self._autosave_stop = threading.Event()
+        self._autosave_thread = None
+        self.lock = ReadWriteLock()
         self.load_data()
+        if autosave is not None:
+            self.start_autosave(autosave)
 
-    def load_data(self) -> bool:
-        """Загружает данные из JSON-файла. Если файл отсутствует или поврежден,
-        создает пустой список задач.
-        :return: True, если данные успешно загружены, иначе False.
+    @property
+    def tasks(self) -> TaskList:
+        """Список задач с индексом по ID. Если задачи еще не загружены (см.
+        lazy_indexes), они загружаются при первом обращении.
+        :return: Объект TaskList.
 
         """
-        try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                self.tasks = [Task.from_dict(task)
-                              for task in data.get('tasks', [])]
-                self.next_id = data.get('next_id', 1)
-            print("Данные успешно загружены.")
+        if self._tasks is None:
+            self._ensure_loaded()
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks: Iterable[Task]):
+        """Заменяет список задач и перестраивает индексы по ID, категории,
+        статусу, приоритету, сроку, срочности и, если включен,
+        полнотекстовый индекс. При lazy_indexes индексы только подключаются
+        и строятся при первом использовании.
+        :param tasks: Новые задачи.
+
+        """
+        if not isinstance(tasks, TaskList):
+            tasks = TaskList(tasks)
+        lazy = self.lazy_indexes
+        for field in self.INDEXED_FIELDS:
+            tasks.add_index(field, FieldIndex(field), lazy)
+        tasks.add_index('due_date', DueDateIndex(), lazy)
+        tasks.add_index('open_due_date', DueDateIndex(open_only=True), lazy)
+        tasks.add_index('urgency', UrgencyIndex(), lazy)
+        if self.text_index:
+            tasks.add_index('text', TextIndex(), lazy)
+        self._tasks = tasks
+
+    @property
+    def next_id(self) -> int:
+        """Следующий ID задачи. Если задачи еще не загружены, они
+        загружаются при первом обращении.
+        :return: Следующий ID.
+
+        """
+        if self._tasks is None:
+            self._ensure_loaded()
+        return self._next_id
+
+    @next_id.setter
+    def next_id(self, next_id: int):
+        self._next_id = next_id
+
+    @instrumented('load_data')
+    @write_locked
+    def load_data(self, progress: Callable[[int, int], None] = None) -> bool:
+        """Загружает данные из хранилища. Если файл отсутствует или поврежден,
+        создает пустой список задач. При lazy_indexes и хранилище с поиском
+        загрузка откладывается до первого обращения к задачам.
+        :param progress: Функция для отчета о ходе загрузки (см.
+            JsonStorage.load).
+        :return: True, если данные успешно загружены или загрузка отложена,
+            иначе False.
+
+        """
+        if self.lazy_indexes and self.storage.supports_search:
+            self._tasks = None
             return True
-        except FileNotFoundError:
-            print(f"Файл '{self.filename}' не найден. "
-                  f"Будет создан новый файл.")
-            self.tasks = []
+        return self._load_tasks(progress)
+
+    def _ensure_loaded(self):
+        """Загружает отложенные задачи. Загрузка может начаться под
+        блокировкой чтения в нескольких потоках сразу, поэтому она
+        выполняется один раз под отдельной блокировкой.
+
+        """
+        with self._load_lock:
+            if self._tasks is None:
+                self._load_tasks()
+
+    def _load_tasks(self, progress: Callable[[int, int], None] = None
+                    ) -> bool:
+        """Загружает задачи из хранилища (см. load_data).
+        :param progress: Функция для отчета о ходе загрузки.
+        :return: True, если данные успешно загружены, иначе False.
+
+        """
+        with self.metrics.phase('deserialize'):
+            data = self.storage.load(progress)
+        # next_id задается раньше задач: пока задачи не заданы, другие
+        # потоки ждут загрузки и не видят старый next_id.
+        if data is None:
             self.next_id = 1
-            return False
-        except json.JSONDecodeError:
-            print(f"Ошибка декодирования JSON в файле '{self.filename}'. "
-                  f"Файл может быть поврежден.")
             self.tasks = []
-            self.next_id = 1
             return False
+        with self.metrics.phase('index'):
+            tasks, self.next_id = data
+            self.tasks = tasks
+        return True
+
+    def _commit(self, record: Dict, undo: List[Dict]) -> bool:
+        """Сохраняет изменение или, внутри пакета, откладывает его до конца
+        пакета.
+        :param record: Словарь с описанием изменения.
+        :param undo: Записи, отменяющие изменение (см. _commit_many).
+        :return: True, если изменение успешно сохранено, иначе False.
+
+        """
+        return self._commit_many([record], undo)
+
+    def _commit_many(self, records: List[Dict], undo: List[Dict]) -> bool:
+        """Сохраняет несколько изменений одной записью в хранилище или,
+        внутри пакета, откладывает их до конца пакета.
+        :param records: Список записей об изменениях.
+        :param undo: Записи в том же формате, которые возвращают задачи в
+            состояние до изменений. Внутри пакета они запоминаются для
+            отката.
+        :return: True, если изменения успешно сохранены, иначе False.
+
+        """
+        for record in records:
+            record['next_id'] = self.next_id
+        if self._batch_depth:
+            self._pending.extend(records)
+            self._undo.extend(undo)
+            return True
+        return self._flush(records)
+
+    def _flush(self, records: List[Dict], undo: List[Dict] = None) -> bool:
+        """Передает накопленные изменения хранилищу или, в отложенном
+        режиме, добавляет их к несохраненным.
+        :param records: Список записей об изменениях.
+        :param undo: Записи отмены пакета или None (см. _merge).
+        :return: True, если изменения успешно сохранены, иначе False.
+
+        """
+        if self.deferred:
+            with self._unsaved_lock:
+                self._unsaved.extend(records)
+            self._changed.set()
+            return True
+        with self._save_lock, self.storage.locked():
+            records = self._sync(records, undo)
+            return self.storage.write(records, self.tasks, self.next_id)
+
+    def _sync(self, records: List[Dict],
+              undo: List[Dict] = None) -> List[Dict]:
+        """Объединяет еще не сохраненные изменения с изменениями, которые
+        другие процессы успели сохранить в хранилище (см. _merge).
+        Вызывается под блокировкой хранилища.
+        :param records: Несохраненные записи об изменениях.
+        :param undo: Записи отмены пакета или None (см. _merge).
+        :return: Записи об изменениях с учетом новых ID.
+
+        """
+        changes = self.storage.changes()
+        if changes is not None and not changes:
+            return records
+        return self._merge(records, changes, undo)
+
+    def _merge(self, records: List[Dict], changes: Optional[List[Dict]],
+               undo: List[Dict] = None) -> List[Dict]:
+        """Применяет к задачам в памяти чужие изменения (или загружает
+        задачи заново, если хранилище перезаписано целиком), после чего
+        поверх них повторно применяет свои несохраненные изменения. Если ID
+        добавленных задач уже заняты, задачи получают новые ID начиная с
+        чужого next_id.
+        :param records: Несохраненные записи об изменениях.
+        :param changes: Чужие записи об изменениях или None, если задачи
+            нужно загрузить заново.
+        :param undo: Записи отмены сохраняемого пакета или None. ID в них
+            изменяются на месте так же, как в records, а next_id для отката
+            пакета не опускается ниже чужого.
+        :return: Записи об изменениях с учетом новых ID.
+
+        """
+        added = [record['task']['id'] for record in records
+                 if record['op'] == 'add']
+        own_tasks = [self.tasks.remove_id(task_id) for task_id in added]
+        own_next = self.next_id
+
+        if changes is None:
+            data = self.storage.load()
+            if data is not None:
+                self._reload(*data)
+            foreign_next = self.next_id
+        else:
+            foreign_next = self._apply(changes)
+
+        shift = max(0, foreign_next - min(added, default=foreign_next))
+        self.next_id = max(own_next + shift, foreign_next)
+        added = set(added)
+        renumbered = [dict(self._renumber(record, added, shift),
+                           next_id=self.next_id) for record in records]
+        if undo is not None:
+            undo[:] = [self._renumber(record, added, shift)
+                       for record in undo]
+            self._undo_next_id = max(self._undo_next_id, foreign_next)
+        if shift:
+            print(f"ID новых задач изменены на {shift}: они заняты другим "
+                  f"процессом.")
+
+        for task in own_tasks:
+            if task is not None:
+                task.id += shift
+                self.tasks.append(task)
+        self._apply([record for record in renumbered
+                     if record['op'] != 'add'])
+        return renumbered
+
+    @staticmethod
+    def _renumber(record: Dict, added: Set[int], shift: int) -> Dict:
+        """Сдвигает в записи ID добавленных задач.
+        :param record: Запись об изменении.
+        :param added: ID задач, добавленных этим объектом.
+        :param shift: Величина сдвига.
+        :return: Новая запись с измененными ID.
+
+        """
+        record = dict(record)
+        if record['op'] == 'add' and record['task']['id'] in added:
+            record['task'] = dict(record['task'],
+                                  id=record['task']['id'] + shift)
+        elif record['op'] == 'update' and record['id'] in added:
+            record['id'] += shift
+        elif record['op'] == 'delete':
+            record['ids'] = [task_id + shift if task_id in added
+                             else task_id for task_id in record['ids']]
+        return record
+
+    def _apply(self, records: Iterable[Dict]) -> int:
+        """Применяет записи об изменениях к задачам в памяти.
+        :param records: Список записей об изменениях.
+        :return: Наибольший next_id из записей и текущего next_id.
+
+        """
+        next_id = self.next_id
+        for record in records:
+            op = record['op']
+            if op == 'add':
+                self.tasks.append(Task.from_dict(record['task']))
+            elif op == 'update':
+                task = self.tasks.get(record['id'])
+                if task is not None:
+                    for field, value in record['fields'].items():
+                        setattr(task, field, value)
+                    self.tasks.reindex(task)
+            elif op == 'delete':
+                for task_id in record['ids']:
+                    self.tasks.remove_id(task_id)
+            next_id = max(next_id, record.get('next_id', 1))
+        return next_id
+
+    def _reload(self, tasks: Iterable[Task], next_id: int):
+        """Заменяет задачи в памяти заново загруженными, сохраняя объекты и
+        индексы: неизмененные задачи остаются как есть, измененные
+        обновляются на месте, а индексы обновляются только для добавленных,
+        измененных и удаленных задач.
+        :param tasks: Загруженные задачи.
+        :param next_id: Загруженный следующий ID.
+
+        """
+        loaded = set()
+        for task in tasks:
+            loaded.add(task.id)
+            current = self.tasks.get(task.id)
+            if current is None:
+                self.tasks.append(task)
+                continue
+            data = task.to_dict()
+            if current.to_dict() != data:
+                for field, value in data.items():
+                    setattr(current, field, value)
+                self.tasks.reindex(current)
+        for task_id in [task.id for task in self.tasks
+                        if task.id not in loaded]:
+            self.tasks.remove_id(task_id)
+        self.next_id = next_id
+
+    @write_locked
+    def refresh(self) -> bool:
+        """Подгружает изменения, сохраненные в файл другими процессами.
+        Сначала проверяются размер и время изменения файлов (и версия снимка
+        в режиме совместного доступа), поэтому, если файл не менялся, вызов
+        почти ничего не стоит. Новые записи журнала применяются к задачам в
+        памяти, а перезаписанный снимок загружается заново с сохранением
+        неизмененных объектов задач и индексов (см. _reload). Несохраненные
+        изменения этого объекта применяются поверх загруженных.
+        :return: True, если данные изменились, иначе False.
+
+        """
+        if self._tasks is None:
+            # Незагруженные задачи при первом обращении прочитаются заново.
+            return False
+        with self._save_lock, self.storage.locked(shared=True):
+            changes = self.storage.poll()
+            if changes is not None and not changes:
+                return False
+            with self._unsaved_lock:
+                self._unsaved = self._merge(self._unsaved, changes)
+            return True
+
+    @property
+    def dirty(self) -> bool:
+        """Есть ли изменения, которые еще не переданы хранилищу."""
+        return bool(self._unsaved)
+
+    def take_unsaved(self) -> Optional[Tuple[List[Dict], TaskList, int]]:
+        """Забирает отложенные изменения вместе с копией списка задач, чтобы
+        их можно было сохранить в другом потоке, пока список и сами задачи
+        меняются (копируются и объекты задач, см. TaskList.copy). В
+        режиме совместного доступа вызывается под блокировкой хранилища:
+        изменения предварительно объединяются с чужими (см. _sync).
+        :return: Кортеж из записей, копии списка задач и следующего ID или
+            None, если несохраненных изменений нет.
+
+        """
+        with self._unsaved_lock:
+            if not self._unsaved:
+                return None
+            records, self._unsaved = self._sync(self._unsaved), []
+            return records, self.tasks.copy(), self.next_id
+
+    def restore_unsaved(self, records: List[Dict]):
+        """Возвращает в начало очереди изменения, которые не удалось
+        сохранить.
+        :param records: Список записей об изменениях.
+
+        """
+        with self._unsaved_lock:
+            self._unsaved[:0] = records
+
+    def flush(self) -> bool:
+        """Сохраняет отложенные изменения одной записью в хранилище.
+        :return: True, если изменения сохранены или их нет, иначе False.
+
+        """
+        # Блокировка записи нужна только на время объединения изменений и
+        # копирования списка задач, поэтому снимается до записи в хранилище.
+        self.lock.acquire_write()
+        writing = True
+        try:
+            with self._save_lock, self.storage.locked():
+                data = self.take_unsaved()
+                self.lock.release_write()
+                writing = False
+                if data is None:
+                    return True
+                if self.storage.write(*data):
+                    return True
+                self.restore_unsaved(data[0])
+                return False
+        finally:
+            if writing:
+                self.lock.release_write()
+
+    def start_autosave(self, interval: float):
+        """Включает автосохранение: изменения откладываются, а фоновый поток
+        после первого изменения ждет interval секунд, собирая следующие, и
+        сохраняет все одной записью. Перед выходом из программы отложенные
+        изменения сохраняются в close, который также регистрируется в atexit.
+        :param interval: Наименьший промежуток между записями в секундах.
+
+        """
+        self.stop_autosave()
+        self.deferred = True
+        self._autosave_stop.clear()
+        self._autosave_thread = threading.Thread(
+            target=self._autosave_loop, args=(interval,), daemon=True,
+            name='autosave')
+        self._autosave_thread.start()
+        atexit.register(self.close)
+
+    def _autosave_loop(self, interval: float):
+        """Цикл фонового потока автосохранения.
+        :param interval: Наименьший промежуток между записями в секундах.
+
+        """
+        while not self._autosave_stop.is_set():
+            self._changed.wait()
+            if self._autosave_stop.is_set():
+                return
+            # Флаг сбрасывается до ожидания: изменения, сделанные во время
+            # него, снова взводят флаг, а stop_autosave взводит его после
+            # флага остановки, поэтому поток не засыпает навсегда.
+            self._changed.clear()
+            if self._autosave_stop.wait(interval):
+                return
+            self.flush()
 
+    def stop_autosave(self) -> bool:
+        """Останавливает автосохранение и сохраняет отложенные изменения.
+        :return: True, если все изменения сохранены, иначе False.
+
+        """
+        if self._autosave_thread is None:
+            return self.flush()
+        self._autosave_stop.set()
+        self._changed.set()
+        self._autosave_thread.join()
+        self._autosave_thread = None
+        self._changed.clear()
+        atexit.unregister(self.close)
+        saved = self.flush()
+        self.deferred = False
+        return saved
+
+    @contextmanager
+    def batch(self):
+        """Контекст пакетного изменения задач. Изменения внутри блока
+        применяются в памяти и сохраняются один раз при выходе из него. Если
+        внутри блока возникло исключение, задачи возвращаются в исходное
+        состояние, а исключение пробрасывается дальше. Если операция внутри
+        пакета не выполнена (вернула False) или пакет не удалось сохранить,
+        пакет отменяется так же и вызывается BatchError. Вложенные пакеты
+        сохраняются вместе с внешним. На время пакета удерживается
+        блокировка записи, поэтому другие потоки не видят его
+        промежуточного состояния.
+
+        Пример::
+
+            with manager.batch():
+                manager.add_task(...)
+                manager.update_task(...)
+
+        """
+        with self.lock.write(), self._batch():
+            yield self
+
+    @contextmanager
+    def _batch(self):
+        """Контекст пакетного изменения задач без блокировки (см. batch)."""
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        # Для отката запоминаются не копии всех задач, а записи, отменяющие
+        # каждое изменение пакета (см. _commit_many).
+        self._undo_next_id = self.next_id
+        self._batch_depth = 1
+        try:
+            yield self
+            self._batch_depth = 0
+            if (self._pending and
+                    not self._flush(self._pending, self._undo)):
+                raise BatchError("Не удалось сохранить пакет изменений.")
+        except BaseException:
+            self._rollback()
+            raise
+        finally:
+            self._batch_depth = 0
+            self._pending = []
+            self._undo = []
+
+    def _rollback(self):
+        """Отменяет изменения пакета в памяти, применяя записи отмены в
+        обратном порядке. Изменения других процессов, загруженные при
+        попытке сохранения, остаются, а next_id возвращается к значению до
+        пакета, но не ниже чужого (см. _merge).
+
+        """
+        restored = any(record['op'] == 'add' for record in self._undo)
+        self._apply(reversed(self._undo))
+        if restored:
+            # Удаленные задачи возвращаются в конец списка, поэтому
+            # восстанавливается порядок по ID.
+            self.tasks = sorted(self.tasks, key=lambda task: task.id)
+        self.next_id = self._undo_next_id
+        print("Пакет изменений отменен.")
+
+    @instrumented('save_data')
+    @write_locked
     def save_data(self):
-        """Сохраняет данные о задачах в JSON-файл.
+        """Полностью перезаписывает хранилище текущими задачами.
         :return: True, если данные успешно сохранены, иначе False.
 
         """
-        data = {
-            'tasks': [task.to_dict() for task in self.tasks],
-            'next_id': self.next_id
-        }
-        try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(data, file, ensure_ascii=False, indent=4)
-            print(f"Обновленный список задач успешно сохранен в файл "
-                  f"'{self.filename}'.")
+        with self._save_lock, self.storage.locked():
+            with self._unsaved_lock:
+                self._unsaved = self._sync(self._unsaved)
+            if not self.storage.save(self.tasks, self.next_id):
+                return False
+            with self._unsaved_lock:
+                self._unsaved.clear()
             return True
-        except (IOError, OSError):
-            print(f"Не удалось сохранить обновленный список задач в файл "
-                  f"'{self.filename}'.")
-            return False
 
     @staticmethod
     def validate_string(value: str, field_name: str) -> bool:
@@ -82,19 +630,15 @@ class TaskManager:
 
     @staticmethod
     def is_valid_date(date: str) -> bool:
-        """Проверяет, что дата соответствует формату dd.mm.yyyy.
+        """Проверяет, что дата соответствует формату dd.mm.yyyy и существует
+        в календаре.
         :param date: Строка даты для проверки.
         :return: True, если дата валидна, иначе False.
 
         """
-        # Проверяем, что дата - это строка
-        if not isinstance(date, str):
-            print("Ошибка: Дата должна быть строкой.")
-            return False
-
-        # Проверка на соответствие формату dd.mm.yyyy
-        if not re.match(r'^\d{2}\.\d{2}\.\d{4}$', date):
-            print("Ошибка: Неверный формат даты. Ожидается dd.mm.yyyy.")
+        error = TASK_VALIDATOR.check('due_date', date)
+        if error is not None:
+            print(f"Ошибка: {error.message}")
             return False
 
         print("Дата валидная.")
@@ -107,9 +651,9 @@ class TaskManager:
         :return: True, если приоритет валиден, иначе False.
 
         """
-        if priority not in ['Низкий', 'Средний', 'Высокий']:
-            print("Ошибка: Приоритет должен быть 'Низкий', 'Средний' или "
-                  "'Высокий'.")
+        error = TASK_VALIDATOR.check('priority', priority)
+        if error is not None:
+            print(f"Ошибка: {error.message}")
             return False
         print("Приоритет валидный.")
         return True
@@ -121,12 +665,16 @@ class TaskManager:
         :return: True, если статус валиден, иначе False.
 
         """
-        if status not in ['Выполнена', 'Не выполнена']:
-            print("Ошибка: Статус должен быть 'Выполнена' или 'Не выполнена'.")
+        error = TASK_VALIDATOR.check('status', status)
+        if error is not None:
+            print(f"Ошибка: {error.message}")
             return False
         print("Статус валидный.")
         return True
 
+    @instrumented('add_task')
+    @write_locked
+    @batched
     def add_task(self, title: str, description: str, category: str,
                  due_date: str, priority: str) -> bool:
         """Добавляет новую задачу.
@@ -140,25 +688,86 @@ class TaskManager:
         """
         print("Создаем задачу...")
 
-        if not self.validate_string(title, "Название"):
-            return False
-        if not self.validate_string(description, "Описание"):
-            return False
-        if not self.validate_string(category, "Категория"):
-            return False
-        if not self.is_valid_date(due_date):
-            return False
-        if not self.is_valid_priority(priority):
+        with self.metrics.phase('validate'):
+            errors = TASK_VALIDATOR.validate({
+                'title': title, 'description': description,
+                'category': category, 'due_date': due_date,
+                'priority': priority})
+        if errors:
+            print(f"Ошибка: {errors[0].message}")
             return False
 
         new_task = Task(self.next_id, title, description, category, due_date,
                         priority)
-        self.tasks.append(new_task)
+        with self.metrics.phase('index'):
+            self.tasks.append(new_task)
         print("Задача успешно создана.")
         self.next_id += 1
 
-        return self.save_data()
+        return self._commit({'op': 'add', 'task': new_task.to_dict()},
+                            [{'op': 'delete', 'ids': [new_task.id]}])
+
+    @instrumented('import_tasks')
+    @write_locked
+    @batched
+    def import_tasks(self, filename: str, file_format: str = None,
+                     batch_size: int = None) -> Optional['ImportReport']:
+        """Импортирует задачи из файла CSV или JSON Lines. Записи проверяются
+        пакетами без вывода сообщений, задачи получают ID подряд начиная с
+        next_id, а хранилище обновляется один раз в конце. Если файл не
+        удалось прочитать, задачи не добавляются.
+        :param filename: Путь к файлу с заголовком title, description,
+            category, due_date, priority и необязательным status.
+        :param file_format: 'csv' или 'jsonl'. None — по расширению файла.
+        :param batch_size: Количество записей в пакете проверки. None —
+            bulk_import.BATCH_SIZE.
+        :return: Отчет об импорте или None, если файл не удалось прочитать
+            или задачи не удалось сохранить.
+
+        """
+        # Модули импорта и выгрузки загружаются только при использовании,
+        # чтобы не замедлять запуск.
+        import csv
+        from bulk_import import BATCH_SIZE, ImportReport, read_tasks
 
+        report = ImportReport()
+        try:
+            with self.metrics.phase('validate'):
+                tasks = read_tasks(filename, self.next_id, report,
+                                   file_format, batch_size or BATCH_SIZE)
+        except FileNotFoundError:
+            print(f"Файл '{filename}' не найден.")
+            return None
+        except ValueError as error:
+            print(f"Ошибка: {error}")
+            return None
+        except (csv.Error, UnicodeDecodeError):
+            print(f"Ошибка чтения файла '{filename}'. "
+                  f"Файл может быть поврежден.")
+            return None
+
+        with self.metrics.phase('index'):
+            self.tasks.extend(tasks)
+        self.next_id += len(tasks)
+        if tasks and not self._commit_many(
+                [{'op': 'add', 'task': task.to_dict()} for task in tasks],
+                [{'op': 'delete', 'ids': [task.id for task in tasks]}]):
+            # При объединении с чужими изменениями задачи могли получить
+            # новые ID, поэтому удаляются по текущим ID, а next_id
+            # уменьшается на их количество.
+            with self.metrics.phase('index'):
+                for task in tasks:
+                    self.tasks.remove_id(task.id)
+            self.next_id -= len(tasks)
+            print("Импорт отменен: задачи не удалось сохранить.")
+            return None
+        print(f"Импортировано задач: {report.imported}. "
+              f"Отклонено записей: {report.rejected}.")
+        return report
+
+    @instrumented('update_task')
+    @write_locked
+    @batched
     def update_task(self, task_id: int, title: str = None,
                     description: str = None, category: str = None,
                     due_date: str = None, priority: str = None,
@@ -175,40 +784,37 @@ class TaskManager:
 
         """
         print("Обновляем задачу...")
-        tasks = self.search_tasks(task_id)
-        if not tasks:
+        # Задача ищется в загруженном списке, а не через search_tasks,
+        # который до загрузки возвращает копии задач из хранилища.
+        task = self.tasks.get(task_id)
+        if task is None:
+            print(f"Предупреждение: Задача с ID {task_id} не найдена.")
             return False
-        task = tasks[0]
 
-        if title and not self.validate_string(title, "Название"):
-            return False
-        if description and not self.validate_string(description, "Описание"):
-            return False
-        if category and not self.validate_string(category, "Категория"):
-            return False
-        if due_date and not self.is_valid_date(due_date):
-            return False
-        if priority and not self.is_valid_priority(priority):
-            return False
-        if status and not self.is_valid_status(status):
+        fields = {'title': title, 'description': description,
+                  'category': category, 'due_date': due_date,
+                  'priority': priority, 'status': status}
+        fields = {field: value for field, value in fields.items() if value}
+        with self.metrics.phase('validate'):
+            errors = TASK_VALIDATOR.validate(fields, partial=True)
+        if errors:
+            print(f"Ошибка: {errors[0].message}")
             return False
 
-        if title:
-            task.title = title
-        if description:
-            task.description = description
-        if category:
-            task.category = category
-        if due_date:
-            task.due_date = due_date
-        if priority:
-            task.priority = priority
-        if status:
-            task.status = status
+        undo = {'op': 'update', 'id': task.id,
+                'fields': {field: getattr(task, field) for field in fields}}
+        with self.metrics.phase('index'):
+            for field, value in fields.items():
+                setattr(task, field, value)
+            self.tasks.reindex(task)
         print("Задача успешно обновлена.")
 
-        return self.save_data()
+        return self._commit({'op': 'update', 'id': task.id,
+                             'fields': fields}, [undo])
 
+    @instrumented('delete_task')
+    @write_locked
+    @batched
     def delete_task(self, task_id: int = None, category: str = None):
         """Удаляет задачу по ID или по категории.
         :param task_id: ID задачи для удаления.
@@ -219,23 +825,25 @@ class TaskManager:
         print("Удаляем задачу...")
 
         if task_id:
-            tasks = self.search_tasks(task_id=task_id)
-            if not tasks:
+            with self.metrics.phase('index'):
+                removed = self.tasks.remove_id(task_id)
+            if removed is None:
                 print(f"Задача с ID {task_id} не найдена.")
                 return False
 
-            self.tasks = [task for task in self.tasks if task.id != task_id]
+            deleted_ids = [task_id]
+            removed = [removed]
             print(f"Задача с ID {task_id} удалена.")
 
         elif category:
-            tasks_in_category = [task for task in self.tasks
-                                 if task.category.lower() == category.lower()]
-            if not tasks_in_category:
+            deleted_ids = list(self.tasks.index('category').equals(category))
+            if not deleted_ids:
                 print(f"Задачи в категории '{category}' не найдены.")
                 return False
 
-            self.tasks = [task for task in self.tasks
-                          if task.category.lower() != category.lower()]
+            with self.metrics.phase('index'):
+                removed = [self.tasks.remove_id(deleted_id)
+                           for deleted_id in deleted_ids]
             print(f"Все задачи в категории '{category}' удалены.")
 
         else:
@@ -243,8 +851,11 @@ class TaskManager:
                   "ни категория для удаления.")
             return False
 
-        return self.save_data()
+        return self._commit({'op': 'delete', 'ids': deleted_ids},
+                            [{'op': 'add', 'task': task.to_dict()}
+                             for task in removed])
 
+    @read_locked
     def group_tasks_by_category(self):
         """Группирует задачи по категориям.
         :return: Словарь, где ключ — категория, значение — список задач.
@@ -257,61 +868,316 @@ class TaskManager:
             grouped_tasks[task.category].append(task)
         return grouped_tasks
 
-    def display_grouped_tasks(self):
+    def display_grouped_tasks(self, page_size: int = None,
+                              file: TextIO = None,
+                              pager: Callable[[str], None] = None) -> bool:
         """Выводит задачи, сгруппированные по категориям, в консоль.
+        :param page_size: Наибольшее количество задач, выводимых в каждой
+            категории. None — выводить все задачи.
+        :param file: Поток для вывода. По умолчанию sys.stdout.
+        :param pager: Функция, которой передается весь текст для постраничного
+            просмотра, например pydoc.pager.
         :return: True, если задачи были выведены, иначе False.
 
         """
+        if not self.validate_page(page_size):
+            return False
         grouped_tasks = self.group_tasks_by_category()
         if not grouped_tasks:
-            print("Нет задач для отображения.")
+            print("Нет задач для отображения.", file=file)
             return False
-        for category, tasks in grouped_tasks.items():
-            print(f"\nКатегория: '{category}'")
-            self.display_tasks(tasks)
+
+        def lines():
+            for category, tasks in grouped_tasks.items():
+                yield f"\nКатегория: '{category}'\n"
+                yield from map(self.format_task, islice(tasks, page_size))
+
+        self.write_lines(lines(), file, pager)
         return True
 
+    @instrumented('search_tasks')
+    @read_locked
     def search_tasks(self, task_id: int = None, keyword: str = None,
-                     category: str = None, status: str = None):
-        """Выполняет поиск задач по различным параметрам.
+                     category: str = None, status: str = None,
+                     priority: str = None, due_before: str = None,
+                     due_after: str = None, overdue: bool = False):
+        """Выполняет поиск задач по различным параметрам. Фильтры по
+        категории, статусу, приоритету и сроку используют индексы, поэтому их
+        стоимость пропорциональна размеру результата. Найденные по индексам
+        задачи упорядочены по ID. Запрос из нескольких слов находит задачи,
+        содержащие все слова; при включенном полнотекстовом индексе подстроки
+        проверяются только у задач-кандидатов.
         :param task_id: ID задачи для поиска.
-        :param keyword: Ключевое слово для поиска в названии и описании.
+        :param keyword: Ключевые слова для поиска в названии и описании.
         :param category: Категория задач для поиска.
         :param status: Статус задач для поиска.
+        :param priority: Приоритет задач для поиска.
+        :param due_before: Срок не позже указанной даты (dd.mm.yyyy).
+        :param due_after: Срок не раньше указанной даты (dd.mm.yyyy).
+        :param overdue: Если True, только невыполненные задачи со сроком
+            раньше сегодняшнего дня.
         :return: Список найденных задач.
 
         """
+        return list(self._iter_tasks(task_id, keyword, category, status,
+                                     priority, due_before, due_after,
+                                     overdue))
+
+    def iter_tasks(self, task_id: int = None, keyword: str = None,
+                   category: str = None, status: str = None,
+                   priority: str = None, due_before: str = None,
+                   due_after: str = None, overdue: bool = False
+                   ) -> Iterator[Task]:
+        """Лениво перебирает задачи, подходящие под фильтры search_tasks, в
+        том же порядке и без построения промежуточных списков задач.
+        Сообщения об ошибках выводятся при начале перебора. Пока перебор не
+        завершен (или итератор не закрыт), удерживается блокировка чтения,
+        поэтому изменять задачи внутри цикла по итератору нельзя.
+        :return: Итератор по найденным задачам.
+
+        """
+        with self.lock.read():
+            yield from self._iter_tasks(task_id, keyword, category, status,
+                                        priority, due_before, due_after,
+                                        overdue)
+
+    def _iter_tasks(self, task_id: int = None, keyword: str = None,
+                    category: str = None, status: str = None,
+                    priority: str = None, due_before: str = None,
+                    due_after: str = None, overdue: bool = False
+                    ) -> Iterator[Task]:
+        """Перебирает найденные задачи без блокировки (см. iter_tasks).
+        :return: Итератор по найденным задачам.
+
+        """
+        if self._tasks is None:
+            found = self._search_storage(task_id, keyword, category, status,
+                                         priority, due_before, due_after,
+                                         overdue)
+            if found is not None:
+                yield from found
+                return
+
         results = self.tasks
         if task_id:
-            results = [task for task in results if task_id == task.id]
-            if not results:
+            task = self.tasks.get(task_id)
+            if task is None:
                 print(f"Предупреждение: Задача с ID {task_id} не найдена.")
-                return results
-        if keyword:
-            results = [task for task in results
-                       if keyword.lower() in task.title.lower() or
-                       keyword.lower() in task.description.lower()]
+                return
+            results = (task,)
+
+        index = self.tasks.index
+        matches = []
         if category:
-            results = [task for task in results
-                       if category.lower() in task.category.lower()]
+            matches.append(index('category').contains(category))
         if status:
-            results = [task for task in results
-                       if status.lower() == task.status.lower()]
-        return results
+            matches.append(index('status').equals(status))
+        if priority:
+            matches.append(index('priority').equals(priority))
+        text = index('text') if keyword else None
+        if text is not None:
+            candidates = text.candidates(keyword)
+            if candidates is not None:
+                matches.append(candidates)
+        if due_before or due_after or overdue:
+            low = parse_due_date(due_after) if due_after else None
+            high = parse_due_date(due_before) if due_before else None
+            if (due_after and low is None) or (due_before and high is None):
+                print("Ошибка: Неверный формат даты. Ожидается dd.mm.yyyy.")
+                return
+            if overdue:
+                yesterday = date.today().toordinal() - 1
+                high = yesterday if high is None else min(high, yesterday)
+            # Выполненные задачи не бывают просроченными, поэтому для
+            # overdue берется индекс без них.
+            name = 'open_due_date' if overdue else 'due_date'
+            matches.append(index(name).between(low, high))
+        if matches:
+            matches.sort(key=len)
+            if not task_id:
+                smallest = matches.pop(0)
+                results = map(smallest.get, sorted(smallest))
+            results = (task for task in results
+                       if all(task.id in match for match in matches))
+
+        if keyword:
+            words = keyword_words(keyword)
+            results = (task for task in results
+                       if matches_keyword(task, words))
+        yield from results
+
+    def _search_storage(self, task_id: int = None, keyword: str = None,
+                        category: str = None, status: str = None,
+                        priority: str = None, due_before: str = None,
+                        due_after: str = None, overdue: bool = False
+                        ) -> Optional[List[Task]]:
+        """Ищет задачи в хранилище, пока они не загружены в память (см.
+        lazy_indexes). Сообщения об ошибках такие же, как у поиска в памяти.
+        :return: Список найденных задач или None, если хранилище не
+            выполняет такой поиск.
+
+        """
+        for value in (due_before, due_after):
+            if value and parse_due_date(value) is None:
+                print("Ошибка: Неверный формат даты. Ожидается dd.mm.yyyy.")
+                return []
+        with self.metrics.phase('storage_search'):
+            found = self.storage.search(task_id, keyword, category, status,
+                                        priority, due_before, due_after,
+                                        overdue)
+            if found is None:
+                return None
+            found = list(found)
+        if task_id and not found:
+            print(f"Предупреждение: Задача с ID {task_id} не найдена.")
+        return found
+
+    @instrumented('export_tasks')
+    def export_tasks(self, filename: str = None, file_format: str = None,
+                     **filters) -> Optional[int]:
+        """Потоково выгружает задачи, подходящие под фильтры search_tasks, в
+        файл CSV или JSON Lines. Задачи сериализуются по одной, поэтому
+        потребление памяти не зависит от размера выгрузки.
+        :param filename: Путь к выходному файлу. None — вывод в sys.stdout.
+        :param file_format: 'csv' или 'jsonl'. None — по расширению файла,
+            а для sys.stdout — 'jsonl'.
+        :param filters: Параметры поиска, как у search_tasks.
+        :return: Количество выгруженных задач или None, если файл не
+            удалось записать.
+
+        """
+        from bulk_import import detect_format
+        from export import EXPORT_FORMATS, write_tasks
+
+        if filename is None:
+            return write_tasks(self.iter_tasks(**filters), sys.stdout,
+                               file_format or 'jsonl')
+        file_format = file_format or detect_format(filename)
+        if file_format not in EXPORT_FORMATS:
+            print(f"Ошибка: Неизвестный формат файла '{filename}'.")
+            return None
+        try:
+            with open(filename, 'w', encoding='utf-8', newline='') as file:
+                count = write_tasks(self.iter_tasks(**filters), file,
+                                    file_format)
+        except (IOError, OSError):
+            print(f"Не удалось записать файл '{filename}'.")
+            return None
+        print(f"Выгружено задач: {count}.")
+        return count
+
+    @instrumented('next_tasks')
+    @read_locked
+    def next_tasks(self, count: int = 10) -> List[Task]:
+        """Возвращает самые срочные невыполненные задачи: по приоритету
+        ('Высокий' > 'Средний' > 'Низкий'), затем по сроку выполнения.
+        Индекс срочности обновляется при каждом изменении, поэтому выборка не
+        требует сортировки всех задач.
+        :param count: Количество задач.
+        :return: Список задач по убыванию срочности или пустой список, если
+            количество отрицательное.
+
+        """
+        if count < 0:
+            print("Ошибка: Количество задач не может быть отрицательным.")
+            return []
+        return self.tasks.index('urgency').top(count)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Возвращает собранные метрики: сводки задержек операций и их фаз
+        (количество, среднее, минимум, максимум, процентили в секундах) и
+        счетчики вызовов и неудач. Если метрики не включены, словари пусты.
+        :return: Словарь с ключами 'latency' и 'counters'.
+
+        """
+        return self.metrics.stats()
+
+    def close(self) -> bool:
+        """Сохраняет отложенные изменения, останавливает автосохранение и
+        запись метрик и закрывает хранилище.
+        :return: True, если все изменения сохранены, иначе False.
+
+        """
+        saved = self.stop_autosave()
+        self.metrics.stop_dump()
+        self.storage.close()
+        return saved
+
+    @staticmethod
+    def format_task(task: Task) -> str:
+        """Форматирует задачу для вывода.
+        :param task: Задача.
+        :return: Строка с описанием задачи и переводом строки.
+
+        """
+        return (f"ID: {task.id}, Название: {task.title}, "
+                f"Описание: {task.description}, Категория: {task.category}, "
+                f"Срок: {task.due_date}, Приоритет: {task.priority}, "
+                f"Статус: {task.status}\n")
+
+    @staticmethod
+    def write_lines(lines: Iterator[str], file: TextIO = None,
+                    pager: Callable[[str], None] = None):
+        """Выводит строки крупными блоками по DISPLAY_CHUNK строк, чтобы не
+        вызывать запись в поток для каждой строки.
+        :param lines: Итератор по строкам с переводом строки.
+        :param file: Поток для вывода. По умолчанию sys.stdout.
+        :param pager: Функция, которой передается весь текст для постраничного
+            просмотра, или None.
+
+        """
+        if pager is not None:
+            pager(''.join(lines))
+            return
+        out = file if file is not None else sys.stdout
+        while True:
+            chunk = ''.join(islice(lines, TaskManager.DISPLAY_CHUNK))
+            if not chunk:
+                break
+            out.write(chunk)
 
     @staticmethod
-    def display_tasks(tasks: List[Task]):
-        """Выводит список задач в консоль.
-        :param tasks: Список задач для отображения.
-        :return: True, если задачи найдены, иначе False.
+    def validate_page(page_size: Optional[int], offset: int = 0) -> bool:
+        """Проверяет параметры страницы вывода.
+        :param page_size: Количество выводимых задач или None.
+        :param offset: Количество задач, пропускаемых перед выводом.
+        :return: True, если параметры допустимы, иначе False.
 
         """
-        if not tasks:
-            print("Задачи не найдены.")
+        if offset < 0:
+            print("Ошибка: Смещение не может быть отрицательным.")
             return False
-        for task in tasks:
-            print(f"ID: {task.id}, Название: {task.title}, "
-                  f"Описание: {task.description}, Категория: {task.category}, "
-                  f"Срок: {task.due_date}, Приоритет: {task.priority}, "
-                  f"Статус: {task.status}")
+        if page_size is not None and page_size < 0:
+            print("Ошибка: Количество задач на странице не может быть "
+                  "отрицательным.")
+            return False
+        return True
+
+    @staticmethod
+    def display_tasks(tasks: Iterable[Task], page_size: int = None,
+                      offset: int = 0, file: TextIO = None,
+                      pager: Callable[[str], None] = None) -> bool:
+        """Выводит список задач в консоль. Принимает любой итерируемый
+        объект, в том числе генератор; задачи вне выводимой страницы не
+        форматируются, а перебор останавливается после последней из них.
+        :param tasks: Задачи для отображения.
+        :param page_size: Количество выводимых задач. None — все задачи.
+        :param offset: Количество задач, пропускаемых перед выводом.
+        :param file: Поток для вывода. По умолчанию sys.stdout.
+        :param pager: Функция, которой передается весь текст для постраничного
+            просмотра, например pydoc.pager.
+        :return: True, если задачи найдены, иначе False (в том числе при
+            отрицательных page_size или offset).
+
+        """
+        if not TaskManager.validate_page(page_size, offset):
+            return False
+        stop = None if page_size is None else offset + page_size
+        tasks = islice(tasks, offset, stop)
+        first = next(tasks, None)
+        if first is None:
+            print("Задачи не найдены.", file=file)
+            return False
+        TaskManager.write_lines(map(TaskManager.format_task,
+                                    chain([first], tasks)), file, pager)
         return True
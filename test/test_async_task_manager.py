@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from async_task_manager import AsyncTaskManager
+from task_manager import TaskManager
+
+
+def slow_write(storage, delay=0.05):
+    """Оборачивает storage.write задержкой, как при медленном диске."""
+    original = storage.write
+
+    def write(*args):
+        time.sleep(delay)
+        return original(*args)
+    return patch.object(storage, 'write', side_effect=write)
+
+
+def test_writes_are_coalesced(tmp_path):
+    """Тест: изменения во время записи сохраняются одной следующей записью."""
+    filename = str(tmp_path / "tasks.json")
+
+    async def scenario():
+        manager = await AsyncTaskManager.open(filename=filename)
+        with slow_write(manager.manager.storage) as write:
+            for i in range(50):
+                await manager.add_task(f"Задача {i}", "Описание", "Работа",
+                                       "05.12.2024", "Средний")
+                await asyncio.sleep(0)
+            await manager.update_task(1, status="Выполнена")
+            await manager.delete_task(task_id=2)
+            assert await manager.close() is True
+        return write.call_count
+
+    writes = asyncio.run(scenario())
+
+    assert 1 <= writes < 10
+    reloaded = TaskManager(filename=filename)
+    assert len(reloaded.tasks) == 49
+    assert reloaded.tasks[0].status == "Выполнена"
+    assert reloaded.next_id == 51
+
+
+def test_loop_is_not_blocked(tmp_path):
+    """Тест: цикл событий продолжает работать во время записи."""
+    filename = str(tmp_path / "tasks.json")
+
+    async def scenario():
+        manager = await AsyncTaskManager.open(filename=filename)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.ensure_future(ticker())
+        with slow_write(manager.manager.storage, delay=0.2):
+            start = time.perf_counter()
+            await manager.add_task("Задача", "Описание", "Работа",
+                                   "05.12.2024", "Средний")
+            elapsed = time.perf_counter() - start
+            await manager.flush()
+        ticking.cancel()
+        await manager.close()
+        return elapsed, ticks
+
+    elapsed, ticks = asyncio.run(scenario())
+
+    assert elapsed < 0.1
+    assert ticks >= 10
+
+
+def test_failed_write_is_retried(tmp_path):
+    """Тест: несохраненные изменения остаются в очереди до успешной записи."""
+    filename = str(tmp_path / "tasks.json")
+
+    async def scenario():
+        manager = await AsyncTaskManager.open(filename=filename)
+        storage = manager.manager.storage
+        with patch.object(storage, 'write', return_value=False):
+            await manager.add_task("Задача", "Описание", "Работа",
+                                   "05.12.2024", "Средний")
+            assert await manager.flush() is False
+            assert manager.manager.dirty
+        assert await manager.flush() is True
+        await manager.close()
+
+    asyncio.run(scenario())
+
+    assert len(TaskManager(filename=filename).tasks) == 1
+
+
+def test_search(tmp_path):
+    """Тест: поиск возвращает задачи из памяти до завершения записи."""
+    async def scenario():
+        manager = await AsyncTaskManager.open(
+            filename=str(tmp_path / "tasks.json"))
+        await manager.add_task("Отчет", "Описание", "Работа", "05.12.2024",
+                               "Средний")
+        found = await manager.search_tasks(keyword="отчет")
+        await manager.close()
+        return found
+
+    assert [task.title for task in asyncio.run(scenario())] == ["Отчет"]
+
+
+def test_mutation_does_not_block_loop(tmp_path):
+    """Тест: ожидание блокировки записи не останавливает цикл событий."""
+    filename = str(tmp_path / "tasks.json")
+
+    async def scenario():
+        manager = await AsyncTaskManager.open(filename=filename)
+        lock = manager.manager.lock
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.ensure_future(ticker())
+        lock.acquire_write()
+        threading.Timer(0.2, lock.release_write).start()
+        assert await manager.add_task("Задача", "Описание", "Работа",
+                                      "05.12.2024", "Средний")
+        ticking.cancel()
+        await manager.close()
+        return ticks
+
+    assert asyncio.run(scenario()) >= 10
+
+
+def test_write_uses_task_snapshot(tmp_path):
+    """Тест: изменение задачи во время записи не попадает в эту запись."""
+    filename = str(tmp_path / "tasks.json")
+    written = []
+
+    async def scenario():
+        manager = await AsyncTaskManager.open(filename=filename)
+        storage = manager.manager.storage
+        original = storage.write
+
+        def write(records, tasks, next_id):
+            time.sleep(0.1)
+            written.append([task.title for task in tasks])
+            return original(records, tasks, next_id)
+
+        with patch.object(storage, 'write', side_effect=write):
+            await manager.add_task("Старое", "Описание", "Работа",
+                                   "05.12.2024", "Средний")
+            await asyncio.sleep(0.05)
+            await manager.update_task(1, title="Новое")
+            assert await manager.close() is True
+
+    asyncio.run(scenario())
+
+    assert written == [["Старое"], ["Новое"]]
+    assert TaskManager(filename=filename).tasks[0].title == "Новое"
@@ -0,0 +1,100 @@
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """Фикстура с путем к файлу задач, в котором уже есть три задачи."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename)
+    for i in range(3):
+        manager.add_task(f"Задача {i}", "Описание", "Работа", "05.12.2024",
+                         "Средний")
+    return filename
+
+
+def test_burst_is_saved_once(filename):
+    """Тест: серия изменений сохраняется одной записью."""
+    manager = TaskManager(filename=filename, autosave=0.2)
+
+    with patch.object(manager.storage, 'write',
+                      wraps=manager.storage.write) as write:
+        for i in range(10):
+            manager.update_task(1 + i % 3, title=f"Название {i}")
+        manager.add_task("Новая", "Описание", "Учеба", "06.12.2024", "Низкий")
+        assert write.call_count == 0
+        time.sleep(0.5)
+        assert write.call_count == 1
+
+    manager.close()
+    reloaded = TaskManager(filename=filename)
+    assert [task.title for task in reloaded.tasks] == [
+        "Название 9", "Название 7", "Название 8", "Новая"]
+
+
+def test_close_saves_pending_changes(filename):
+    """Тест: изменения сохраняются при закрытии до истечения интервала."""
+    manager = TaskManager(filename=filename, autosave=60)
+    manager.delete_task(task_id=2)
+    manager.update_task(1, status="Выполнена")
+
+    assert manager.dirty
+    assert manager.close() is True
+    assert not manager.dirty
+
+    reloaded = TaskManager(filename=filename)
+    assert [task.id for task in reloaded.tasks] == [1, 3]
+    assert reloaded.tasks[0].status == "Выполнена"
+
+
+def test_flush_and_stop(filename):
+    """Тест: flush сохраняет сразу, а после остановки запись немедленная."""
+    manager = TaskManager(filename=filename, autosave=60)
+    manager.add_task("Новая", "Описание", "Учеба", "06.12.2024", "Низкий")
+
+    assert manager.flush() is True
+    assert len(TaskManager(filename=filename).tasks) == 4
+
+    manager.stop_autosave()
+    manager.delete_task(task_id=4)
+    assert not manager.dirty
+    assert len(TaskManager(filename=filename).tasks) == 3
+
+
+def test_failed_autosave_keeps_changes(filename):
+    """Тест: при ошибке записи изменения остаются несохраненными."""
+    manager = TaskManager(filename=filename, autosave=0.05)
+
+    with patch.object(manager.storage, 'write', return_value=False):
+        manager.update_task(1, title="Новое название")
+        time.sleep(0.2)
+        assert manager.dirty
+
+    assert manager.close() is True
+    assert TaskManager(filename=filename).tasks[0].title == "Новое название"
+
+
+def test_repeated_stop_does_not_hang(tmp_path):
+    """Тест: остановка автосохранения во время записи не зависает."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    stopped = []
+
+    def stop():
+        stopped.append(manager.stop_autosave())
+
+    for i in range(40):
+        manager.start_autosave(0.001)
+        manager.add_task(f"Задача {i}", "Описание", "Работа", "05.12.2024",
+                         "Средний")
+        time.sleep(0.001 * (i % 4))
+        thread = threading.Thread(target=stop, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+
+    assert stopped == [True] * 40
+    assert len(TaskManager(filename=manager.filename).tasks) == 40
@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import patch
+
+from task_manager import BatchError, TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager с одной задачей."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.add_task("Задача 1", "Описание 1", "Работа", "05.12.2024",
+                     "Средний")
+    return manager
+
+
+def test_batch_saves_once(setup_task_manager):
+    """Тест: пакет изменений сохраняется одной записью файла."""
+    manager = setup_task_manager
+
+    with patch.object(manager.storage, 'save',
+                      wraps=manager.storage.save) as save_data:
+        with manager.batch():
+            for i in range(5):
+                manager.add_task(f"Задача {i}", "Описание", "Учеба",
+                                 "06.12.2024", "Низкий")
+            manager.update_task(1, status="Выполнена")
+            manager.delete_task(task_id=2)
+
+    assert save_data.call_count == 1
+    reloaded = TaskManager(filename=manager.filename)
+    assert len(reloaded.tasks) == 5
+    assert reloaded.tasks[0].status == "Выполнена"
+    assert reloaded.next_id == 7
+
+
+def test_batch_rollback_on_error(setup_task_manager):
+    """Тест: исключение внутри пакета откатывает изменения в памяти."""
+    manager = setup_task_manager
+
+    with patch.object(manager.storage, 'save') as save_data:
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.add_task("Задача 2", "Описание", "Учеба",
+                                 "06.12.2024", "Низкий")
+                manager.update_task(1, title="Новое название")
+                manager.delete_task(task_id=1)
+                raise RuntimeError("Ошибка синхронизации")
+
+    save_data.assert_not_called()
+    assert [task.id for task in manager.tasks] == [1]
+    assert manager.tasks[0].title == "Задача 1"
+    assert manager.next_id == 2
+
+
+def test_nested_batch_saves_with_outer(setup_task_manager):
+    """Тест: вложенный пакет сохраняется вместе с внешним."""
+    manager = setup_task_manager
+
+    with patch.object(manager.storage, 'save') as save_data:
+        with manager.batch():
+            with manager.batch():
+                manager.update_task(1, priority="Высокий")
+            save_data.assert_not_called()
+
+    assert save_data.call_count == 1
+
+
+def test_batch_with_journal(tmp_path):
+    """Тест: в режиме журнала пакет дописывается в журнал целиком."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename, journal=True)
+
+    with manager.batch():
+        manager.add_task("Задача 1", "Описание", "Работа", "05.12.2024",
+                         "Средний")
+        manager.update_task(1, status="Выполнена")
+
+    assert manager.storage.journal.records == 2
+    reloaded = TaskManager(filename=filename, journal=True)
+    assert reloaded.tasks[0].status == "Выполнена"
+
+
+def test_batch_rollback_on_failed_operation(setup_task_manager):
+    """Тест: невыполненная операция отменяет весь пакет."""
+    manager = setup_task_manager
+    manager.add_task("Задача 2", "Описание 2", "Личное", "06.12.2024",
+                     "Низкий")
+
+    with patch.object(manager.storage, 'write') as write:
+        with pytest.raises(BatchError):
+            with manager.batch():
+                manager.delete_task(task_id=1)
+                manager.update_task(2, status="Выполнена")
+                manager.add_task("", "Описание", "Учеба", "07.12.2024",
+                                 "Низкий")
+
+    write.assert_not_called()
+    assert [task.id for task in manager.tasks] == [1, 2]
+    assert manager.tasks.get(2).status == "Не выполнена"
+    assert manager.search_tasks(status="Выполнена") == []
+    assert manager.next_id == 3
+
+
+def test_batch_save_failure(setup_task_manager):
+    """Тест: ошибка сохранения пакета отменяет его и вызывает BatchError."""
+    manager = setup_task_manager
+
+    with patch.object(manager.storage, 'write', return_value=False):
+        with pytest.raises(BatchError):
+            with manager.batch():
+                manager.add_task("Задача 2", "Описание", "Учеба",
+                                 "06.12.2024", "Низкий")
+
+    assert [task.id for task in manager.tasks] == [1]
+    assert manager.next_id == 2
@@ -0,0 +1,57 @@
+import pytest
+
+import benchmark
+from validation import TASK_VALIDATOR
+
+
+def test_generate_tasks_is_reproducible():
+    """Тест: набор задач воспроизводим и проходит проверку."""
+    first = benchmark.generate_tasks(50, seed=1)
+    second = benchmark.generate_tasks(50, seed=1)
+
+    assert [task.to_dict() for task in first] == \
+        [task.to_dict() for task in second]
+    assert [task.id for task in first] == list(range(1, 51))
+    assert not list(TASK_VALIDATOR.validate_many(
+        task.to_dict() for task in first))
+
+
+@pytest.mark.parametrize("options", [{}, {"journal": True},
+                                     {"journal": True, "fsync": True}])
+def test_run_size(tmp_path, options):
+    """Тест: замер небольшого набора возвращает все операции."""
+    results = benchmark.run_size(200, str(tmp_path), **options)
+
+    assert set(results) == {"save_data", "load_data", "add_task",
+                            "update_task", "delete_task",
+                            *benchmark.SEARCHES}
+    assert all(result["ops_per_second"] > 0 for result in results.values())
+    assert results["load_data"]["peak_mb"] > 0
+    assert results["add_task"]["peak_mb"] is None
+
+
+def test_compare_flags_regressions():
+    """Тест: сравнение с базовыми результатами находит замедление."""
+    baseline = {"sizes": {"1000": {
+        "add_task": {"ops_per_second": 100.0},
+        "load_data": {"ops_per_second": 1000.0}}}}
+    results = {"sizes": {"1000": {
+        "add_task": {"ops_per_second": 70.0},
+        "load_data": {"ops_per_second": 900.0},
+        "search_id": {"ops_per_second": 5.0}}}}
+
+    regressions = benchmark.compare(results, baseline, threshold=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("1000 задач, add_task")
+    assert benchmark.compare(results, baseline, threshold=0.5) == []
+
+
+def test_cold_start():
+    """Тест: время запуска замеряется для всех команд."""
+    results = benchmark.cold_start([50], repeat=1)
+
+    assert set(results["50"]) == {"interpreter", "full_load", "done",
+                                  "search_category", "list"}
+    assert all(seconds > 0 for seconds in results["50"].values())
+    assert "done" in benchmark.format_cold_start(results)
@@ -0,0 +1,106 @@
+import pytest
+from unittest.mock import patch
+
+from binary_storage import (BinaryStorage, BinaryTaskFile, binary_to_json,
+                            json_to_binary)
+from storage import JsonStorage
+from task import Task
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def sample_tasks():
+    """Фикстура со списком задач в порядке, отличном от порядка ID."""
+    return [
+        Task(5, "Задача 5", "Описание 5", "Работа", "05.12.2024", "Средний"),
+        Task(2, "Задача 2", "", "Личное", "06.12.2024", "Высокий",
+             "Выполнена"),
+        Task(9, "Задача 9 ✓", "Многострочное\nописание", "Учеба",
+             "07.12.2024", "Низкий"),
+    ]
+
+
+@pytest.fixture
+def binary_file(tmp_path, sample_tasks):
+    """Фикстура с двоичным файлом задач."""
+    filename = str(tmp_path / "tasks.bin")
+    assert BinaryStorage(filename).save(sample_tasks, 10) is True
+    return filename
+
+
+def test_random_access_by_id(binary_file, sample_tasks):
+    """Тест: задача по ID читается без загрузки остальных."""
+    with BinaryTaskFile(binary_file) as reader:
+        assert len(reader) == 3
+        assert reader.next_id == 10
+        for task in sample_tasks:
+            assert reader.get(task.id).to_dict() == task.to_dict()
+        assert reader.get(1) is None
+        assert reader.get(7) is None
+        assert reader.get(100) is None
+
+
+def test_manager_with_binary_storage(binary_file, sample_tasks):
+    """Тест: TaskManager загружает и сохраняет задачи в двоичном файле."""
+    manager = TaskManager(storage=BinaryStorage(binary_file))
+
+    assert [task.to_dict() for task in manager.tasks] == [
+        task.to_dict() for task in sample_tasks]
+    assert manager.next_id == 10
+
+    manager.update_task(9, status="Выполнена")
+    manager.delete_task(task_id=5)
+    found = list(manager.storage.search(task_id=9))
+    assert [task.status for task in found] == ["Выполнена"]
+    assert list(manager.storage.search(task_id=5)) == []
+    assert manager.storage.search(task_id=9, keyword="задача") is None
+    manager.storage.close()
+
+
+def test_lazy_manager_searches_by_offset_table(binary_file, sample_tasks):
+    """Тест: при lazy_indexes задача по ID читается из файла без загрузки
+    остальных задач, а изменение загружает их.
+
+    """
+    storage = BinaryStorage(binary_file)
+    manager = TaskManager(storage=storage, lazy_indexes=True)
+    with patch.object(storage, 'load', wraps=storage.load) as load:
+        found = manager.search_tasks(task_id=9)
+        missing = manager.search_tasks(task_id=7)
+        load.assert_not_called()
+
+        assert manager.update_task(9, status="Выполнена") is True
+        load.assert_called_once()
+
+    assert [task.to_dict() for task in found] == [sample_tasks[2].to_dict()]
+    assert missing == []
+    reloaded = TaskManager(storage=BinaryStorage(binary_file))
+    assert reloaded.tasks.get(9).status == "Выполнена"
+    assert len(reloaded.tasks) == 3
+
+
+def test_json_round_trip(tmp_path, sample_tasks):
+    """Тест: преобразование JSON -> двоичный файл -> JSON без потерь."""
+    json_filename = str(tmp_path / "tasks.json")
+    binary_filename = str(tmp_path / "tasks.bin")
+    result_filename = str(tmp_path / "result.json")
+    JsonStorage(json_filename).save(sample_tasks, 10)
+
+    assert json_to_binary(json_filename, binary_filename) is True
+    assert binary_to_json(binary_filename, result_filename) is True
+
+    with open(json_filename, encoding='utf-8') as source, \
+            open(result_filename, encoding='utf-8') as result:
+        assert source.read() == result.read()
+
+
+@pytest.mark.parametrize("content", [b"", b"not a task file at all"])
+def test_invalid_file(tmp_path, content):
+    """Тест: поврежденный файл дает пустой список задач."""
+    filename = tmp_path / "tasks.bin"
+    filename.write_bytes(content)
+
+    manager = TaskManager(storage=BinaryStorage(str(filename)))
+
+    assert len(manager.tasks) == 0
+    assert manager.next_id == 1
@@ -0,0 +1,138 @@
+import json
+import pytest
+from unittest.mock import patch
+
+from task_manager import TaskManager
+
+CSV_DATA = (
+    "title,description,category,due_date,priority,status\n"
+    "Задача 1,Описание 1,Работа,05.12.2024,Средний,\n"
+    "Задача 2,Описание 2,Личное,06.12.2024,Высокий,Выполнена\n"
+    ",Без названия,Работа,07.12.2024,Низкий,\n"
+    "Задача 4,Описание 4,Работа,2024-12-08,Низкий,\n"
+    "Задача 5,Описание 5,Учеба,09.12.2024,Срочный,\n"
+    "Задача 6,Описание 6,Учеба,10.12.2024,Низкий,\n"
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Фикстура для создания TaskManager с одной задачей."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.add_task("Существующая", "Описание", "Работа", "01.12.2024",
+                     "Низкий")
+    return manager
+
+
+def write_jsonl(path, records):
+    """Записывает записи в файл JSON Lines."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for record in records:
+            line = (record if isinstance(record, str)
+                    else json.dumps(record, ensure_ascii=False))
+            file.write(line + "\n")
+
+
+def test_import_csv(manager, tmp_path):
+    """Тест: корректные строки CSV импортируются, ошибки попадают в отчет."""
+    source = tmp_path / "import.csv"
+    source.write_text(CSV_DATA, encoding='utf-8')
+
+    report = manager.import_tasks(str(source))
+
+    assert report.imported == 3
+    assert [line for line, _ in report.errors] == [4, 5, 6]
+    assert "Название" in report.errors[0][1]
+    assert [task.id for task in manager.tasks] == [1, 2, 3, 4]
+    assert manager.tasks[2].status == "Выполнена"
+    assert manager.tasks[1].status == "Не выполнена"
+    assert manager.next_id == 5
+
+
+def test_import_jsonl(manager, tmp_path):
+    """Тест: импорт из JSON Lines с пустыми и поврежденными строками."""
+    source = tmp_path / "import.jsonl"
+    write_jsonl(source, [
+        {"title": "Задача 1", "description": "Описание",
+         "category": "Работа", "due_date": "05.12.2024",
+         "priority": "Средний"},
+        "",
+        "{не json",
+        ["список"],
+        {"title": "Задача 2", "description": "Описание",
+         "category": "Учеба", "due_date": "06.12.2024",
+         "priority": "Высокий", "status": "Готово"},
+        {"title": "Задача 3", "description": "Описание",
+         "category": "Учеба", "due_date": "07.12.2024",
+         "priority": "Низкий", "id": 100},
+    ])
+
+    report = manager.import_tasks(str(source))
+
+    assert report.imported == 2
+    assert [line for line, _ in report.errors] == [3, 4, 5]
+    assert [task.id for task in manager.tasks] == [1, 2, 3]
+    assert manager.search_tasks(category="учеба")[0].title == "Задача 3"
+
+
+def test_import_persists_once(manager, tmp_path):
+    """Тест: импорт сохраняет данные один раз и переживает перезагрузку."""
+    source = tmp_path / "import.jsonl"
+    write_jsonl(source, [
+        {"title": f"Задача {i}", "description": "Описание",
+         "category": "Работа", "due_date": "05.12.2024",
+         "priority": "Средний"} for i in range(1000)
+    ])
+
+    with patch.object(manager.storage, 'save',
+                      wraps=manager.storage.save) as save:
+        report = manager.import_tasks(str(source), batch_size=64)
+
+    assert report.imported == 1000
+    assert save.call_count == 1
+    reloaded = TaskManager(filename=manager.filename)
+    assert len(reloaded.tasks) == 1001
+    assert reloaded.next_id == 1002
+    assert reloaded.tasks[-1].id == 1001
+
+
+def test_import_inside_batch_rolls_back(manager, tmp_path):
+    """Тест: импорт внутри пакета откатывается вместе с пакетом."""
+    source = tmp_path / "import.csv"
+    source.write_text(CSV_DATA, encoding='utf-8')
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.import_tasks(str(source))
+            raise RuntimeError("Отмена")
+
+    assert [task.id for task in manager.tasks] == [1]
+    assert manager.next_id == 2
+
+
+@pytest.mark.parametrize("filename, content", [
+    ("missing.csv", None),
+    ("import.txt", "title\n"),
+])
+def test_import_unreadable_file(manager, tmp_path, filename, content):
+    """Тест: отсутствующий файл или неизвестный формат не меняют задачи."""
+    source = tmp_path / filename
+    if content is not None:
+        source.write_text(content, encoding='utf-8')
+
+    assert manager.import_tasks(str(source)) is None
+    assert len(manager.tasks) == 1
+    assert manager.next_id == 2
+
+
+def test_import_save_failure(manager, tmp_path):
+    """Тест: если задачи не удалось сохранить, импорт отменяется."""
+    source = tmp_path / "import.csv"
+    source.write_text(CSV_DATA, encoding='utf-8')
+
+    with patch.object(manager.storage, 'save', return_value=False):
+        assert manager.import_tasks(str(source)) is None
+
+    assert [task.id for task in manager.tasks] == [1]
+    assert manager.next_id == 2
+    assert manager.search_tasks(keyword="Задача") == []
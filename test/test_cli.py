@@ -0,0 +1,128 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+import cli
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def tasks_file(tmp_path):
+    """Фикстура с путем к файлу, в который командами добавлены две
+    задачи.
+
+    """
+    filename = str(tmp_path / "tasks.json")
+    assert cli.main(["--tasks-file", filename, "add", "Отчет", "Описание",
+                     "Работа", "05.12.2024", "Высокий"]) == 0
+    assert cli.main(["--tasks-file", filename, "add", "Бег", "Утро",
+                     "Личное", "06.12.2024", "Низкий"]) == 0
+    return filename
+
+
+def run(tasks_file, *args):
+    """Выполняет команду с файлом задач и возвращает код завершения."""
+    return cli.main(["--tasks-file", tasks_file, *args])
+
+
+def test_add_prints_id(tasks_file, capsys):
+    """Тест: add выводит только ID новой задачи."""
+    capsys.readouterr()
+    assert run(tasks_file, "add", "Новая", "Описание", "Учеба",
+               "07.12.2024", "Средний") == 0
+
+    assert capsys.readouterr().out == "3\n"
+
+
+def test_done_update_delete(tasks_file):
+    """Тест: изменения сохраняются и видны при следующем запуске."""
+    assert run(tasks_file, "done", "1") == 0
+    assert run(tasks_file, "update", "2", "--title", "Пробежка",
+               "--due-date", "08.12.2024") == 0
+    assert run(tasks_file, "delete", "--category", "Работа") == 0
+
+    manager = TaskManager(filename=tasks_file, shared=True)
+    assert [(task.id, task.title, task.due_date) for task in
+            manager.tasks] == [(2, "Пробежка", "08.12.2024")]
+
+
+def test_failure_reports_to_stderr(tasks_file, capsys):
+    """Тест: при неудаче сообщения выводятся в stderr, код завершения 1."""
+    capsys.readouterr()
+    assert run(tasks_file, "done", "42") == 1
+    assert run(tasks_file, "update", "1", "--due-date", "31.02.2024") == 1
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Задача с ID 42 не найдена" in captured.err
+    assert "Ошибка" in captured.err
+
+
+def test_search_and_list(tasks_file, capsys):
+    """Тест: search и list выводят задачи без служебных сообщений."""
+    run(tasks_file, "done", "1")
+    capsys.readouterr()
+
+    assert run(tasks_file, "search", "--status", "Выполнена") == 0
+    assert capsys.readouterr().out.startswith("ID: 1, Название: Отчет")
+    assert run(tasks_file, "search", "бег", "--format", "jsonl") == 0
+    assert json.loads(capsys.readouterr().out)["id"] == 2
+    assert run(tasks_file, "search", "--category", "Учеба") == 1
+    capsys.readouterr()
+    assert run(tasks_file, "list", "--grouped") == 0
+    assert "Категория: 'Личное'" in capsys.readouterr().out
+    assert run(tasks_file, "list", "--limit", "1", "--offset", "1") == 0
+    assert capsys.readouterr().out.startswith("ID: 2,")
+
+
+def test_parser_does_not_load_manager():
+    """Тест: разбор аргументов не загружает модули менеджера задач."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, cli; cli.build_parser(); "
+                               "print('task_manager' in sys.modules)"],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(cli.__file__)))
+
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_indexes(tmp_path):
+    """Тест: отложенные индексы строятся при первом использовании и
+    учитывают изменения, сделанные до этого.
+
+    """
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"),
+                          lazy_indexes=True)
+    manager.add_task("Отчет", "Описание", "Работа", "05.12.2024", "Высокий")
+    manager.update_task(1, category="Учеба")
+
+    assert manager.tasks.indexes == {}
+    assert [task.id for task in manager.search_tasks(category="Учеба")] == [1]
+    assert set(manager.tasks.indexes) == {"category"}
+    assert manager.next_tasks(1)[0].id == 1
+    assert set(manager.tasks.indexes) == {"category", "urgency"}
+
+
+def test_export_after_writes(tasks_file, tmp_path, monkeypatch):
+    """Тест: задачи, добавленные командами, выгружаются export.py, а
+    задачи других программ не получают их ID.
+
+    """
+    import export
+
+    output = tmp_path / "export.csv"
+    assert run(tasks_file, "done", "2") == 0
+    monkeypatch.setattr("sys.argv", ["export.py", "--tasks-file", tasks_file,
+                                     "--output", str(output)])
+    with pytest.raises(SystemExit) as exit_info:
+        export.main()
+    manager = TaskManager(filename=tasks_file)
+    manager.add_task("Чтение", "Книга", "Учеба", "07.12.2024", "Средний")
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert exit_info.value.code == 0
+    assert len(lines) == 3 and "Выполнена" in lines[2]
+    assert [task.id for task in TaskManager(filename=tasks_file).tasks] == \
+        [1, 2, 3]
@@ -0,0 +1,128 @@
+import io
+import pytest
+
+from task import Task
+from task_manager import TaskManager
+
+
+def make_tasks(count):
+    """Создает список задач с ID от 1 до count."""
+    return [Task(i, f"Задача {i}", "Описание", "Работа" if i % 2 else "Личное",
+                 "05.12.2024", "Средний") for i in range(1, count + 1)]
+
+
+def shown_ids(output):
+    """Возвращает ID задач из вывода display_tasks."""
+    return [int(line.split(',')[0][len("ID: "):])
+            for line in output.splitlines() if line.startswith("ID: ")]
+
+
+@pytest.mark.parametrize("page_size, offset, expected_ids", [
+    (None, 0, list(range(1, 11))),
+    (3, 0, [1, 2, 3]),
+    (3, 4, [5, 6, 7]),
+    (5, 8, [9, 10]),
+    (None, 7, [8, 9, 10]),
+])
+def test_display_page(page_size, offset, expected_ids):
+    """Тест: выводится только запрошенная страница задач."""
+    out = io.StringIO()
+
+    result = TaskManager.display_tasks(make_tasks(10), page_size=page_size,
+                                       offset=offset, file=out)
+
+    assert result is True
+    assert shown_ids(out.getvalue()) == expected_ids
+
+
+def test_display_offset_past_end():
+    """Тест: смещение за концом списка дает сообщение об отсутствии задач."""
+    out = io.StringIO()
+
+    result = TaskManager.display_tasks(make_tasks(3), offset=5, file=out)
+
+    assert result is False
+    assert out.getvalue() == "Задачи не найдены.\n"
+
+
+@pytest.mark.parametrize("page_size, offset", [(3, -1), (-2, 0), (-1, -1)])
+def test_display_invalid_page(page_size, offset, capsys):
+    """Тест: отрицательные page_size и offset дают ошибку, а не
+    исключение."""
+    out = io.StringIO()
+
+    result = TaskManager.display_tasks(make_tasks(3), page_size, offset,
+                                       file=out)
+
+    assert result is False
+    assert out.getvalue() == ""
+    assert capsys.readouterr().out.startswith("Ошибка:")
+
+
+def test_display_generator_stops_early():
+    """Тест: из генератора берутся только задачи выводимой страницы."""
+    consumed = []
+
+    def generate():
+        for task in make_tasks(100):
+            consumed.append(task.id)
+            yield task
+
+    out = io.StringIO()
+    TaskManager.display_tasks(generate(), page_size=2, offset=1, file=out)
+
+    assert shown_ids(out.getvalue()) == [2, 3]
+    assert consumed == [1, 2, 3]
+
+
+def test_display_buffered_writes():
+    """Тест: вывод выполняется блоками, а не отдельной записью на задачу."""
+    class CountingWriter(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    out = CountingWriter()
+    TaskManager.display_tasks(make_tasks(2500), file=out)
+
+    assert len(shown_ids(out.getvalue())) == 2500
+    assert out.writes == 3
+
+
+def test_display_pager():
+    """Тест: весь текст страницы передается функции просмотра."""
+    pages = []
+
+    result = TaskManager.display_tasks(make_tasks(4), page_size=2,
+                                       pager=pages.append)
+
+    assert result is True
+    assert len(pages) == 1
+    assert shown_ids(pages[0]) == [1, 2]
+
+
+def test_display_grouped_page_size():
+    """Тест: в каждой категории выводится не больше page_size задач."""
+    manager = TaskManager()
+    manager.tasks = make_tasks(10)
+    out = io.StringIO()
+
+    result = manager.display_grouped_tasks(page_size=2, file=out)
+
+    assert result is True
+    assert "Категория: 'Работа'" in out.getvalue()
+    assert "Категория: 'Личное'" in out.getvalue()
+    assert shown_ids(out.getvalue()) == [1, 3, 2, 4]
+
+
+def test_display_grouped_negative_page_size(capsys):
+    """Тест: отрицательный page_size при группировке дает ошибку."""
+    manager = TaskManager()
+    manager.tasks = make_tasks(4)
+    out = io.StringIO()
+
+    assert manager.display_grouped_tasks(page_size=-1, file=out) is False
+    assert out.getvalue() == ""
+    assert "Ошибка" in capsys.readouterr().out
@@ -0,0 +1,88 @@
+import pytest
+
+from indexes import DueDateIndex
+from task import Task, parse_due_date
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager с задачами на разные сроки."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.tasks = [
+        Task(1, "Задача 1", "Описание", "Работа", "10.12.2024", "Средний"),
+        Task(2, "Задача 2", "Описание", "Работа", "01.12.2024", "Высокий",
+             "Выполнена"),
+        Task(3, "Задача 3", "Описание", "Личное", "05.12.2024", "Низкий"),
+        Task(4, "Задача 4", "Описание", "Учеба", "31.12.2099", "Средний"),
+        Task(5, "Задача 5", "Описание", "Личное", "05.12.2024", "Высокий"),
+    ]
+    manager.next_id = 6
+    return manager
+
+
+@pytest.mark.parametrize("search_params, expected_ids", [
+    ({"due_before": "05.12.2024"}, [2, 3, 5]),
+    ({"due_after": "05.12.2024"}, [1, 3, 4, 5]),
+    ({"due_after": "02.12.2024", "due_before": "10.12.2024"}, [1, 3, 5]),
+    ({"due_after": "11.12.2024", "due_before": "30.12.2024"}, []),
+    ({"overdue": True}, [1, 3, 5]),
+    ({"overdue": True, "priority": "высокий"}, [5]),
+    ({"overdue": True, "due_after": "06.12.2024"}, [1]),
+    ({"due_before": "31.02.2024"}, []),  # Несуществующая дата
+    ({"due_after": "2024-12-01"}, []),  # Неверный формат
+])
+def test_search_by_due_date(setup_task_manager, search_params,
+                            expected_ids):
+    """Тест для поиска по диапазону сроков и просроченных задач."""
+    manager = setup_task_manager
+
+    result = manager.search_tasks(**search_params)
+
+    assert [task.id for task in result] == expected_ids
+
+
+def test_due_date_index_follows_mutations(setup_task_manager):
+    """Тест: индекс сроков обновляется при изменении и удалении задач."""
+    manager = setup_task_manager
+
+    manager.update_task(4, due_date="01.01.2020")
+    manager.update_task(1, status="Выполнена")
+    manager.delete_task(task_id=3)
+    manager.add_task("Задача 6", "Описание", "Работа", "02.01.2020",
+                     "Низкий")
+
+    assert [task.id for task in manager.search_tasks(overdue=True)] == \
+        [4, 5, 6]
+    assert [task.id for task in
+            manager.search_tasks(due_before="02.01.2020")] == [4, 6]
+
+
+def test_due_date_index_order():
+    """Тест: индекс возвращает задачи по возрастанию срока."""
+    index = DueDateIndex()
+    tasks = [Task(1, "А", "Б", "В", "03.01.2025", "Низкий"),
+             Task(2, "А", "Б", "В", "01.01.2025", "Низкий"),
+             Task(3, "А", "Б", "В", "не дата", "Низкий"),
+             Task(4, "А", "Б", "В", "02.01.2025", "Низкий")]
+    for task in tasks:
+        index.add(task)
+
+    assert list(index.between()) == [2, 4, 1]
+    assert list(index.between(parse_due_date("02.01.2025"))) == [4, 1]
+    index.discard(tasks[3])
+    index.discard(tasks[2])
+    assert list(index.between(high=parse_due_date("02.01.2025"))) == [2]
+
+
+def test_open_due_date_index_skips_completed(setup_task_manager):
+    """Тест: индекс для overdue не хранит выполненные задачи."""
+    manager = setup_task_manager
+    index = manager.tasks.index('open_due_date')
+
+    assert list(index.between()) == [3, 5, 1, 4]
+    manager.update_task(3, status="Выполнена")
+    manager.update_task(2, status="Не выполнена")
+    assert list(index.between()) == [2, 5, 1, 4]
+    assert [task.id for task in manager.search_tasks(overdue=True)] == \
+        [1, 2, 5]
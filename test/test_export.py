@@ -0,0 +1,94 @@
+import csv
+import json
+import pytest
+
+from task import Task
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Фикстура для создания TaskManager с несколькими задачами."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.tasks = [
+        Task(1, "Отчет", "Квартальный отчет", "Работа", "05.12.2024",
+             "Высокий"),
+        Task(2, "Спорт", "Пробежка, 5 км", "Личное", "06.12.2024",
+             "Низкий", "Выполнена"),
+        Task(3, "Письмо", "Ответить на письмо", "Работа", "07.12.2024",
+             "Средний"),
+    ]
+    manager.next_id = 4
+    return manager
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"category": "работа"},
+    {"status": "Выполнена"},
+    {"keyword": "письмо", "category": "Работа"},
+    {"due_after": "06.12.2024"},
+    {"task_id": 2, "priority": "Низкий"},
+    {"task_id": 2, "priority": "Высокий"},
+])
+def test_iter_tasks_matches_search(manager, filters):
+    """Тест: ленивый перебор совпадает с search_tasks."""
+    assert list(manager.iter_tasks(**filters)) == \
+        manager.search_tasks(**filters)
+
+
+def test_export_jsonl(manager, tmp_path):
+    """Тест: выгрузка в JSON Lines с фильтром."""
+    output = tmp_path / "export.jsonl"
+
+    count = manager.export_tasks(str(output), category="Работа")
+
+    assert count == 2
+    lines = output.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [
+        manager.tasks[0].to_dict(), manager.tasks[2].to_dict()]
+
+
+def test_export_csv_round_trip(manager, tmp_path):
+    """Тест: выгрузка в CSV загружается обратно импортом."""
+    output = tmp_path / "export.csv"
+
+    assert manager.export_tasks(str(output)) == 3
+    with open(output, encoding='utf-8', newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert rows[1]["description"] == "Пробежка, 5 км"
+
+    target = TaskManager(filename=str(tmp_path / "copy.json"))
+    report = target.import_tasks(str(output))
+    assert report.imported == 3
+    assert [task.to_dict() for task in target.tasks] == \
+        [task.to_dict() for task in manager.tasks]
+
+
+def test_export_to_stdout(manager, capsys):
+    """Тест: без имени файла задачи выводятся в консоль."""
+    count = manager.export_tasks(file_format="csv", status="Выполнена")
+    captured = capsys.readouterr()
+
+    assert count == 1
+    assert captured.out.splitlines() == [
+        "id,title,description,category,due_date,priority,status",
+        '2,Спорт,"Пробежка, 5 км",Личное,06.12.2024,Низкий,Выполнена']
+
+
+def test_export_is_lazy(manager, tmp_path, monkeypatch):
+    """Тест: выгрузка не вызывает search_tasks и не строит список."""
+    def fail(*args, **kwargs):
+        raise AssertionError("search_tasks не должен вызываться")
+
+    monkeypatch.setattr(manager, "search_tasks", fail)
+
+    assert manager.export_tasks(str(tmp_path / "export.jsonl")) == 3
+
+
+def test_export_unknown_format(manager, tmp_path):
+    """Тест: неизвестное расширение файла не создает выгрузку."""
+    output = tmp_path / "export.txt"
+
+    assert manager.export_tasks(str(output)) is None
+    assert not output.exists()
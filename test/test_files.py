@@ -65,7 +65,8 @@ def test_save_data_success(setup_task_manager, tasks_to_save,
         'next_id': len(tasks_to_save) + 1
     }
 
-    with patch("builtins.open", mock_open()) as mock_file:
+    with patch("builtins.open", mock_open()) as mock_file, \
+            patch("os.fsync"), patch("os.replace") as mock_replace:
         setup_task_manager.tasks = tasks_to_save
         setup_task_manager.next_id = len(tasks_to_save) + 1
 
@@ -82,6 +83,11 @@ def test_save_data_success(setup_task_manager, tasks_to_save,
                 [call[0][0] for call in mock_file().write.call_args_list])
 
             assert written_data.strip() == expected_json.strip()
+            # Снимок пишется во временный файл и затем заменяет исходный.
+            mock_file.assert_any_call("test_tasks.json.tmp", 'w',
+                                      encoding='utf-8')
+            mock_replace.assert_called_once_with("test_tasks.json.tmp",
+                                                 "test_tasks.json")
 
 
 def test_save_data_error_handling(setup_task_manager):
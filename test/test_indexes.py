@@ -0,0 +1,125 @@
+import pytest
+import random
+from unittest.mock import patch
+
+from indexes import FieldIndex, SortedBlocks, UrgencyIndex
+from task import Task
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager с несколькими задачами."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.tasks = [
+        Task(1, "Отчет", "Квартальный отчет", "Работа", "05.12.2024",
+             "Высокий"),
+        Task(2, "Спорт", "Пробежка", "Личное", "06.12.2024", "Низкий"),
+        Task(3, "Письмо", "Ответить клиенту", "работа", "07.12.2024",
+             "Средний", "Выполнена"),
+        Task(4, "Курс", "Пройти модуль", "Учеба/Работа", "08.12.2024",
+             "Высокий"),
+    ]
+    return manager
+
+
+def test_field_index_add_discard():
+    """Тест: индекс учитывает регистр и удаляет задачу по старому
+    значению после изменения атрибута."""
+    index = FieldIndex('category')
+    task = Task(1, "Задача", "Описание", "РАБОТА", "05.12.2024", "Средний")
+    index.add(task)
+
+    assert list(index.equals("работа")) == [1]
+
+    task.category = "Личное"
+    index.discard(task)
+    index.add(task)
+
+    assert index.equals("Работа") == {}
+    assert list(index.equals("личное")) == [1]
+    assert index.keys() == ["личное"]
+
+
+def test_sorted_blocks_match_sorted_list():
+    """Тест: блочный список совпадает с отсортированным списком при
+    вставках, удалениях, разбиении и удалении блоков."""
+    generator = random.Random(0)
+    expected = []
+    with patch.object(SortedBlocks, "LOAD", 4):
+        blocks = SortedBlocks([(5, 0), (1, 1)])
+        expected.extend([(5, 0), (1, 1)])
+        for number in range(2, 2000):
+            if expected and generator.random() < 0.45:
+                item = generator.choice(expected)
+                expected.remove(item)
+                blocks.remove(item)
+            else:
+                item = (generator.randint(0, 50), number)
+                expected.append(item)
+                blocks.add(item)
+        expected.sort()
+
+        assert list(blocks) == expected and len(blocks) == len(expected)
+        assert list(blocks.irange((10,), (20, float('inf')))) == [
+            item for item in expected if 10 <= item[0] <= 20]
+        assert list(blocks.irange(None, (3, float('inf')))) == [
+            item for item in expected if item[0] <= 3]
+        with pytest.raises(ValueError):
+            blocks.remove((100, 0))
+
+
+def test_urgency_index_skips_stale_keys():
+    """Тест: выборка пропускает удаленные и устаревшие ключи, в том числе
+    после перестройки кучи."""
+    index = UrgencyIndex()
+    tasks = [Task(i, "Задача", "Описание", "Работа",
+                  f"{i % 28 + 1:02d}.12.2024", "Низкий")
+             for i in range(1, 201)]
+    index.add_many(tasks)
+    for task in tasks[:150]:
+        index.discard(task)
+        if task.id % 3 == 0:
+            task.priority = "Высокий"
+            index.add(task)
+
+    expected = sorted((task for task in tasks
+                       if task.id > 150 or task.id % 3 == 0),
+                      key=UrgencyIndex.key)
+    assert index.top(20) == expected[:20]
+    assert index.top(1000) == expected
+
+
+@pytest.mark.parametrize("search_params, expected_ids", [
+    ({"category": "работа"}, [1, 3, 4]),
+    ({"category": "учеба"}, [4]),
+    ({"status": "выполнена"}, [3]),
+    ({"priority": "Высокий"}, [1, 4]),
+    ({"category": "Работа", "priority": "высокий"}, [1, 4]),
+    ({"category": "Работа", "status": "Не выполнена",
+      "keyword": "отчет"}, [1]),
+    ({"task_id": 3, "category": "работа"}, [3]),
+    ({"task_id": 2, "category": "работа"}, []),
+    ({"priority": "Нет такого"}, []),
+])
+def test_search_uses_indexes(setup_task_manager, search_params, expected_ids):
+    """Тест: поиск по индексированным полям."""
+    manager = setup_task_manager
+
+    result = manager.search_tasks(**search_params)
+
+    assert [task.id for task in result] == expected_ids
+
+
+def test_indexes_follow_mutations(setup_task_manager):
+    """Тест: индексы обновляются при изменении и удалении задач."""
+    manager = setup_task_manager
+
+    manager.update_task(2, category="Работа", status="Выполнена")
+    assert [task.id for task in manager.search_tasks(status="Выполнена")] \
+        == [2, 3]
+
+    assert manager.delete_task(category="РАБОТА") is True
+    assert [task.id for task in manager.tasks] == [4]
+    assert manager.search_tasks(category="работа") == [manager.tasks[0]]
+    assert manager.search_tasks(status="выполнена") == []
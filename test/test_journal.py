@@ -0,0 +1,128 @@
+import pytest
+import json
+import os
+from unittest.mock import patch
+
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager в режиме журнала."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename, journal=True)
+    manager.add_task("Задача 1", "Описание 1", "Работа", "05.12.2024",
+                     "Средний")
+    manager.add_task("Задача 2", "Описание 2", "Личное", "06.12.2024",
+                     "Высокий")
+    return manager
+
+
+def test_mutations_append_to_journal(setup_task_manager):
+    """Тест: изменения дописываются в журнал, снимок не создается."""
+    manager = setup_task_manager
+
+    manager.update_task(1, status="Выполнена")
+    manager.delete_task(task_id=2)
+
+    assert not os.path.exists(manager.filename)
+    with open(manager.storage.journal.filename, encoding='utf-8') as file:
+        records = [json.loads(line) for line in file]
+    assert [record['op'] for record in records] == [
+        'add', 'add', 'update', 'delete']
+    assert records[2]['fields'] == {'status': 'Выполнена'}
+
+
+def test_load_replays_snapshot_and_journal(setup_task_manager):
+    """Тест: при загрузке к снимку применяются записи журнала."""
+    manager = setup_task_manager
+    manager.save_data()
+    manager.update_task(1, title="Новое название")
+    manager.delete_task(task_id=2)
+    manager.add_task("Задача 3", "Описание 3", "Учеба", "07.12.2024",
+                     "Низкий")
+
+    reloaded = TaskManager(filename=manager.filename, journal=True)
+
+    assert [task.id for task in reloaded.tasks] == [1, 3]
+    assert reloaded.tasks[0].title == "Новое название"
+    assert reloaded.next_id == 4
+
+
+def test_save_data_truncates_journal(setup_task_manager):
+    """Тест: полная запись снимка очищает журнал."""
+    manager = setup_task_manager
+
+    assert manager.save_data() is True
+
+    assert os.path.getsize(manager.storage.journal.filename) == 0
+    assert manager.storage.journal.records == 0
+    reloaded = TaskManager(filename=manager.filename, journal=True)
+    assert len(reloaded.tasks) == 2
+
+
+def test_compaction_threshold(tmp_path):
+    """Тест: при достижении порога журнал сворачивается в снимок."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename, journal=True,
+                          compact_threshold=3)
+    for i in range(3):
+        manager.add_task(f"Задача {i}", "Описание", "Работа", "05.12.2024",
+                         "Средний")
+
+    assert os.path.exists(filename)
+    assert manager.storage.journal.records == 0
+
+
+def test_torn_journal_tail_is_skipped(setup_task_manager):
+    """Тест: оборванная последняя запись журнала пропускается."""
+    manager = setup_task_manager
+    journal = manager.storage.journal
+    with open(journal.filename, 'a', encoding='utf-8') as file:
+        file.write('{"op": "delete", "ids": [1')
+
+    reloaded = TaskManager(filename=manager.filename, journal=True)
+
+    assert [task.id for task in reloaded.tasks] == [1, 2]
+
+
+def test_failed_snapshot_keeps_previous_file(setup_task_manager):
+    """Тест: сбой при записи снимка не повреждает сохраненный файл."""
+    manager = setup_task_manager
+    assert manager.save_data() is True
+    with open(manager.filename, encoding='utf-8') as file:
+        saved = file.read()
+
+    manager.update_task(1, title="Новое название")
+    with patch("json.dump", side_effect=OSError("Диск заполнен")):
+        assert manager.save_data() is False
+
+    with open(manager.filename, encoding='utf-8') as file:
+        assert file.read() == saved
+    assert not os.path.exists(manager.filename + '.tmp')
+
+
+def test_fsync_option(tmp_path):
+    """Тест: параметр fsync включает os.fsync после записи в журнал."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"),
+                          journal=True, fsync=True)
+
+    with patch("os.fsync") as fsync:
+        manager.add_task("Задача", "Описание", "Работа", "05.12.2024",
+                         "Средний")
+
+    assert manager.storage.journal.fsync is True
+    fsync.assert_called_once()
+
+
+@pytest.mark.parametrize("fsync, expected_calls", [(False, 0), (True, 1)])
+def test_snapshot_fsync_option(tmp_path, fsync, expected_calls):
+    """Тест: os.fsync перед заменой снимка вызывается только с fsync."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"), fsync=fsync)
+
+    with patch("os.fsync") as mock_fsync:
+        manager.add_task("Задача", "Описание", "Работа", "05.12.2024",
+                         "Средний")
+
+    assert mock_fsync.call_count == expected_calls
+    assert TaskManager(filename=manager.filename).tasks[0].title == "Задача"
@@ -0,0 +1,79 @@
+import pytest
+import io
+import json
+
+from json_stream import JsonArrayStream
+from task_manager import TaskManager
+
+
+def make_document(count, next_id_first=False):
+    """Создает JSON-документ с задачами в формате tasks.json."""
+    tasks = [{'id': i, 'title': f"Задача {i}", 'description': "Описание",
+              'category': "Работа", 'due_date': "05.12.2024",
+              'priority': "Средний", 'status': "Не выполнена"}
+             for i in range(1, count + 1)]
+    if next_id_first:
+        data = {'next_id': 1234567, 'tasks': tasks}
+    else:
+        data = {'tasks': tasks, 'next_id': 1234567}
+    return json.dumps(data, ensure_ascii=False, indent=4), tasks
+
+
+@pytest.mark.parametrize("count, next_id_first, chunk_size", [
+    (0, False, 7),
+    (1, False, 1),
+    (25, False, 7),  # Границы блоков внутри записей и чисел
+    (25, True, 16),
+    (25, False, 1 << 16),
+])
+def test_stream_matches_json_load(count, next_id_first, chunk_size):
+    """Тест: потоковый разбор дает те же данные, что и json.load."""
+    document, tasks = make_document(count, next_id_first)
+
+    stream = JsonArrayStream(io.StringIO(document), chunk_size=chunk_size)
+
+    assert list(stream) == tasks
+    assert stream.fields == {'next_id': 1234567}
+    assert stream.position == len(document)
+
+
+@pytest.mark.parametrize("document", [
+    '{"tasks": [{"id": 1}, ',
+    '{"tasks": [{"id": 1}} ',
+    '[1, 2]',
+    '',
+])
+def test_stream_rejects_invalid_json(document):
+    """Тест: поврежденный документ вызывает JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        list(JsonArrayStream(io.StringIO(document), chunk_size=4))
+
+
+def test_manager_stream_load(tmp_path):
+    """Тест: TaskManager загружает задачи потоково и сообщает о ходе
+    загрузки."""
+    document, tasks = make_document(25)
+    filename = tmp_path / "tasks.json"
+    filename.write_text(document, encoding='utf-8')
+    manager = TaskManager(filename=str(filename), stream_load=True)
+    manager.storage.PROGRESS_EVERY = 10
+    reports = []
+
+    assert manager.load_data(progress=lambda *args: reports.append(args)) \
+        is True
+
+    assert [task.to_dict() for task in manager.tasks] == tasks
+    assert manager.next_id == 1234567
+    assert [loaded for loaded, _ in reports] == [10, 20, 25]
+    assert manager.search_tasks(task_id=3)[0].title == "Задача 3"
+
+
+def test_manager_stream_load_corrupted(tmp_path):
+    """Тест: поврежденный файл при потоковой загрузке дает пустой список."""
+    filename = tmp_path / "tasks.json"
+    filename.write_text('{"tasks": [{"id": 1', encoding='utf-8')
+
+    manager = TaskManager(filename=str(filename), stream_load=True)
+
+    assert len(manager.tasks) == 0
+    assert manager.next_id == 1
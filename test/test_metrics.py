@@ -0,0 +1,89 @@
+import json
+import pytest
+
+from metrics import NULL_METRICS, Histogram
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Фикстура для создания TaskManager с включенными метриками."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"),
+                          metrics=True)
+    yield manager
+    manager.close()
+
+
+def test_histogram_percentiles():
+    """Тест: процентили оцениваются по границам корзин."""
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.add(0.000001)
+    for _ in range(10):
+        histogram.add(0.5)
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(0.000001)
+    assert 0.5 <= summary["p99"] <= 1.0
+    assert summary["max"] == 0.5
+
+
+def test_metrics_disabled_by_default(tmp_path):
+    """Тест: по умолчанию метрики не собираются."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.add_task("Задача", "Описание", "Работа", "05.12.2024", "Средний")
+
+    assert manager.metrics is NULL_METRICS
+    assert manager.stats() == {"latency": {}, "counters": {}}
+
+
+def test_operations_and_phases(manager):
+    """Тест: операции и их фазы попадают в гистограммы и счетчики."""
+    manager.add_task("Задача", "Описание", "Работа", "05.12.2024", "Средний")
+    manager.add_task("", "Описание", "Работа", "05.12.2024", "Средний")
+    manager.update_task(1, status="Выполнена")
+    manager.search_tasks(category="Работа")
+    manager.delete_task(task_id=1)
+
+    stats = manager.stats()
+    latency = stats["latency"]
+
+    for name in ("add_task", "add_task.validate", "add_task.index",
+                 "add_task.serialize", "add_task.write", "update_task",
+                 "update_task.validate", "update_task.index", "search_tasks",
+                 "delete_task", "delete_task.index", "load_data.deserialize"):
+        assert name in latency
+    assert latency["add_task"]["count"] == 2
+    assert latency["add_task.write"]["count"] == 1
+    assert stats["counters"]["add_task.calls"] == 2
+    assert stats["counters"]["add_task.failures"] == 1
+    assert "update_task.failures" not in stats["counters"]
+
+
+def test_journal_phases(tmp_path):
+    """Тест: запись журнала с fsync разбивается на фазы."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"),
+                          journal=True, fsync=True, metrics=True)
+
+    manager.add_task("Задача", "Описание", "Работа", "05.12.2024", "Средний")
+    manager.save_data()
+
+    latency = manager.stats()["latency"]
+    assert {"add_task.serialize", "add_task.write", "add_task.fsync",
+            "save_data.write", "save_data.fsync"} <= set(latency)
+
+
+def test_periodic_dump(tmp_path):
+    """Тест: метрики периодически записываются в файл."""
+    metrics_file = tmp_path / "metrics.json"
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"),
+                          metrics=True, metrics_file=str(metrics_file),
+                          metrics_interval=0.01)
+    manager.add_task("Задача", "Описание", "Работа", "05.12.2024", "Средний")
+    manager.close()
+
+    data = json.loads(metrics_file.read_text(encoding="utf-8"))
+    assert data["counters"]["add_task.calls"] == 1
+    assert "time" in data
@@ -0,0 +1,73 @@
+import pytest
+
+from task import Task
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager с задачами разной срочности."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.tasks = [
+        Task(1, "Задача 1", "Описание", "Работа", "10.12.2024", "Низкий"),
+        Task(2, "Задача 2", "Описание", "Работа", "20.12.2024", "Высокий"),
+        Task(3, "Задача 3", "Описание", "Личное", "05.12.2024", "Высокий",
+             "Выполнена"),
+        Task(4, "Задача 4", "Описание", "Учеба", "01.12.2024", "Средний"),
+        Task(5, "Задача 5", "Описание", "Личное", "15.12.2024", "Высокий"),
+        Task(6, "Задача 6", "Описание", "Личное", "не дата", "Высокий"),
+    ]
+    manager.next_id = 7
+    return manager
+
+
+def expected_order(manager):
+    """Порядок, полученный полной сортировкой невыполненных задач."""
+    rank = {'Высокий': 0, 'Средний': 1, 'Низкий': 2}
+    open_tasks = [task for task in manager.tasks
+                  if task.status != 'Выполнена']
+    open_tasks.sort(key=lambda task: (
+        rank[task.priority],
+        float('inf') if task.due_ordinal is None else task.due_ordinal,
+        task.id))
+    return [task.id for task in open_tasks]
+
+
+@pytest.mark.parametrize("count, expected_ids", [
+    (1, [5]),
+    (3, [5, 2, 6]),
+    (10, [5, 2, 6, 4, 1]),
+    (0, []),
+])
+def test_next_tasks(setup_task_manager, count, expected_ids):
+    """Тест: самые срочные невыполненные задачи."""
+    manager = setup_task_manager
+
+    assert [task.id for task in manager.next_tasks(count)] == expected_ids
+
+
+def test_next_tasks_follow_updates(setup_task_manager):
+    """Тест: порядок обновляется при изменении статуса, приоритета, срока
+    и при удалении задач."""
+    manager = setup_task_manager
+
+    manager.update_task(3, status="Не выполнена")
+    manager.update_task(5, priority="Низкий")
+    manager.update_task(1, due_date="01.01.2024")
+    manager.update_task(2, status="Выполнена")
+    manager.delete_task(task_id=6)
+    manager.add_task("Задача 7", "Описание", "Работа", "02.12.2024",
+                     "Высокий")
+
+    assert [task.id for task in manager.next_tasks(10)] == \
+        expected_order(manager) == [7, 3, 4, 1, 5]
+
+
+def test_next_tasks_negative_count(setup_task_manager, capsys):
+    """Тест: отрицательное количество дает пустой список и ошибку."""
+    manager = setup_task_manager
+
+    assert manager.next_tasks(-2) == []
+    assert "Ошибка" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        manager.tasks.index('urgency').top(-1)
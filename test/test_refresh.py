@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import patch
+
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """Фикстура с путем к файлу задач, в котором уже есть три задачи."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename)
+    manager.add_task("Задача 1", "Описание", "Работа", "05.12.2024",
+                     "Средний")
+    manager.add_task("Задача 2", "Описание", "Личное", "06.12.2024",
+                     "Высокий")
+    manager.add_task("Задача 3", "Описание", "Работа", "07.12.2024",
+                     "Низкий")
+    return filename
+
+
+def test_unchanged_file_is_not_read(filename):
+    """Тест: если файл не менялся, он не читается заново."""
+    manager = TaskManager(filename=filename)
+    manager.update_task(1, status="Выполнена")
+
+    with patch.object(manager.storage, 'load') as load:
+        assert manager.refresh() is False
+    load.assert_not_called()
+
+
+def test_rewritten_snapshot_reuses_tasks(filename):
+    """Тест: после перезаписи снимка неизмененные задачи и индексы
+    сохраняются, а изменения применяются на месте.
+
+    """
+    manager = TaskManager(filename=filename)
+    first, second = manager.tasks.get(1), manager.tasks.get(2)
+
+    other = TaskManager(filename=filename)
+    other.update_task(2, category="Учеба", title="Новое название")
+    other.delete_task(task_id=3)
+    other.add_task("Задача 4", "Описание", "Работа", "08.12.2024", "Низкий")
+
+    assert manager.refresh() is True
+    assert manager.tasks.get(1) is first
+    assert manager.tasks.get(2) is second
+    assert second.title == "Новое название"
+    assert [task.id for task in manager.tasks] == [1, 2, 4]
+    assert [task.id for task in manager.search_tasks(category="Учеба")] == [2]
+    assert [task.id for task in manager.search_tasks(category="Работа")] == [
+        1, 4]
+    assert manager.next_id == 5
+    assert manager.refresh() is False
+
+
+def test_journal_records_are_applied(tmp_path):
+    """Тест: в режиме журнала читаются только новые записи журнала."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename, journal=True)
+    manager.add_task("Задача 1", "Описание", "Работа", "05.12.2024",
+                     "Средний")
+
+    other = TaskManager(filename=filename, journal=True)
+    other.update_task(1, status="Выполнена")
+    other.add_task("Задача 2", "Описание", "Личное", "06.12.2024", "Высокий")
+
+    with patch.object(manager.storage, 'load') as load:
+        assert manager.refresh() is True
+    load.assert_not_called()
+    assert manager.tasks[0].status == "Выполнена"
+    assert [task.id for task in manager.tasks] == [1, 2]
+    assert manager.next_id == 3
+
+
+def test_unsaved_changes_are_kept(filename):
+    """Тест: несохраненные изменения применяются поверх загруженных."""
+    manager = TaskManager(filename=filename)
+    manager.deferred = True
+    manager.update_task(1, title="Свое название")
+    manager.add_task("Своя", "Описание", "Учеба", "09.12.2024", "Низкий")
+
+    other = TaskManager(filename=filename)
+    other.add_task("Чужая", "Описание", "Работа", "08.12.2024", "Низкий")
+
+    assert manager.refresh() is True
+    assert manager.tasks.get(1).title == "Свое название"
+    assert manager.tasks.get(4).title == "Чужая"
+    assert manager.tasks.get(5).title == "Своя"
+    assert manager.flush() is True
+    assert [task.title for task in TaskManager(filename=filename).tasks] == [
+        "Свое название", "Задача 2", "Задача 3", "Чужая", "Своя"]
@@ -0,0 +1,131 @@
+import json
+import socket
+import threading
+import pytest
+
+from client import RpcError, TaskClient
+from load_generator import run_load
+from server import INVALID_PARAMS, METHOD_NOT_FOUND, PARSE_ERROR, \
+    create_server
+from task_manager import TaskManager
+
+
+def start_server(manager, address):
+    """Запускает сервер в отдельном потоке."""
+    server = create_server(manager, address)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Фикстура для создания TaskManager с двумя задачами."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.add_task("Отчет", "Квартальный отчет", "Работа", "05.12.2024",
+                     "Высокий")
+    manager.add_task("Спорт", "Пробежка", "Личное", "06.12.2024", "Низкий")
+    return manager
+
+
+@pytest.fixture
+def address(manager):
+    """Фикстура с адресом запущенного TCP-сервера."""
+    server = start_server(manager, ('127.0.0.1', 0))
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def test_calls(address, manager):
+    """Тест: методы сервера изменяют задачи и возвращают результаты."""
+    with TaskClient(address, timeout=5) as client:
+        assert client.add_task("Новая", "Описание", "Учеба", "07.12.2024",
+                               "Средний") == 3
+        assert client.add_task("", "Описание", "Учеба", "07.12.2024",
+                               "Средний") is False
+        assert client.update_task(3, status="Выполнена") is True
+        assert client.delete_task(task_id=2) is True
+        found = client.search_tasks(category="Учеба")
+        assert client.next_tasks(1)[0]["title"] == "Отчет"
+
+    assert found == [manager.tasks.get(3).to_dict()]
+    assert found[0]["status"] == "Выполнена"
+    assert [task.id for task in manager.tasks] == [1, 3]
+
+
+def test_errors(address):
+    """Тест: ошибки вызова возвращаются кодами JSON-RPC."""
+    with TaskClient(address, timeout=5) as client:
+        with pytest.raises(RpcError) as error:
+            client.call("save_data")
+        assert error.value.code == METHOD_NOT_FOUND
+        with pytest.raises(RpcError) as error:
+            client.call("update_task", color="Красный")
+        assert error.value.code == INVALID_PARAMS
+        for count in (-1, "5"):
+            with pytest.raises(RpcError) as error:
+                client.next_tasks(count)
+            assert error.value.code == INVALID_PARAMS
+
+
+def test_batch_and_notifications(address, manager):
+    """Тест: пакет возвращает ответы на все запросы, кроме уведомлений."""
+    with socket.create_connection(address, timeout=5) as connection:
+        reader = connection.makefile('rb')
+        connection.sendall(json.dumps([
+            {"jsonrpc": "2.0", "method": "search_tasks",
+             "params": {"keyword": "отчет"}, "id": 1},
+            {"jsonrpc": "2.0", "method": "delete_task",
+             "params": {"task_id": 2}},
+            {"jsonrpc": "2.0", "method": "next_tasks", "params": [1],
+             "id": 2},
+        ]).encode('utf-8') + b'\n{not json}\n')
+        responses = json.loads(reader.readline())
+        error = json.loads(reader.readline())
+
+    assert [response["id"] for response in responses] == [1, 2]
+    assert responses[0]["result"][0]["title"] == "Отчет"
+    assert error["error"]["code"] == PARSE_ERROR
+    assert [task.id for task in manager.tasks] == [1]
+
+
+def test_pipeline_and_batch_client(address):
+    """Тест: конвейер и пакеты клиента возвращают результаты по порядку."""
+    calls = [("add_task", {"title": f"Задача {i}", "description": "Текст",
+                           "category": "Работа", "due_date": "05.12.2024",
+                           "priority": "Средний"}) for i in range(50)]
+    with TaskClient(address, timeout=5) as client:
+        assert client.pipeline(calls, depth=8) == list(range(3, 53))
+        results = client.batch([("search_tasks", {"task_id": 3}),
+                                ("missing", {}),
+                                ("next_tasks", {"count": 2})])
+
+    assert results[0][0]["title"] == "Задача 0"
+    assert isinstance(results[1], RpcError)
+    assert len(results[2]) == 2
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"),
+                    reason="Unix-сокеты не поддерживаются")
+def test_unix_socket(tmp_path, manager):
+    """Тест: сервер работает на Unix-сокете."""
+    path = str(tmp_path / "tasks.sock")
+    server = start_server(manager, path)
+    try:
+        with TaskClient(path, timeout=5) as client:
+            assert [task["id"] for task in client.search_tasks()] == [1, 2]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_load_generator(address, manager):
+    """Тест: нагрузочный тест выполняет все вызовы без ошибок."""
+    manager.deferred = True
+    result = run_load(address, connections=3, requests=100, depth=10,
+                      write_ratio=0.3)
+    batched = run_load(address, connections=2, requests=50, batch=10)
+
+    assert result["requests"] == 300 and result["errors"] == 0
+    assert batched["requests"] == 100 and batched["errors"] == 0
+    assert result["rps"] > 0
@@ -0,0 +1,117 @@
+import pytest
+import os
+from unittest.mock import patch
+
+from sharded_storage import ShardedStorage, load_shard, write_json
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager с шардированным хранилищем."""
+    directory = str(tmp_path / "tasks")
+    manager = TaskManager(storage=ShardedStorage(directory, shards=4,
+                                                 workers=1))
+    with manager.batch():
+        for i in range(12):
+            category = ["Работа", "Личное", "Учеба"][i % 3]
+            manager.add_task(f"Задача {i + 1}", "Описание", category,
+                             "05.12.2024", "Средний")
+    manager.save_data()
+    return manager
+
+
+def shard_mtimes(manager):
+    """Возвращает время изменения файлов шардов."""
+    storage = manager.storage
+    return {shard: os.stat(storage.shard_path(shard)).st_mtime_ns
+            for shard in range(storage.shards)}
+
+
+def reload(manager, workers=1):
+    """Открывает тот же каталог новым менеджером."""
+    return TaskManager(storage=ShardedStorage(manager.storage.directory,
+                                              workers=workers))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_round_trip(setup_task_manager, workers):
+    """Тест: задачи загружаются из шардов (в том числе в нескольких
+    процессах) в порядке ID."""
+    manager = setup_task_manager
+
+    reloaded = reload(manager, workers)
+
+    assert [task.to_dict() for task in reloaded.tasks] == \
+        [task.to_dict() for task in manager.tasks]
+    assert reloaded.next_id == 13
+    assert reloaded.storage.shards == 4
+
+
+def test_update_rewrites_only_dirty_shards(setup_task_manager):
+    """Тест: изменение задачи перезаписывает только ее шард, а смена
+    категории — старый и новый шарды."""
+    manager = setup_task_manager
+    storage = manager.storage
+    task = manager.tasks.get(1)
+    before = shard_mtimes(manager)
+
+    manager.update_task(1, status="Выполнена")
+    after = shard_mtimes(manager)
+    changed = {shard for shard in after if after[shard] != before[shard]}
+    assert changed <= {storage.shard_of(task)}
+
+    old_shard = storage.shard_of(task)
+    manager.update_task(1, category="Здоровье")
+    new_shard = storage.shard_of(task)
+    assert reload(manager).tasks.get(1).category == "Здоровье"
+    assert 1 in [row[0] for row in load_shard(storage.shard_path(new_shard))]
+    if old_shard != new_shard:
+        assert 1 not in [row[0] for row in
+                         load_shard(storage.shard_path(old_shard))]
+
+
+def test_delete_category(setup_task_manager):
+    """Тест: удаление категории сохраняется в шардах."""
+    manager = setup_task_manager
+
+    manager.delete_task(category="работа")
+
+    reloaded = reload(manager)
+    assert len(reloaded.tasks) == 8
+    assert reloaded.search_tasks(category="Работа") == []
+
+
+def test_missing_directory(tmp_path):
+    """Тест: отсутствующий каталог дает пустой список задач."""
+    manager = TaskManager(storage=ShardedStorage(str(tmp_path / "none")))
+
+    assert len(manager.tasks) == 0
+    assert manager.next_id == 1
+
+
+def test_failed_write_keeps_previous_state(setup_task_manager):
+    """Тест: сбой перед заменой manifest.json оставляет прежние шарды."""
+    manager = setup_task_manager
+    storage = manager.storage
+    manifest = os.path.join(storage.directory, storage.MANIFEST)
+
+    def fail_on_manifest(filename, data):
+        if filename == manifest:
+            raise OSError("Сбой записи")
+        write_json(filename, data)
+
+    with patch("sharded_storage.write_json", side_effect=fail_on_manifest):
+        assert manager.update_task(1, category="Здоровье") is False
+
+    reloaded = reload(manager)
+    assert reloaded.tasks.get(1).category == "Работа"
+    assert len(reloaded.tasks) == 12
+
+    manager.update_task(2, status="Выполнена")
+    reloaded = reload(manager)
+    assert reloaded.tasks.get(1).category == "Здоровье"
+    assert reloaded.tasks.get(2).status == "Выполнена"
+    assert sorted(os.listdir(storage.directory)) == sorted(
+        [storage.MANIFEST] + [os.path.basename(storage.shard_path(shard))
+                              for shard in range(storage.shards)])
@@ -0,0 +1,184 @@
+import json
+import multiprocessing
+import pytest
+from unittest.mock import patch
+
+from task_manager import BatchError, TaskManager
+
+
+def add_tasks(filename, worker, count):
+    """Добавляет задачи из отдельного процесса."""
+    manager = TaskManager(filename=filename, shared=True,
+                          compact_threshold=7)
+    for i in range(count):
+        manager.add_task(f"Процесс {worker} задача {i}", "Описание",
+                         "Работа", "05.12.2024", "Средний")
+    manager.close()
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """Фикстура с путем к общему файлу, в котором уже есть две задачи."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename, shared=True)
+    manager.add_task("Задача 1", "Описание", "Работа", "05.12.2024",
+                     "Средний")
+    manager.add_task("Задача 2", "Описание", "Личное", "06.12.2024",
+                     "Высокий")
+    return filename
+
+
+def test_concurrent_adds_get_unique_ids(filename):
+    """Тест: задачи, добавленные по устаревшим данным, получают новые ID."""
+    first = TaskManager(filename=filename, shared=True)
+    second = TaskManager(filename=filename, shared=True)
+
+    first.add_task("Первая", "Описание", "Работа", "07.12.2024", "Низкий")
+    second.add_task("Вторая", "Описание", "Учеба", "08.12.2024", "Низкий")
+
+    assert second.tasks.get(4).title == "Вторая"
+    assert second.tasks.get(3).title == "Первая"
+    assert second.next_id == 5
+
+    reloaded = TaskManager(filename=filename, shared=True)
+    assert [(task.id, task.title) for task in reloaded.tasks] == [
+        (1, "Задача 1"), (2, "Задача 2"), (3, "Первая"), (4, "Вторая")]
+
+
+def test_updates_are_merged(filename):
+    """Тест: изменения разных полей из двух процессов не теряются."""
+    first = TaskManager(filename=filename, shared=True)
+    second = TaskManager(filename=filename, shared=True)
+
+    first.update_task(1, title="Новое название")
+    first.delete_task(task_id=2)
+    second.update_task(1, status="Выполнена")
+    second.update_task(2, status="Выполнена")
+
+    reloaded = TaskManager(filename=filename, shared=True)
+    assert [task.id for task in reloaded.tasks] == [1]
+    assert reloaded.tasks[0].title == "Новое название"
+    assert reloaded.tasks[0].status == "Выполнена"
+    assert second.search_tasks(category="Работа")[0].title == \
+        "Новое название"
+
+
+def test_rewritten_snapshot_is_reloaded(filename):
+    """Тест: после перезаписи снимка другим процессом данные загружаются
+    заново, а версия снимка увеличивается.
+
+    """
+    first = TaskManager(filename=filename, shared=True)
+    second = TaskManager(filename=filename, shared=True)
+
+    first.delete_task(task_id=1)
+    assert first.save_data() is True
+    assert first.storage.read_version() == first.storage.version == 1
+    second.add_task("Новая", "Описание", "Учеба", "07.12.2024", "Низкий")
+
+    with open(filename, encoding='utf-8') as file:
+        assert file.read().startswith('{\n    "version": 1,')
+    assert [task.id for task in second.tasks] == [2, 3]
+    reloaded = TaskManager(filename=filename, shared=True)
+    assert [task.id for task in reloaded.tasks] == [2, 3]
+
+
+def test_deferred_changes_are_merged(filename):
+    """Тест: отложенные изменения объединяются с чужими при flush."""
+    first = TaskManager(filename=filename, shared=True)
+    second = TaskManager(filename=filename, shared=True)
+    second.deferred = True
+
+    second.add_task("Отложенная", "Описание", "Учеба", "07.12.2024",
+                    "Низкий")
+    second.update_task(3, status="Выполнена")
+    first.add_task("Сразу", "Описание", "Работа", "08.12.2024", "Низкий")
+
+    assert second.flush() is True
+    reloaded = TaskManager(filename=filename, shared=True)
+    assert [(task.id, task.title, task.status) for task in reloaded.tasks][
+        2:] == [(3, "Сразу", "Не выполнена"), (4, "Отложенная", "Выполнена")]
+
+
+def test_processes_do_not_lose_updates(filename):
+    """Тест: задачи, одновременно добавленные несколькими процессами,
+    сохраняются все и с разными ID.
+
+    """
+    processes = [multiprocessing.Process(target=add_tasks,
+                                         args=(filename, worker, 20))
+                 for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert all(process.exitcode == 0 for process in processes)
+
+    reloaded = TaskManager(filename=filename, shared=True)
+    ids = [task.id for task in reloaded.tasks]
+    assert len(ids) == 82
+    assert sorted(ids) == list(range(1, 83))
+    assert reloaded.next_id == 83
+
+
+def test_default_format_is_unchanged(tmp_path):
+    """Тест: без режима совместного доступа версия в файл не пишется."""
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename)
+    manager.add_task("Задача", "Описание", "Работа", "05.12.2024", "Средний")
+
+    with open(filename, encoding='utf-8') as file:
+        assert "version" not in json.load(file)
+
+
+def test_other_entry_points_see_journal(filename, tmp_path, monkeypatch):
+    """Тест: выгрузка и импорт видят задачи из журнала и не берут их ID."""
+    import bulk_import
+    import export
+
+    source = tmp_path / "import.jsonl"
+    source.write_text(json.dumps({
+        "title": "Импорт", "description": "Описание", "category": "Учеба",
+        "due_date": "09.12.2024", "priority": "Низкий"},
+        ensure_ascii=False) + "\n", encoding="utf-8")
+    output = tmp_path / "export.jsonl"
+
+    monkeypatch.setattr("sys.argv", ["bulk_import.py", str(source),
+                                     "--tasks-file", filename])
+    with pytest.raises(SystemExit):
+        bulk_import.main()
+    monkeypatch.setattr("sys.argv", ["export.py", "--tasks-file", filename,
+                                     "--output", str(output)])
+    with pytest.raises(SystemExit) as exit_info:
+        export.main()
+
+    exported = [json.loads(line) for line in
+                output.read_text(encoding="utf-8").splitlines()]
+    assert exit_info.value.code == 0
+    assert [(task["id"], task["title"]) for task in exported] == [
+        (1, "Задача 1"), (2, "Задача 2"), (3, "Импорт")]
+    assert len(TaskManager(filename=filename, shared=True).tasks) == 3
+
+
+def test_failed_batch_after_merge_rolls_back(tmp_path):
+    """Тест: откат пакета, который не удалось сохранить после объединения
+    с чужими изменениями, сохраняет чужие задачи и не занимает их ID."""
+    filename = str(tmp_path / "tasks.json")
+    first = TaskManager(filename=filename, shared=True)
+    second = TaskManager(filename=filename, shared=True)
+    first.add_task("Чужая", "Описание", "Работа", "05.12.2024", "Средний")
+
+    with patch.object(second.storage.journal, 'append_many',
+                      return_value=False):
+        with pytest.raises(BatchError):
+            with second.batch():
+                second.add_task("Своя", "Описание", "Учеба", "06.12.2024",
+                                "Низкий")
+
+    assert [(task.id, task.title) for task in second.tasks] == \
+        [(1, "Чужая")]
+    assert second.next_id == 2
+    second.add_task("Новая", "Описание", "Учеба", "07.12.2024", "Низкий")
+    assert [(task.id, task.title) for task in
+            TaskManager(filename=filename, shared=True).tasks] == \
+        [(1, "Чужая"), (2, "Новая")]
@@ -0,0 +1,113 @@
+import pytest
+from unittest.mock import patch
+
+from sqlite_storage import SqliteStorage
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def setup_task_manager(tmp_path):
+    """Фикстура для создания TaskManager с хранилищем SQLite."""
+    filename = str(tmp_path / "tasks.db")
+    manager = TaskManager(storage=SqliteStorage(filename))
+    manager.add_task("Квартальный отчёт", "Подготовить отчет", "Работа",
+                     "05.12.2024", "Высокий")
+    manager.add_task("Пробежка", "Утренняя пробежка", "Личное",
+                     "06.12.2024", "Низкий")
+    manager.add_task("Письмо", "Ответить клиенту по отчету", "Работа",
+                     "07.12.2024", "Средний")
+    yield manager
+    manager.storage.close()
+
+
+def reload(manager):
+    """Открывает ту же базу данных новым менеджером."""
+    return TaskManager(storage=SqliteStorage(manager.filename))
+
+
+def test_empty_database(tmp_path):
+    """Тест: новая база данных дает пустой список задач."""
+    manager = TaskManager(storage=SqliteStorage(str(tmp_path / "tasks.db")))
+
+    assert len(manager.tasks) == 0
+    assert manager.next_id == 1
+
+
+def test_mutations_are_persisted(setup_task_manager):
+    """Тест: добавление, изменение и удаление сохраняются построчно."""
+    manager = setup_task_manager
+
+    manager.update_task(2, status="Выполнена")
+    manager.delete_task(category="работа")
+
+    reloaded = reload(manager)
+    assert [task.to_dict() for task in reloaded.tasks] == \
+        [task.to_dict() for task in manager.tasks]
+    assert reloaded.tasks[0].status == "Выполнена"
+    assert reloaded.next_id == 4
+
+
+def test_batch_and_save_data(setup_task_manager):
+    """Тест: пакет изменений и полная перезапись базы данных."""
+    manager = setup_task_manager
+
+    with manager.batch():
+        manager.add_task("Задача 4", "Описание", "Учеба", "08.12.2024",
+                         "Низкий")
+        manager.delete_task(task_id=4)
+        manager.update_task(1, title="Годовой отчёт")
+    assert [task.title for task in reload(manager).tasks] == [
+        "Годовой отчёт", "Пробежка", "Письмо"]
+
+    manager.tasks = manager.tasks[:1]
+    assert manager.save_data() is True
+    assert [task.id for task in reload(manager).tasks] == [1]
+
+
+SEARCH_PARAMS = [
+    {"task_id": 2},
+    {"category": "РАБ"},
+    {"status": "не выполнена"},
+    {"priority": "высокий"},
+    {"keyword": "ОТЧЕТ"},
+    {"keyword": "отчет клиенту", "category": "работа"},
+    {"keyword": "нет такого"},
+    {"due_after": "06.12.2024"},
+    {"due_before": "06.12.2024", "category": "работа"},
+    {"overdue": True, "due_after": "06.12.2024"},
+    {"due_before": "31.02.2024"},
+    {},
+]
+
+
+@pytest.mark.parametrize("search_params", SEARCH_PARAMS)
+def test_search_pushdown_matches_manager(setup_task_manager, search_params):
+    """Тест: поиск в SQL дает те же задачи, что и search_tasks."""
+    manager = setup_task_manager
+
+    found = manager.storage.search(**search_params)
+
+    assert [task.to_dict() for task in found] == [
+        task.to_dict() for task in manager.search_tasks(**search_params)]
+
+
+def test_lazy_manager_searches_in_database(setup_task_manager):
+    """Тест: при lazy_indexes поиск выполняется в SQL без загрузки задач,
+    а изменение загружает их.
+
+    """
+    storage = SqliteStorage(setup_task_manager.filename)
+    manager = TaskManager(storage=storage, lazy_indexes=True)
+    with patch.object(storage, 'load', wraps=storage.load) as load:
+        for search_params in SEARCH_PARAMS:
+            assert [task.to_dict() for task in
+                    manager.search_tasks(**search_params)] == [
+                task.to_dict() for task in
+                setup_task_manager.search_tasks(**search_params)]
+        load.assert_not_called()
+
+        assert manager.delete_task(task_id=2) is True
+        load.assert_called_once()
+
+    assert [task.id for task in reload(manager).tasks] == [1, 3]
+    storage.close()
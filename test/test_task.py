@@ -0,0 +1,72 @@
+import pytest
+import json
+import tracemalloc
+
+from task import Task, parse_due_date
+
+
+def make_records(count):
+    """Создает записи задач так, как они приходят из JSON-файла: у каждой
+    записи собственные экземпляры строк."""
+    categories = ["Работа", "Личное", "Учеба"]
+    priorities = ["Низкий", "Средний", "Высокий"]
+    records = [{'id': i, 'title': f"Задача {i}",
+                'description': f"Описание задачи {i}",
+                'category': categories[i % 3],
+                'due_date': f"{i % 28 + 1:02d}.12.2024",
+                'priority': priorities[i % 3], 'status': "Не выполнена"}
+               for i in range(count)]
+    return json.loads(json.dumps(records, ensure_ascii=False))
+
+
+def test_task_has_no_instance_dict():
+    """Тест: у задачи нет __dict__, повторяющиеся значения разделяются."""
+    first, second = [Task.from_dict(record) for record in make_records(2)]
+
+    assert not hasattr(first, '__dict__')
+    assert first.status is second.status
+    with pytest.raises(AttributeError):
+        first.unknown = 1
+
+
+def test_task_round_trip():
+    """Тест: to_dict/from_dict и присваивание атрибутов не изменились."""
+    record = make_records(1)[0]
+    task = Task.from_dict(record)
+
+    assert task.to_dict() == record
+    task.due_date = "31.12.2024"
+    task.priority = "Высокий"
+    assert task.due_date == "31.12.2024"
+    assert task.due_ordinal == parse_due_date("31.12.2024")
+    assert task.to_dict()['priority'] == "Высокий"
+
+
+@pytest.mark.parametrize("due_date, is_parsed", [
+    ("05.12.2024", True),
+    ("29.02.2024", True),
+    ("31.02.2024", False),  # Несуществующая дата
+    ("2024/12/05", False),
+    (None, False),
+])
+def test_parse_due_date(due_date, is_parsed):
+    """Тест для разбора срока выполнения."""
+    assert (parse_due_date(due_date) is not None) == is_parsed
+
+
+def test_task_memory_is_compact():
+    """Тест: задачи занимают заметно меньше памяти, чем исходные словари
+    с теми же данными (примерно столько же занимал Task с __dict__)."""
+    tracemalloc.start()
+    dicts = [dict(record) for record in make_records(5000)]
+    dict_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del dicts
+
+    tracemalloc.start()
+    tasks = [Task.from_dict(record) for record in make_records(5000)]
+    task_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(tasks) == 5000
+    assert task_memory < dict_memory * 0.7
@@ -0,0 +1,68 @@
+import pytest
+
+from task import Task
+from task_list import TaskList
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def sample_tasks():
+    """Фикстура со списком задач."""
+    return [
+        Task(1, "Задача 1", "Описание 1", "Работа", "05.12.2024", "Средний"),
+        Task(2, "Задача 2", "Описание 2", "Личное", "06.12.2024", "Высокий"),
+        Task(3, "Задача 3", "Описание 3", "Учеба", "07.12.2024", "Низкий"),
+    ]
+
+
+def test_task_list_behaves_like_list(sample_tasks):
+    """Тест: TaskList сохраняет порядок и поддерживает операции списка."""
+    tasks = TaskList(sample_tasks[:2])
+    tasks.append(sample_tasks[2])
+
+    assert len(tasks) == 3
+    assert tasks == sample_tasks
+    assert tasks[0] is sample_tasks[0]
+    assert tasks[-1] is sample_tasks[2]
+    assert tasks[1:] == sample_tasks[1:]
+    assert sample_tasks[1] in tasks
+
+    del tasks[0]
+    tasks.insert(0, sample_tasks[0])
+    assert [task.id for task in tasks] == [1, 2, 3]
+
+
+def test_task_list_id_lookup(sample_tasks):
+    """Тест: поиск и удаление по ID."""
+    tasks = TaskList(sample_tasks)
+
+    assert tasks.get(2) is sample_tasks[1]
+    assert tasks.get(999) is None
+    assert tasks.remove_id(2) is sample_tasks[1]
+    assert tasks.remove_id(2) is None
+    assert [task.id for task in tasks] == [1, 3]
+
+
+def test_manager_index_follows_assignment(tmp_path, sample_tasks):
+    """Тест: индекс менеджера следует за присваиванием и append."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.tasks = sample_tasks[:2]
+    manager.tasks.append(sample_tasks[2])
+
+    assert isinstance(manager.tasks, TaskList)
+    assert manager.search_tasks(task_id=3) == [sample_tasks[2]]
+    assert manager.update_task(3, status="Выполнена") is True
+    assert manager.delete_task(task_id=1) is True
+    assert [task.id for task in manager.tasks] == [2, 3]
+
+
+def test_extend_updates_indexes(tmp_path, sample_tasks):
+    """Тест: extend добавляет задачи во все индексы менеджера."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+    manager.tasks = sample_tasks[2:]
+    manager.tasks.extend(sample_tasks[:2])
+
+    assert [task.id for task in manager.tasks] == [3, 1, 2]
+    assert manager.search_tasks(category="личное") == [sample_tasks[1]]
+    assert manager.search_tasks(due_before="06.12.2024") == sample_tasks[:2]
+    assert [task.id for task in manager.next_tasks()] == [2, 1, 3]
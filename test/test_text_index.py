@@ -0,0 +1,72 @@
+import pytest
+
+from indexes import TextIndex
+from task import Task
+from task_manager import TaskManager
+
+
+@pytest.fixture(params=[False, True], ids=["scan", "index"])
+def setup_task_manager(tmp_path, request):
+    """Фикстура для создания TaskManager без полнотекстового индекса и с
+    ним: результаты поиска должны совпадать."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"),
+                          text_index=request.param)
+    manager.tasks = [
+        Task(1, "Квартальный ОТЧЁТ", "Подготовить отчет для руководства",
+             "Работа", "05.12.2024", "Высокий"),
+        Task(2, "Пробежка", "Утренняя пробежка в парке", "Личное",
+             "06.12.2024", "Низкий"),
+        Task(3, "Письмо клиенту", "Ответить на вопросы по отчету", "Работа",
+             "07.12.2024", "Средний"),
+    ]
+    manager.next_id = 4
+    return manager
+
+
+@pytest.mark.parametrize("keyword, expected_ids", [
+    ("отчет", [1, 3]),  # Свертка регистра и 'ё'
+    ("ОТЧЁТ", [1, 3]),
+    ("отч", [1, 3]),  # Часть слова
+    ("отчет клиенту", [3]),  # Все слова запроса
+    ("утренняя парк", [2]),
+    ("отчет парк", []),
+    ("в парке", [2]),
+    ("не существует", []),
+])
+def test_keyword_search(setup_task_manager, keyword, expected_ids):
+    """Тест: поиск по ключевым словам с индексом и без него."""
+    manager = setup_task_manager
+
+    result = manager.search_tasks(keyword=keyword)
+
+    assert [task.id for task in result] == expected_ids
+
+
+def test_keyword_search_after_mutations(setup_task_manager):
+    """Тест: индекс обновляется при изменении и удалении задач."""
+    manager = setup_task_manager
+
+    manager.update_task(2, description="Вечерняя пробежка")
+    manager.delete_task(task_id=1)
+    manager.add_task("Отчет по спорту", "Итоги месяца", "Личное",
+                     "08.12.2024", "Низкий")
+
+    assert manager.search_tasks(keyword="утренняя") == []
+    assert [task.id for task in manager.search_tasks(keyword="вечерняя")] \
+        == [2]
+    assert [task.id for task in manager.search_tasks(keyword="отчет")] \
+        == [3, 4]
+
+
+def test_text_index_candidates():
+    """Тест: кандидаты выбираются по словарю слов."""
+    index = TextIndex()
+    index.add(Task(1, "Купить хлеб", "В магазине", "Личное", "05.12.2024",
+                   "Низкий"))
+    index.add(Task(2, "Купить молоко", "Тоже", "Личное", "05.12.2024",
+                   "Низкий"))
+
+    assert list(index.candidates("купить")) == [1, 2]
+    assert list(index.candidates("купить хлеб")) == [1]
+    assert index.candidates("!!!") is None
+    assert index.candidates("сыр") == {}
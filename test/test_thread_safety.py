@@ -0,0 +1,119 @@
+import random
+import threading
+import pytest
+
+from rwlock import ReadWriteLock
+from task_manager import TaskManager
+
+THREADS = 4
+ITERATIONS = 200
+
+
+def run_threads(*targets):
+    """Запускает функции в потоках, дожидается их и возвращает ошибки."""
+    errors = []
+
+    def guarded(target):
+        try:
+            target()
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=guarded, args=(target,))
+               for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_readers_share_lock():
+    """Тест: несколько потоков одновременно держат блокировку чтения."""
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def reader():
+        with lock.read():
+            barrier.wait()
+
+    assert run_threads(reader, reader, reader) == []
+
+
+def test_writer_excludes_readers():
+    """Тест: во время записи читатели ждут, а повторный захват не
+    блокирует поток-писатель.
+
+    """
+    lock = ReadWriteLock()
+    events = []
+
+    def reader():
+        with lock.read():
+            events.append("чтение")
+
+    with lock.write():
+        thread = threading.Thread(target=reader)
+        thread.start()
+        thread.join(0.1)
+        with lock.write(), lock.read():
+            events.append("запись")
+    thread.join()
+
+    assert events == ["запись", "чтение"]
+
+
+def test_upgrade_is_rejected():
+    """Тест: захват записи под блокировкой чтения вызывает ошибку."""
+    lock = ReadWriteLock()
+    with lock.read():
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+    with lock.write():
+        pass
+
+
+def test_concurrent_operations(tmp_path):
+    """Тест: при одновременных изменениях и поиске из многих потоков
+    результаты поиска согласованы, а изменения не теряются.
+
+    """
+    filename = str(tmp_path / "tasks.json")
+    manager = TaskManager(filename=filename, autosave=0.01)
+
+    def writer(seed):
+        generator = random.Random(seed)
+        for i in range(ITERATIONS):
+            with manager.batch():
+                manager.add_task(f"Работа {seed}-{i}", "Описание", "Работа",
+                                 "05.12.2024", "Средний")
+                manager.add_task(f"Личное {seed}-{i}", "Описание", "Личное",
+                                 "06.12.2024", "Высокий")
+            task_id = generator.randint(1, manager.next_id - 1)
+            manager.update_task(task_id, status=generator.choice(
+                ["Выполнена", "Не выполнена"]))
+
+    def reader():
+        for _ in range(ITERATIONS):
+            with manager.lock.read():
+                work = manager.search_tasks(category="Работа")
+                personal = manager.search_tasks(category="Личное")
+                assert len(work) == len(personal)
+                for task in manager.search_tasks(status="Выполнена"):
+                    assert task.status == "Выполнена"
+            assert len(manager.next_tasks(5)) <= 5
+            groups = manager.group_tasks_by_category()
+            assert len(groups.get("Работа", ())) == len(
+                groups.get("Личное", ()))
+
+    errors = run_threads(*[lambda seed=seed: writer(seed)
+                           for seed in range(THREADS)],
+                         *[reader for _ in range(THREADS)])
+
+    assert errors == []
+    assert len(manager.tasks) == 2 * THREADS * ITERATIONS
+    assert manager.next_id == 2 * THREADS * ITERATIONS + 1
+    assert manager.close() is True
+    reloaded = TaskManager(filename=filename)
+    assert [task.to_dict() for task in reloaded.tasks] == [
+        task.to_dict() for task in manager.tasks]
@@ -19,6 +19,9 @@ def test_validate_string(category, is_valid):
 
 @pytest.mark.parametrize("date, is_valid", [
     ("05.12.2024", True),  # Валидная дата
+    ("29.02.2024", True),  # Високосный год
+    ("31.02.2024", False),  # Несуществующая дата
+    ("29.02.2023", False),  # Не високосный год
     ("2024.12.05", False),  # Неверный формат
     ("12-05-2024", False),  # Неверный формат
     ("", False),  # Пустая строка
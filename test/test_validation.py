@@ -0,0 +1,81 @@
+import pytest
+
+from task_manager import TaskManager
+from validation import TASK_VALIDATOR, ValidationError, Validator
+
+VALID_RECORD = {
+    "title": "Задача", "description": "Описание", "category": "Работа",
+    "due_date": "05.12.2024", "priority": "Средний",
+}
+
+
+@pytest.mark.parametrize("changes, expected", [
+    ({}, []),
+    ({"status": "Выполнена"}, []),
+    ({"title": ""}, [("title", "empty")]),
+    ({"description": None}, [("description", "empty")]),
+    ({"category": 5}, [("category", "empty")]),
+    ({"due_date": "31.04.2024"}, [("due_date", "calendar")]),
+    ({"due_date": "5.12.2024"}, [("due_date", "format")]),
+    ({"due_date": ["05.12.2024"]}, [("due_date", "format")]),
+    ({"priority": "Срочный"}, [("priority", "choice")]),
+    ({"status": "Готово", "priority": None},
+     [("priority", "choice"), ("status", "choice")]),
+])
+def test_validate_record(changes, expected):
+    """Тест: структурированные ошибки для каждого неверного поля."""
+    errors = TASK_VALIDATOR.validate({**VALID_RECORD, **changes})
+
+    assert [(error.field, error.code) for error in errors] == expected
+    assert all(isinstance(error, ValidationError) for error in errors)
+
+
+def test_validate_partial():
+    """Тест: при частичной проверке пропущенные поля не проверяются."""
+    assert TASK_VALIDATOR.validate({"status": "Выполнена"},
+                                   partial=True) == []
+    errors = TASK_VALIDATOR.validate({"due_date": "30.02.2024"},
+                                     partial=True)
+    assert [error.code for error in errors] == ["calendar"]
+
+
+def test_validate_many():
+    """Тест: пакетная проверка возвращает только записи с ошибками."""
+    records = [VALID_RECORD, {**VALID_RECORD, "priority": "?"},
+               VALID_RECORD, {}]
+
+    result = list(TASK_VALIDATOR.validate_many(records))
+
+    assert [number for number, _ in result] == [1, 3]
+    assert len(result[1][1]) == 5
+
+
+def test_custom_schema():
+    """Тест: валидатор компилируется из произвольной схемы."""
+    validator = Validator({"name": ("Имя", "string", None),
+                           "level": ("Уровень", "choice", ("A", "B"))},
+                          optional=("level",))
+
+    assert validator.validate({"name": "x"}) == []
+    error, = validator.validate({"name": "x", "level": "C"})
+    assert error.message == "Уровень должен быть 'A' или 'B'."
+
+
+def test_validation_is_silent(capsys):
+    """Тест: проверка не выводит ничего в консоль."""
+    TASK_VALIDATOR.validate(VALID_RECORD)
+    TASK_VALIDATOR.validate({})
+
+    assert capsys.readouterr().out == ""
+
+
+def test_manager_rejects_impossible_date(tmp_path):
+    """Тест: несуществующая дата отклоняется при добавлении и изменении."""
+    manager = TaskManager(filename=str(tmp_path / "tasks.json"))
+
+    assert manager.add_task("Задача", "Описание", "Работа", "31.02.2024",
+                            "Средний") is False
+    assert manager.add_task("Задача", "Описание", "Работа", "29.02.2024",
+                            "Средний") is True
+    assert manager.update_task(1, due_date="30.02.2024") is False
+    assert manager.tasks[0].due_date == "29.02.2024"
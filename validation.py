@@ -0,0 +1,151 @@
+import re
+from task import parse_due_date
+from typing import (Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Tuple)
+
+DATE_RE = re.compile(r'\d{2}\.\d{2}\.\d{4}')
+
+# Схема задачи: поле -> (название для сообщений, правило, параметр правила).
+TASK_SCHEMA = {
+    'title': ('Название', 'string', None),
+    'description': ('Описание', 'string', None),
+    'category': ('Категория', 'string', None),
+    'due_date': ('Срок', 'date', None),
+    'priority': ('Приоритет', 'choice', ('Низкий', 'Средний', 'Высокий')),
+    'status': ('Статус', 'choice', ('Выполнена', 'Не выполнена')),
+}
+OPTIONAL_FIELDS = ('status',)
+
+
+class ValidationError(NamedTuple):
+    """Ошибка проверки одного поля."""
+    field: str
+    code: str
+    message: str
+
+
+def string_rule(field: str, name: str, _) -> Callable:
+    """Строит проверку непустой строки.
+    :param field: Имя поля.
+    :param name: Название поля для сообщения.
+    :return: Функция, возвращающая ошибку или None.
+
+    """
+    error = ValidationError(field, 'empty',
+                            f"Графа '{name}' не может быть пустой и должна "
+                            f"быть строкой.")
+
+    def check(value) -> Optional[ValidationError]:
+        return None if value and isinstance(value, str) else error
+    return check
+
+
+def date_rule(field: str, name: str, _) -> Callable:
+    """Строит проверку даты формата dd.mm.yyyy, существующей в календаре.
+    :param field: Имя поля.
+    :param name: Название поля для сообщения.
+    :return: Функция, возвращающая ошибку или None.
+
+    """
+    format_error = ValidationError(
+        field, 'format', "Неверный формат даты. Ожидается dd.mm.yyyy.")
+    calendar_error = ValidationError(
+        field, 'calendar', "Такой даты не существует.")
+    fullmatch = DATE_RE.fullmatch
+
+    def check(value) -> Optional[ValidationError]:
+        if not isinstance(value, str) or not fullmatch(value):
+            return format_error
+        if parse_due_date(value) is None:
+            return calendar_error
+        return None
+    return check
+
+
+def choice_rule(field: str, name: str, choices: Tuple[str, ...]) -> Callable:
+    """Строит проверку принадлежности значения набору допустимых.
+    :param field: Имя поля.
+    :param name: Название поля для сообщения.
+    :param choices: Допустимые значения.
+    :return: Функция, возвращающая ошибку или None.
+
+    """
+    allowed = frozenset(choices)
+    quoted = [f"'{choice}'" for choice in choices]
+    error = ValidationError(
+        field, 'choice',
+        f"{name} должен быть {', '.join(quoted[:-1])} или {quoted[-1]}.")
+
+    def check(value) -> Optional[ValidationError]:
+        return None if isinstance(value, str) and value in allowed else error
+    return check
+
+
+RULES = {'string': string_rule, 'date': date_rule, 'choice': choice_rule}
+
+
+class Validator:
+    """Проверка записей по схеме. Схема один раз компилируется в список
+    функций-проверок с заранее подготовленными сообщениями, поэтому сама
+    проверка не выводит ничего в консоль и не строит строк.
+
+    """
+    def __init__(self, schema: Dict[str, tuple] = None,
+                 optional: Iterable[str] = OPTIONAL_FIELDS):
+        """Компилирует схему.
+        :param schema: Словарь поле -> (название, правило, параметр).
+        :param optional: Поля, которые можно не указывать.
+
+        """
+        schema = TASK_SCHEMA if schema is None else schema
+        self.optional = frozenset(optional)
+        self.checks: List[Tuple[str, Callable]] = [
+            (field, RULES[rule](field, name, argument))
+            for field, (name, rule, argument) in schema.items()]
+        self.fields = {field: check for field, check in self.checks}
+
+    def check(self, field: str, value) -> Optional[ValidationError]:
+        """Проверяет значение одного поля.
+        :param field: Имя поля.
+        :param value: Значение.
+        :return: Ошибка или None, если значение корректно.
+
+        """
+        return self.fields[field](value)
+
+    def validate(self, record: Dict, partial: bool = False
+                 ) -> List[ValidationError]:
+        """Проверяет запись.
+        :param record: Словарь значений полей.
+        :param partial: Если True, проверяются только поля со значением, как
+            при обновлении задачи.
+        :return: Список ошибок; пустой, если запись корректна.
+
+        """
+        errors = []
+        for field, check in self.checks:
+            value = record.get(field)
+            if value is None and (partial or field in self.optional):
+                continue
+            error = check(value)
+            if error is not None:
+                errors.append(error)
+        return errors
+
+    def validate_many(self, records: Iterable[Dict], partial: bool = False
+                      ) -> Iterator[Tuple[int, List[ValidationError]]]:
+        """Проверяет записи за один проход.
+        :param records: Записи для проверки.
+        :param partial: Если True, проверяются только поля со значением.
+        :return: Итератор по парам из номера записи и списка ошибок для
+            записей с ошибками.
+
+        """
+        validate = self.validate
+        for number, record in enumerate(records):
+            errors = validate(record, partial)
+            if errors:
+                yield number, errors
+
+
+TASK_VALIDATOR = Validator()